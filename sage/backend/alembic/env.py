@@ -1,13 +1,15 @@
 """Alembic environment configuration."""
 
 import asyncio
+import os
 from logging.config import fileConfig
 
-from sqlalchemy import pool
+from sqlalchemy import inspect, pool, text
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from alembic import context
+from alembic.script import ScriptDirectory
 
 from sage.config import get_settings
 from sage.services.database import Base
@@ -26,6 +28,13 @@ if config.config_file_name is not None:
 
 target_metadata = Base.metadata
 
+# Column storage set by migrations, replayed after a squashed init's
+# create_all so it builds the same schema as 001..head
+SQUASHED_INIT_STORAGE = [
+    # 014: keep body_html out of line and uncompressed
+    "ALTER TABLE email_cache ALTER COLUMN body_html SET STORAGE EXTERNAL",
+]
+
 
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode."""
@@ -41,18 +50,59 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
+def _is_fresh_database(connection: Connection) -> bool:
+    """True if no revision has ever been applied to this database."""
+    if not inspect(connection).has_table("alembic_version"):
+        return True
+    return connection.execute(text("SELECT count(*) FROM alembic_version")).scalar() == 0
+
+
+def _use_squashed_init(connection: Connection) -> bool:
+    """
+    Build a fresh database from the models instead of replaying 001..head.
+
+    Opt-in with SAGE_SQUASHED_INIT=1 (CI, dev sandboxes, review apps) and
+    only for `alembic upgrade head` on a database that has never been
+    migrated; existing databases always take the normal chain.
+    """
+    heads = ScriptDirectory.from_config(config).get_heads()
+    return (
+        os.getenv("SAGE_SQUASHED_INIT") == "1"
+        and context.get_revision_argument() in ("head", "heads", *heads)
+        and _is_fresh_database(connection)
+    )
+
+
 def do_run_migrations(connection: Connection) -> None:
     """Run migrations with a database connection."""
     context.configure(connection=connection, target_metadata=target_metadata)
 
+    if _use_squashed_init(connection):
+        # One CREATE per table/index at its final shape, then record head
+        # so later revisions apply normally. The models declare the server
+        # defaults and fillfactors the migrations set; column storage can't
+        # be declared, so it is applied after the tables exist.
+        with context.begin_transaction():
+            target_metadata.create_all(connection)
+            for statement in SQUASHED_INIT_STORAGE:
+                connection.execute(text(statement))
+            script = ScriptDirectory.from_config(config)
+            context.get_context().stamp(script, "heads")
+        return
+
     with context.begin_transaction():
         context.run_migrations()
 
 
 async def run_async_migrations() -> None:
     """Run migrations in async mode."""
+    section = config.get_section(config.config_ini_section, {})
+    # engine_from_config doesn't coerce pool_pre_ping from its ini string
+    section["sqlalchemy.pool_pre_ping"] = str(
+        section.get("sqlalchemy.pool_pre_ping", "false")
+    ).lower() in ("true", "1", "yes")
     connectable = async_engine_from_config(
-        config.get_section(config.config_ini_section, {}),
+        section,
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
     )
@@ -1,10 +1,19 @@
 """Initial schema
 
+Seeding a fresh database (first Gmail/Fireflies sync) should run with
+SAGE_DEFER_INDEXES=1 and load through
+sage.services.bulk_load.initial_import_session(..., truncate=True) plus
+copy_insert(..., freeze=True): TRUNCATE + COPY FREEZE in one transaction
+with synchronous_commit off, then upgrade to head so 007 builds the
+secondary indexes. The TRUNCATE has no CASCADE, so list every table that
+references a seeded one (e.g. followups alongside email_cache).
+
 Revision ID: 001
 Revises:
 Create Date: 2024-01-15
 
 """
+import os
 from typing import Sequence, Union
 
 from alembic import op
@@ -18,11 +27,16 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+def _defer_indexes() -> bool:
+    """Secondary indexes are built later by 007 when bulk-loading a fresh database."""
+    return os.getenv('SAGE_DEFER_INDEXES') == '1'
+
+
 def upgrade() -> None:
     # Create users table
     op.create_table(
         'users',
-        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('id', sa.BigInteger(), nullable=False),
         sa.Column('email', sa.String(length=255), nullable=False),
         sa.Column('name', sa.String(length=255), nullable=False),
         sa.Column('picture', sa.String(length=500), nullable=True),
@@ -41,7 +55,7 @@ def upgrade() -> None:
     # Create email_cache table
     op.create_table(
         'email_cache',
-        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('id', sa.BigInteger(), nullable=False),
         sa.Column('gmail_id', sa.String(length=255), nullable=False),
         sa.Column('thread_id', sa.String(length=255), nullable=False),
         sa.Column('history_id', sa.String(length=255), nullable=True),
@@ -69,22 +83,18 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id')
     )
     op.create_index('ix_email_cache_gmail_id', 'email_cache', ['gmail_id'], unique=True)
-    op.create_index('ix_email_cache_thread_id', 'email_cache', ['thread_id'], unique=False)
-    op.create_index('ix_email_cache_sender_email', 'email_cache', ['sender_email'], unique=False)
-    op.create_index('ix_email_cache_received_at', 'email_cache', ['received_at'], unique=False)
-    op.create_index('ix_email_cache_received_sender', 'email_cache', ['received_at', 'sender_email'], unique=False)
 
     # Create contacts table
     op.create_table(
         'contacts',
-        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('id', sa.BigInteger(), nullable=False),
         sa.Column('email', sa.String(length=255), nullable=False),
         sa.Column('name', sa.String(length=255), nullable=True),
         sa.Column('company', sa.String(length=255), nullable=True),
         sa.Column('role', sa.String(length=255), nullable=True),
         sa.Column('phone', sa.String(length=50), nullable=True),
         sa.Column('category', sa.Enum('team', 'investor', 'vendor', 'family', 'client', 'partner', 'other', name='contactcategory'), nullable=False, server_default='other'),
-        sa.Column('reports_to_id', sa.Integer(), nullable=True),
+        sa.Column('reports_to_id', sa.BigInteger(), nullable=True),
         sa.Column('supervisor_email', sa.String(length=255), nullable=True),
         sa.Column('expected_response_days', sa.Integer(), nullable=False, server_default='2'),
         sa.Column('notes', sa.Text(), nullable=True),
@@ -102,9 +112,9 @@ def upgrade() -> None:
     # Create followups table
     op.create_table(
         'followups',
-        sa.Column('id', sa.Integer(), nullable=False),
-        sa.Column('user_id', sa.Integer(), nullable=False),
-        sa.Column('email_id', sa.Integer(), nullable=True),
+        sa.Column('id', sa.BigInteger(), nullable=False),
+        sa.Column('user_id', sa.BigInteger(), nullable=False),
+        sa.Column('email_id', sa.BigInteger(), nullable=True),
         sa.Column('gmail_id', sa.String(length=255), nullable=False),
         sa.Column('thread_id', sa.String(length=255), nullable=False),
         sa.Column('subject', sa.String(length=500), nullable=False),
@@ -127,6 +137,18 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
         sa.PrimaryKeyConstraint('id')
     )
+
+    # Secondary indexes. Unique indexes above stay inline because they enforce
+    # constraints; these only speed up reads, so a bulk seed can skip them
+    # (SAGE_DEFER_INDEXES=1) and let 007 build them once the data is loaded.
+    if _defer_indexes():
+        return
+
+    op.create_index('ix_email_cache_thread_id', 'email_cache', ['thread_id'], unique=False)
+    op.create_index('ix_email_cache_sender_email', 'email_cache', ['sender_email'], unique=False)
+    op.create_index('ix_email_cache_received_at', 'email_cache', ['received_at'], unique=False)
+    op.create_index('ix_email_cache_received_sender', 'email_cache', ['received_at', 'sender_email'], unique=False)
+
     op.create_index('ix_followups_user_id', 'followups', ['user_id'], unique=False)
     op.create_index('ix_followups_gmail_id', 'followups', ['gmail_id'], unique=False)
     op.create_index('ix_followups_thread_id', 'followups', ['thread_id'], unique=False)
@@ -21,8 +21,8 @@ depends_on: Union[str, Sequence[str], None] = None
 def upgrade() -> None:
     op.create_table(
         'meeting_notes',
-        sa.Column('id', sa.Integer(), nullable=False),
-        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('id', sa.BigInteger(), nullable=False),
+        sa.Column('user_id', sa.BigInteger(), nullable=False),
         sa.Column('fireflies_id', sa.String(length=255), nullable=False),
         sa.Column('title', sa.String(length=500), nullable=False),
         sa.Column('meeting_date', sa.DateTime(), nullable=True),
@@ -58,7 +58,7 @@ def upgrade() -> None:
     # Create entity_relationships table
     op.create_table(
         'entity_relationships',
-        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('id', sa.BigInteger(), nullable=False),
         sa.Column('from_entity_id', sa.String(length=255), nullable=False),
         sa.Column('from_entity_type', sa.String(length=50), nullable=False),
         sa.Column('to_entity_id', sa.String(length=255), nullable=False),
@@ -22,8 +22,8 @@ def upgrade() -> None:
     # Create todo_items table
     op.create_table(
         'todo_items',
-        sa.Column('id', sa.Integer(), nullable=False),
-        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('id', sa.BigInteger(), nullable=False),
+        sa.Column('user_id', sa.BigInteger(), nullable=False),
 
         # Core todo info
         sa.Column('title', sa.String(500), nullable=False),
@@ -19,7 +19,12 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
+    # Fail fast instead of queueing behind long transactions (and blocking
+    # everything queued behind us) while taking the ACCESS EXCLUSIVE lock
+    op.execute("SET LOCAL lock_timeout = '2s'")
+
     # Make gmail_id nullable to support meeting-based followups
+    # (DROP NOT NULL is a catalog-only change)
     op.alter_column(
         'followups',
         'gmail_id',
@@ -35,20 +40,30 @@ def upgrade() -> None:
         nullable=True
     )
 
-    # Add source_type column to track where the followup came from
+    # Add source_type column to track where the followup came from.
+    # A constant default is stored in the catalog, so existing rows read
+    # 'email' without the table being rewritten.
     op.add_column(
         'followups',
         sa.Column('source_type', sa.String(50), nullable=True, server_default='email')
     )
 
     # Add source_id column to track meeting ID or other source
+    # (no default and NULL for existing rows, so nothing to backfill)
     op.add_column(
         'followups',
         sa.Column('source_id', sa.String(255), nullable=True)
     )
 
     # Create index for source tracking
-    op.create_index('ix_followups_source', 'followups', ['source_type', 'source_id'])
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_followups_source',
+            'followups',
+            ['source_type', 'source_id'],
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
 
 
 def downgrade() -> None:
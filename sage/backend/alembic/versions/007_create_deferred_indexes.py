@@ -0,0 +1,60 @@
+"""Create secondary indexes deferred by 001 during bulk load.
+
+When 001 runs with SAGE_DEFER_INDEXES=1 it only creates primary keys and
+unique indexes, so the initial backfill doesn't pay B-tree maintenance on
+every insert. This revision builds the remaining indexes once the data is
+in place. On databases where 001 already created them, every statement is
+a no-op thanks to IF NOT EXISTS.
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-01-22
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, columns) - must match the secondary indexes in 001
+DEFERRED_INDEXES = [
+    ('ix_email_cache_thread_id', 'email_cache', ['thread_id']),
+    ('ix_email_cache_sender_email', 'email_cache', ['sender_email']),
+    ('ix_email_cache_received_at', 'email_cache', ['received_at']),
+    ('ix_email_cache_received_sender', 'email_cache', ['received_at', 'sender_email']),
+    ('ix_followups_user_id', 'followups', ['user_id']),
+    ('ix_followups_gmail_id', 'followups', ['gmail_id']),
+    ('ix_followups_thread_id', 'followups', ['thread_id']),
+    ('ix_followups_contact_email', 'followups', ['contact_email']),
+    ('ix_followups_status', 'followups', ['status']),
+    ('ix_followups_due_date', 'followups', ['due_date']),
+    ('ix_followups_status_due', 'followups', ['status', 'due_date']),
+    ('ix_followups_user_status', 'followups', ['user_id', 'status']),
+]
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, table, columns in DEFERRED_INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    # These indexes are part of 001's schema; dropping them here would leave
+    # revision 006 without them. They are removed when 001 is downgraded.
+    pass
@@ -0,0 +1,56 @@
+"""Add indexes covering the followups.email_id and contacts.reports_to_id FKs.
+
+PostgreSQL does not index the referencing side of a foreign key, so deletes
+on email_cache and org-chart lookups on contacts scanned the whole child
+table. meeting_notes.user_id and todo_items.user_id are already covered.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-01-22
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_followups_email_id',
+            'followups',
+            ['email_id'],
+            unique=False,
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_contacts_reports_to_id',
+            'contacts',
+            ['reports_to_id'],
+            unique=False,
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_contacts_reports_to_id',
+            table_name='contacts',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_followups_email_id',
+            table_name='followups',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,81 @@
+"""Replace ix_email_cache_received_sender with a sender-led composite.
+
+Sender lookups filter on sender_email and then a received_at window
+("emails from X since Y"). The old (received_at, sender_email) index leads
+with the timestamp, so it can't serve those lookups, and it repeats what
+ix_email_cache_received_at already covers for time-ordered feeds.
+(sender_email, received_at DESC) serves both the sender filter and the
+window, and makes the single-column ix_email_cache_sender_email redundant.
+
+A partial index restricted to a recent window isn't possible here:
+PostgreSQL requires index predicates to be immutable, which rules out
+NOW(). A BRIN index isn't added either, because the received_at B-tree
+stays for ORDER BY received_at DESC LIMIT queries, which BRIN can't serve.
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-01-22
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_email_cache_sender_received',
+            'email_cache',
+            ['sender_email', sa.text('received_at DESC')],
+            unique=False,
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_email_cache_received_sender',
+            table_name='email_cache',
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_email_cache_sender_email',
+            table_name='email_cache',
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_email_cache_sender_email',
+            'email_cache',
+            ['sender_email'],
+            unique=False,
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_email_cache_received_sender',
+            'email_cache',
+            ['received_at', 'sender_email'],
+            unique=False,
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_email_cache_sender_received',
+            table_name='email_cache',
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,158 @@
+"""Convert emailcategory/emailpriority/todostatus enums to VARCHAR + CHECK.
+
+PostgreSQL enum types are append-only and ALTER TYPE ... ADD VALUE can't
+run inside a transaction, so every new category needed special-cased DDL.
+A VARCHAR column guarded by a CHECK constraint can be widened with a plain
+constraint swap.
+
+The conversion avoids an in-place ALTER COLUMN TYPE (a full table rewrite
+under ACCESS EXCLUSIVE): a shadow column is added, backfilled in committed
+keyset batches, and swapped in with a short final transaction.
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-01-22
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '010'
+down_revision: Union[str, None] = '009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 10_000
+
+# (table, column, enum type, allowed values, nullable, server default)
+ENUM_COLUMNS = [
+    (
+        'email_cache', 'category', 'emailcategory',
+        ('urgent', 'action_required', 'fyi', 'newsletter', 'personal', 'spam', 'unknown'),
+        True, None,
+    ),
+    (
+        'email_cache', 'priority', 'emailpriority',
+        ('low', 'normal', 'high', 'urgent'),
+        True, None,
+    ),
+    (
+        'todo_items', 'status', 'todostatus',
+        ('pending', 'snoozed', 'completed', 'cancelled'),
+        False, 'pending',
+    ),
+]
+
+# Indexes on todo_items.status that are dropped along with the enum column
+TODO_STATUS_INDEXES = [
+    ('ix_todo_items_status', ['status']),
+    ('ix_todo_status_due', ['status', 'due_date']),
+    ('ix_todo_user_status', ['user_id', 'status']),
+]
+
+
+def _backfill(table: str, column: str) -> None:
+    """Copy column::text into its shadow column, one committed batch at a time."""
+    update = (
+        f"UPDATE {table} SET {column}_new = {column}::text "
+        f"WHERE {column}_new IS NULL AND {column} IS NOT NULL"
+    )
+    if context.is_offline_mode():
+        op.execute(update)
+        return
+
+    bind = op.get_bind()
+    last_id = 0
+    with op.get_context().autocommit_block():
+        while True:
+            upper_id = bind.execute(
+                sa.text(
+                    f"SELECT max(id) FROM ("
+                    f"SELECT id FROM {table} WHERE id > :last_id ORDER BY id LIMIT :batch"
+                    f") AS page"
+                ),
+                {"last_id": last_id, "batch": BACKFILL_BATCH_SIZE},
+            ).scalar()
+            if upper_id is None:
+                break
+
+            bind.execute(
+                sa.text(f"{update} AND id > :lo AND id <= :hi"),
+                {"lo": last_id, "hi": upper_id},
+            )
+            last_id = upper_id
+
+
+def upgrade() -> None:
+    # Phase 1: shadow columns (nullable, no default: catalog-only)
+    for table, column, _, _, _, _ in ENUM_COLUMNS:
+        op.add_column(table, sa.Column(f'{column}_new', sa.String(20), nullable=True))
+
+    # Phase 2: backfill outside the migration transaction
+    for table, column, _, _, _, _ in ENUM_COLUMNS:
+        _backfill(table, column)
+
+    # Phase 3: swap. Catch up rows written since the backfill, then replace
+    # the enum column with the shadow column. The tables are locked first so
+    # no row can be written between the catch-up UPDATE and DROP COLUMN.
+    op.execute("SET LOCAL lock_timeout = '2s'")
+    for table in dict.fromkeys(table for table, *_ in ENUM_COLUMNS):
+        op.execute(f"LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE")
+    for table, column, enum_name, values, nullable, default in ENUM_COLUMNS:
+        op.execute(
+            f"UPDATE {table} SET {column}_new = {column}::text "
+            f"WHERE {column}_new IS DISTINCT FROM {column}::text"
+        )
+        op.drop_column(table, column)
+        op.alter_column(table, f'{column}_new', new_column_name=column)
+        if default is not None:
+            op.alter_column(
+                table,
+                column,
+                existing_type=sa.String(20),
+                server_default=default,
+                nullable=nullable,
+            )
+
+        allowed = ", ".join(f"'{v}'" for v in values)
+        op.create_check_constraint(
+            f'ck_{table}_{column}',
+            table,
+            f"{column} IN ({allowed})",
+        )
+        op.execute(f'DROP TYPE IF EXISTS {enum_name}')
+
+    # Rebuild the todo_items.status indexes that went away with the old column
+    with op.get_context().autocommit_block():
+        for name, columns in TODO_STATUS_INDEXES:
+            op.create_index(
+                name,
+                'todo_items',
+                columns,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    for table, column, enum_name, values, nullable, default in reversed(ENUM_COLUMNS):
+        op.drop_constraint(f'ck_{table}_{column}', table, type_='check')
+        allowed = ", ".join(f"'{v}'" for v in values)
+        op.execute(f'CREATE TYPE {enum_name} AS ENUM ({allowed})')
+        enum_type = sa.Enum(*values, name=enum_name, create_type=False)
+        if default is not None:
+            op.alter_column(table, column, existing_type=sa.String(20), server_default=None)
+        op.alter_column(
+            table,
+            column,
+            type_=enum_type,
+            existing_type=sa.String(20),
+            existing_nullable=nullable,
+            postgresql_using=f'{column}::{enum_name}',
+        )
+        if default is not None:
+            op.alter_column(table, column, existing_type=enum_type, server_default=default)
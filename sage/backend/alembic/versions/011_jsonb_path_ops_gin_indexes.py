@@ -0,0 +1,71 @@
+"""Rebuild indexed_entities GIN indexes with jsonb_path_ops.
+
+The structured/metadata lookups in GenericAdapter.query are containment
+(@>) queries, which jsonb_path_ops supports with an index that is
+markedly smaller and cheaper to maintain than the default jsonb_ops one.
+The new indexes are built concurrently before the old ones are dropped,
+so containment queries are never left without an index.
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-01-22
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (new index, old index, column)
+GIN_INDEXES = [
+    ('ix_indexed_entities_structured_path', 'ix_indexed_entities_structured', 'structured'),
+    ('ix_indexed_entities_metadata_path', 'ix_indexed_entities_metadata', 'metadata'),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for new_name, old_name, column in GIN_INDEXES:
+            op.create_index(
+                new_name,
+                'indexed_entities',
+                [column],
+                unique=False,
+                if_not_exists=True,
+                postgresql_using='gin',
+                postgresql_ops={column: 'jsonb_path_ops'},
+                postgresql_concurrently=True,
+            )
+            op.drop_index(
+                old_name,
+                table_name='indexed_entities',
+                if_exists=True,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for new_name, old_name, column in GIN_INDEXES:
+            op.create_index(
+                old_name,
+                'indexed_entities',
+                [column],
+                unique=False,
+                if_not_exists=True,
+                postgresql_using='gin',
+                postgresql_concurrently=True,
+            )
+            op.drop_index(
+                new_name,
+                table_name='indexed_entities',
+                if_exists=True,
+                postgresql_concurrently=True,
+            )
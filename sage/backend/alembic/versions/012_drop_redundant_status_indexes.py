@@ -0,0 +1,55 @@
+"""Drop single-column status indexes covered by (status, due_date).
+
+ix_followups_status_due and ix_todo_status_due lead with status, so the
+planner already uses them for status-only lookups; the standalone status
+indexes only add a B-tree update to every insert and status change.
+
+The due_date indexes stay: overdue/due-today queries and the followup
+list range-scan and sort on due_date without a status prefix.
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-01-22
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '012'
+down_revision: Union[str, None] = '011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, column)
+REDUNDANT_INDEXES = [
+    ('ix_followups_status', 'followups', 'status'),
+    ('ix_todo_items_status', 'todo_items', 'status'),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in REDUNDANT_INDEXES:
+            op.drop_index(
+                name,
+                table_name=table,
+                if_exists=True,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, column in REDUNDANT_INDEXES:
+            op.create_index(
+                name,
+                table,
+                [column],
+                unique=False,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+            )
@@ -0,0 +1,63 @@
+"""Store email_cache.received_at and followups.due_date as TIMESTAMPTZ.
+
+Both columns hold UTC instants but were TIMESTAMP WITHOUT TIME ZONE, so
+their meaning depended on whoever wrote them. With the session TimeZone
+set to UTC, PostgreSQL 12+ converts timestamp to timestamptz as a
+binary-compatible change: existing values are reinterpreted as UTC
+(which is what the app wrote) and the table is not rewritten. Indexes on
+the two columns are still rebuilt for the new operator class.
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-01-22
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '013'
+down_revision: Union[str, None] = '012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column, nullable)
+UTC_COLUMNS = [
+    ('email_cache', 'received_at', False),
+    ('followups', 'due_date', False),
+]
+
+
+def upgrade() -> None:
+    op.execute("SET LOCAL lock_timeout = '2s'")
+    # Makes the conversion binary-compatible, so no rewrite
+    op.execute("SET LOCAL TimeZone = 'UTC'")
+
+    for table, column, nullable in UTC_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(timezone=True),
+            existing_type=sa.DateTime(),
+            existing_nullable=nullable,
+            postgresql_using=column,
+        )
+
+
+def downgrade() -> None:
+    op.execute("SET LOCAL lock_timeout = '2s'")
+    op.execute("SET LOCAL TimeZone = 'UTC'")
+
+    for table, column, nullable in UTC_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(),
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=nullable,
+            postgresql_using=column,
+        )
@@ -0,0 +1,49 @@
+"""Store email_cache.body_html out of line without compression, and cap its size.
+
+Newsletter HTML can run to megabytes and, being mostly inlined images and
+markup that is often already compressed, gains little from TOAST's LZ
+pass. STORAGE EXTERNAL still moves it out of the heap row, so scans over
+subject/snippet stay dense, but skips the compression on write. It only
+affects values written from now on; body_text keeps the default EXTENDED
+strategy because plain text compresses well.
+
+The CHECK is added NOT VALID (no scan under the ACCESS EXCLUSIVE lock)
+and validated in a separate transaction, which only takes SHARE UPDATE
+EXCLUSIVE and so doesn't block writes.
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-01-22
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '014'
+down_revision: Union[str, None] = '013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BODY_HTML_MAX_CHARS = 2 * 1024 * 1024
+
+
+def upgrade() -> None:
+    op.execute("SET LOCAL lock_timeout = '2s'")
+    op.execute("ALTER TABLE email_cache ALTER COLUMN body_html SET STORAGE EXTERNAL")
+    op.execute(
+        "ALTER TABLE email_cache ADD CONSTRAINT ck_email_cache_body_html_length "
+        f"CHECK (char_length(body_html) < {BODY_HTML_MAX_CHARS}) NOT VALID"
+    )
+
+    # Validate in its own transaction, after the ACCESS EXCLUSIVE lock above
+    # has been released
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE email_cache VALIDATE CONSTRAINT ck_email_cache_body_html_length")
+
+
+def downgrade() -> None:
+    op.drop_constraint('ck_email_cache_body_html_length', 'email_cache', type_='check')
+    op.execute("ALTER TABLE email_cache ALTER COLUMN body_html SET STORAGE EXTENDED")
@@ -0,0 +1,37 @@
+"""Leave free space in email_cache pages so analysis updates stay HOT.
+
+Re-analysis only writes unindexed columns (category, priority, summary,
+action_items, sentiment, requires_response, analyzed_at). When the new
+row version fits on the same page, PostgreSQL makes a heap-only tuple
+(HOT) update: no index entries are written and the old version is pruned
+in place. At the default fillfactor of 100 pages are packed full, so
+nearly every analysis update spills to a new page and touches every
+index on the table.
+
+The setting applies to pages written from now on; existing pages pick it
+up as they are rewritten (VACUUM FULL / pg_repack if wanted sooner).
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-01-22
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '015'
+down_revision: Union[str, None] = '014'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # SET (fillfactor) takes SHARE UPDATE EXCLUSIVE, so writes continue
+    op.execute("ALTER TABLE email_cache SET (fillfactor = 85)")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE email_cache RESET (fillfactor)")
@@ -0,0 +1,44 @@
+"""Leave free space in followups and todo_items pages for HOT updates.
+
+Both tables are updated far more than they are inserted into (reminders,
+escalations, snoozes, completion). Updates that leave every indexed
+column alone can be heap-only (HOT) when the new row version fits on the
+same page, skipping index maintenance entirely. email_cache got the same
+treatment in 015.
+
+Note that status is part of the (status, due_date) and (user_id, status)
+indexes, so a status change itself is never HOT; the gain is on the
+surrounding writes (reminder_sent_at, escalated_at, snoozed_until,
+completed_at, notes and the like).
+
+Applies to newly written pages. No CLUSTER / VACUUM FULL here: both take
+ACCESS EXCLUSIVE for the whole rewrite, so run one in a maintenance
+window if the existing pages should converge sooner.
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-01-22
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '016'
+down_revision: Union[str, None] = '015'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+UPDATE_HEAVY_TABLES = ['followups', 'todo_items']
+
+
+def upgrade() -> None:
+    for table in UPDATE_HEAVY_TABLES:
+        op.execute(f"ALTER TABLE {table} SET (fillfactor = 80)")
+
+
+def downgrade() -> None:
+    for table in UPDATE_HEAVY_TABLES:
+        op.execute(f"ALTER TABLE {table} RESET (fillfactor)")
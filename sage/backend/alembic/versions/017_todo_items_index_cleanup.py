@@ -0,0 +1,72 @@
+"""Trim todo_items' user_id indexes and add a BRIN index on created_at.
+
+ix_todo_items_user_id is a prefix of ix_todo_user_status, which already
+serves user-scoped lookups (and the users FK). Nothing filters todos by
+(user_id, priority): priority is only ever a sort key after due_date, so
+ix_todo_user_priority is pure write overhead.
+
+created_at only ever grows, so a BRIN index (one summary per 128 heap
+pages, a tiny fraction of a B-tree's size) is enough for age-based scans
+such as cleanup and reporting.
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-01-22
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '017'
+down_revision: Union[str, None] = '016'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, columns)
+REDUNDANT_INDEXES = [
+    ('ix_todo_items_user_id', ['user_id']),
+    ('ix_todo_user_priority', ['user_id', 'priority']),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_todo_items_created_brin',
+            'todo_items',
+            ['created_at'],
+            unique=False,
+            if_not_exists=True,
+            postgresql_using='brin',
+            postgresql_concurrently=True,
+        )
+        for name, _ in REDUNDANT_INDEXES:
+            op.drop_index(
+                name,
+                table_name='todo_items',
+                if_exists=True,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, columns in REDUNDANT_INDEXES:
+            op.create_index(
+                name,
+                'todo_items',
+                columns,
+                unique=False,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+            )
+        op.drop_index(
+            'ix_todo_items_created_brin',
+            table_name='todo_items',
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,61 @@
+"""Enforce one edge per entity pair for symmetric relationship types.
+
+For knows/works_with/related_to, A->B and B->A are the same fact. A
+unique index on (LEAST(from, to), GREATEST(from, to), type), partial to
+those types, rejects the reverse duplicate and lets the create-or-update
+check in DataLayerService.create_relationship find either direction with
+one index probe instead of two.
+
+Any existing reverse duplicates are removed first (keeping the older
+row), otherwise the unique build would fail.
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-01-22
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '018'
+down_revision: Union[str, None] = '017'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match SYMMETRIC_RELATIONSHIP_TYPES in the EntityRelationship model
+SYMMETRIC_TYPES = "('knows', 'related_to', 'works_with')"
+
+
+def upgrade() -> None:
+    op.execute(
+        "DELETE FROM entity_relationships newer "
+        "USING entity_relationships older "
+        f"WHERE newer.relationship_type IN {SYMMETRIC_TYPES} "
+        "AND older.relationship_type = newer.relationship_type "
+        "AND older.from_entity_id = newer.to_entity_id "
+        "AND older.to_entity_id = newer.from_entity_id "
+        "AND older.id < newer.id"
+    )
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ix_entity_rel_undirected "
+            "ON entity_relationships ("
+            "LEAST(from_entity_id, to_entity_id), "
+            "GREATEST(from_entity_id, to_entity_id), "
+            "relationship_type"
+            f") WHERE relationship_type IN {SYMMETRIC_TYPES}"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_entity_rel_undirected',
+            table_name='entity_relationships',
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
@@ -13,6 +13,7 @@ from .base import (
     BaseAgent,
     AgentResult,
     SearchContext,
+    ContextRequest,
     DataLayerInterface,
 )
 
@@ -20,5 +21,6 @@ __all__ = [
     "BaseAgent",
     "AgentResult",
     "SearchContext",
+    "ContextRequest",
     "DataLayerInterface",
 ]
@@ -11,9 +11,11 @@ See sage-agent-architecture.md Section 3.3 for specifications.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Sequence
 from dataclasses import dataclass, field
-from typing import Any, TYPE_CHECKING
+from typing import Any, ClassVar, TYPE_CHECKING
 from enum import Enum
+from types import MappingProxyType
 
 if TYPE_CHECKING:
     from .foundational.search import SearchAgent
@@ -27,7 +29,13 @@ class AgentType(Enum):
     ORCHESTRATOR = "orchestrator"
 
 
-@dataclass
+# Shared default for AgentResult's sequence fields. Most results carry no
+# errors, warnings or entities to index, so they share this instead of
+# allocating three empty lists each; pass a list to set any of them.
+_EMPTY: tuple = ()
+
+
+@dataclass(slots=True)
 class AgentResult:
     """
     Standard result from any agent.
@@ -37,12 +45,12 @@ class AgentResult:
     """
     success: bool
     data: dict[str, Any]
-    errors: list[str] = field(default_factory=list)
-    warnings: list[str] = field(default_factory=list)
+    errors: Sequence[str] = _EMPTY
+    warnings: Sequence[str] = _EMPTY
     confidence: float = 1.0
 
     # Data to persist (sent to Indexer Agent)
-    entities_to_index: list[dict] = field(default_factory=list)
+    entities_to_index: Sequence[dict] = _EMPTY
 
     # Human approval needed?
     requires_approval: bool = False
@@ -50,14 +58,42 @@ class AgentResult:
 
     def __post_init__(self):
         if self.errors is None:
-            self.errors = []
+            self.errors = _EMPTY
         if self.warnings is None:
-            self.warnings = []
+            self.warnings = _EMPTY
         if self.entities_to_index is None:
-            self.entities_to_index = []
-
-
-@dataclass
+            self.entities_to_index = _EMPTY
+
+    @classmethod
+    def ok(cls, data: dict[str, Any], *, confidence: float = 1.0) -> "AgentResult":
+        """Build a plain successful result, skipping __init__/__post_init__."""
+        result = cls.__new__(cls)
+        result.success = True
+        result.data = data
+        result.errors = _EMPTY
+        result.warnings = _EMPTY
+        result.confidence = confidence
+        result.entities_to_index = _EMPTY
+        result.requires_approval = False
+        result.approval_context = None
+        return result
+
+    @classmethod
+    def fail(cls, *errors: str) -> "AgentResult":
+        """Build a failed result with no data."""
+        result = cls.__new__(cls)
+        result.success = False
+        result.data = {}
+        result.errors = list(errors)
+        result.warnings = _EMPTY
+        result.confidence = 1.0
+        result.entities_to_index = _EMPTY
+        result.requires_approval = False
+        result.approval_context = None
+        return result
+
+
+@dataclass(slots=True)
 class SearchContext:
     """
     Context package provided to agents by Search Agent.
@@ -86,17 +122,33 @@ class SearchContext:
 
     def is_empty(self) -> bool:
         """Check if context contains any data."""
-        return not any([
-            self.relevant_emails,
-            self.relevant_contacts,
-            self.relevant_followups,
-            self.relevant_meetings,
-            self.relevant_events,
-            self.relevant_memories,
-        ])
+        # Short-circuits on the first non-empty collection
+        return not (
+            self.relevant_emails
+            or self.relevant_contacts
+            or self.relevant_followups
+            or self.relevant_meetings
+            or self.relevant_events
+            or self.relevant_memories
+        )
 
 
-@dataclass
+# Returned by BaseAgent.get_context when no Search Agent is wired, instead of
+# a fresh SearchContext per call. Its collections are immutable, so a caller
+# that tries to add to it fails loudly rather than leaking into other agents.
+_EMPTY_SEARCH_CONTEXT = SearchContext(
+    relevant_emails=_EMPTY,
+    relevant_contacts=_EMPTY,
+    relevant_followups=_EMPTY,
+    relevant_meetings=_EMPTY,
+    relevant_events=_EMPTY,
+    relevant_memories=_EMPTY,
+    relationship_graph=MappingProxyType({}),
+    retrieval_metadata=MappingProxyType({}),
+)
+
+
+@dataclass(slots=True)
 class IndexedEntity:
     """
     Represents an entity stored in the Data Layer.
@@ -113,7 +165,7 @@ class IndexedEntity:
     metadata: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """Result from a vector or structured search."""
     entity: IndexedEntity
@@ -121,7 +173,7 @@ class SearchResult:
     match_type: str  # "semantic", "keyword", "structured"
 
 
-@dataclass
+@dataclass(slots=True)
 class Relationship:
     """A relationship between two entities."""
     from_id: str
@@ -130,6 +182,15 @@ class Relationship:
     metadata: dict = field(default_factory=dict)
 
 
+@dataclass(slots=True)
+class ContextRequest:
+    """One agent's request for context, for batched retrieval."""
+    requesting_agent: str
+    task_description: str
+    entity_hints: list[str] | None = None
+    max_results: int = 20
+
+
 class DataLayerInterface(ABC):
     """
     Abstract interface for Data Layer access.
@@ -144,11 +205,32 @@ class DataLayerInterface(ABC):
         """Store an entity and return its ID."""
         pass
 
+    async def store_entities(self, entities: list[IndexedEntity]) -> list[str]:
+        """
+        Store several entities and return their IDs in order.
+
+        Backends that can write and embed in bulk should override this;
+        the default stores them one at a time.
+        """
+        return [await self.store_entity(entity) for entity in entities]
+
     @abstractmethod
     async def update_entity(self, entity_id: str, updates: dict) -> bool:
         """Update an existing entity."""
         pass
 
+    async def update_entities(self, updates: list[tuple[str, dict]]) -> list[bool]:
+        """
+        Apply several (entity_id, updates) pairs, returning update_entity's result for each.
+
+        Backends that can load and write in bulk should override this;
+        the default updates them one at a time.
+        """
+        return [
+            await self.update_entity(entity_id, entity_updates)
+            for entity_id, entity_updates in updates
+        ]
+
     @abstractmethod
     async def delete_entity(self, entity_id: str) -> bool:
         """Delete an entity from all stores."""
@@ -161,12 +243,51 @@ class DataLayerInterface(ABC):
         """Create a relationship between two entities."""
         pass
 
+    async def create_relationships(self, relationships: list[Relationship]) -> list[bool]:
+        """
+        Create several relationships, returning create_relationship's result for each.
+
+        Backends that can check and insert in bulk should override this;
+        the default creates them one at a time.
+        """
+        return [
+            await self.create_relationship(
+                rel.from_id, rel.to_id, rel.rel_type, rel.metadata or None
+            )
+            for rel in relationships
+        ]
+
+    @property
+    def write_generation(self) -> int:
+        """
+        A counter that changes whenever an entity is stored, updated or deleted.
+
+        Callers that cache read results include it in their cache keys.
+        Backends that don't track writes return 0, so such caches only
+        expire on their own.
+        """
+        return 0
+
     # Read operations (used by Search Agent)
     @abstractmethod
     async def get_entity(self, entity_id: str) -> IndexedEntity | None:
         """Retrieve a single entity by ID."""
         pass
 
+    async def get_entities(self, entity_ids: list[str]) -> dict[str, IndexedEntity]:
+        """
+        Retrieve several entities, keyed by ID (IDs not found are omitted).
+
+        Backends that can load in bulk should override this; the default
+        calls get_entity once per ID.
+        """
+        entities = {}
+        for entity_id in entity_ids:
+            entity = await self.get_entity(entity_id)
+            if entity is not None:
+                entities[entity_id] = entity
+        return entities
+
     @abstractmethod
     async def vector_search(
         self,
@@ -177,6 +298,23 @@ class DataLayerInterface(ABC):
         """Perform semantic search across entity embeddings."""
         pass
 
+    async def vector_search_batch(
+        self,
+        queries: list[str],
+        entity_types: list[str] | None = None,
+        limit: int = 10,
+    ) -> list[list[SearchResult]]:
+        """
+        Run several semantic searches, returning one result list per query.
+
+        Backends that can embed and search in bulk should override this;
+        the default runs vector_search once per query.
+        """
+        return [
+            await self.vector_search(query, entity_types=entity_types, limit=limit)
+            for query in queries
+        ]
+
     @abstractmethod
     async def structured_query(
         self,
@@ -187,6 +325,21 @@ class DataLayerInterface(ABC):
         """Query entities by structured fields."""
         pass
 
+    async def structured_query_iter(
+        self,
+        filters: dict,
+        entity_type: str,
+        limit: int = 100
+    ) -> AsyncIterator[IndexedEntity]:
+        """
+        Query entities by structured fields, yielding them as they arrive.
+
+        Backends that can stream from the database should override this;
+        the default yields from structured_query.
+        """
+        for entity in await self.structured_query(filters, entity_type, limit):
+            yield entity
+
     @abstractmethod
     async def get_relationships(
         self,
@@ -211,15 +364,26 @@ class BaseAgent(ABC):
     Subclasses must implement:
     - name: str
     - description: str
-    - capabilities: list[str]
+    - capabilities: tuple[str, ...]
     - execute(): The main entry point for agent actions
     """
 
     name: str
     description: str
-    capabilities: list[str]
+    capabilities: ClassVar[tuple[str, ...]]
     agent_type: AgentType
 
+    # Built once per subclass: a frozenset for supports_capability() and the
+    # capability list as shown in _validate_capability() errors
+    _capabilities_set: frozenset[str] = frozenset()
+    _capabilities_repr: str = "[]"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        capabilities = getattr(cls, "capabilities", ())
+        cls._capabilities_set = frozenset(capabilities)
+        cls._capabilities_repr = str(list(capabilities))
+
     def __init__(
         self,
         search_agent: "SearchAgent | None" = None,
@@ -265,7 +429,7 @@ class BaseAgent(ABC):
 
     def supports_capability(self, capability: str) -> bool:
         """Check if this agent supports a given capability."""
-        return capability in self.capabilities
+        return capability in self._capabilities_set
 
     async def get_context(
         self,
@@ -285,7 +449,7 @@ class BaseAgent(ABC):
             SearchContext with relevant data for the task
         """
         if self.search is None:
-            return SearchContext()  # Empty context if no search agent
+            return _EMPTY_SEARCH_CONTEXT  # Empty context if no search agent
 
         return await self.search.search_for_task(
             requesting_agent=self.name,
@@ -293,6 +457,49 @@ class BaseAgent(ABC):
             entity_hints=hints
         )
 
+    @classmethod
+    async def gather_contexts(
+        cls,
+        agents: list["BaseAgent"],
+        tasks: list[tuple[str, list[str] | None]],
+    ) -> list[SearchContext]:
+        """
+        Get context for several agents' tasks with batched retrieval.
+
+        Use this when one request fans out to several agents: agents that
+        share a Search Agent get their contexts from a single
+        get_contexts_batch call rather than one search_for_task each.
+
+        Args:
+            agents: The agents needing context
+            tasks: (task_description, hints) for each agent, in order
+
+        Returns:
+            One SearchContext per agent, in order
+        """
+        contexts = [_EMPTY_SEARCH_CONTEXT] * len(agents)
+
+        # Group by Search Agent (agents without one get an empty context)
+        groups: dict[int, list[int]] = {}
+        for i, agent in enumerate(agents):
+            if agent.search is not None:
+                groups.setdefault(id(agent.search), []).append(i)
+
+        for positions in groups.values():
+            search = agents[positions[0]].search
+            batch = await search.get_contexts_batch([
+                ContextRequest(
+                    requesting_agent=agents[i].name,
+                    task_description=tasks[i][0],
+                    entity_hints=tasks[i][1],
+                )
+                for i in positions
+            ])
+            for i, context in zip(positions, batch):
+                contexts[i] = context
+
+        return contexts
+
     async def persist_data(self, entities: list[dict]) -> list[str]:
         """
         Send data to Indexer Agent for persistence.
@@ -308,17 +515,58 @@ class BaseAgent(ABC):
         if self.indexer is None:
             return []
 
-        indexed_ids = []
-        for entity in entities:
-            entity_id = await self.indexer.index_entity(entity)
-            indexed_ids.append(entity_id)
+        if len(entities) == 1:
+            return [await self.indexer.index_entity(entities[0])]
 
-        return indexed_ids
+        return await self.indexer.index_entities(entities)
+
+    async def persist_stream(
+        self,
+        entities: AsyncIterable[dict] | Iterable[dict],
+        batch_size: int = 50,
+    ) -> AsyncIterator[str]:
+        """
+        Persist entities from an (async) iterable, yielding IDs as they land.
+
+        Entities are indexed batch_size at a time through persist_data, so
+        only one batch is held in memory; use this over persist_data for
+        ingest jobs of more than ~1k entities.
+
+        Args:
+            entities: Entity dicts to index
+            batch_size: Entities per indexer call
+
+        Yields:
+            Entity IDs, in input order
+        """
+        if self.indexer is None:
+            return
+
+        if not isinstance(entities, AsyncIterable):
+            entities = _aiter(entities)
+
+        batch: list[dict] = []
+        async for entity in entities:
+            batch.append(entity)
+            if len(batch) >= batch_size:
+                for entity_id in await self.persist_data(batch):
+                    yield entity_id
+                batch = []
+
+        if batch:
+            for entity_id in await self.persist_data(batch):
+                yield entity_id
 
     def _validate_capability(self, capability: str) -> None:
         """Raise ValueError if capability is not supported."""
         if not self.supports_capability(capability):
             raise ValueError(
                 f"Agent '{self.name}' does not support capability '{capability}'. "
-                f"Supported capabilities: {self.capabilities}"
+                f"Supported capabilities: {self._capabilities_repr}"
             )
+
+
+async def _aiter(items: Iterable[dict]) -> AsyncIterator[dict]:
+    """Adapt a plain iterable for persist_stream."""
+    for item in items:
+        yield item
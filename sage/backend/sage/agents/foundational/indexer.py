@@ -13,10 +13,20 @@ and preparing it for optimal retrieval. It handles:
 See sage-agent-architecture.md Section 2.2 for specifications.
 """
 
+import base64
+import hashlib
+import json
 import logging
-import uuid
-from datetime import datetime
-from typing import Any
+import re
+import secrets
+import time
+import weakref
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from email.utils import getaddresses, parseaddr
+from functools import lru_cache
+from typing import Any, Sequence
 
 from ..base import (
     BaseAgent,
@@ -30,6 +40,85 @@ from ..base import (
 
 logger = logging.getLogger(__name__)
 
+# How many content-hashed entity IDs the Indexer remembers as already stored
+# (per bound data layer)
+STORED_CONTENT_CACHE_SIZE = 1024
+
+# Most entities index_entities stores per store_entities call
+INDEX_BATCH_SIZE = 500
+
+# Most conversation exchanges sent to Claude in one fact extraction call
+FACT_BATCH_SIZE = 8
+
+# Exchanges shorter than this (user + assistant characters) have no facts
+# worth extracting
+MIN_FACT_EXCHANGE_LENGTH = 50
+
+# Cheap signs that an exchange may state a fact, decision, preference or
+# task: a digit (dates, times, amounts), a capitalized name mid-sentence,
+# a first-person statement, or one of these words. Exchanges with none of
+# them (greetings, thanks, acknowledgements) are not sent to Claude.
+_FACT_SIGNAL_RE = re.compile(
+    r"\d"
+    r"|[a-z,] +[A-Z][a-z]"
+    r"|(?i:\b(?:i['\u2019]m|i am|i['\u2019]ve|my|we|we['\u2019]re|our|us"
+    r"|deadline|due|meeting|schedul\w*|remind\w*|prefer\w*|decid\w*|decision"
+    r"|will|won't|don't|always|never|birthday|anniversary|date|phone|email|address"
+    r"|call|today|tomorrow|tonight|next|week|month|year"
+    r"|monday|tuesday|wednesday|thursday|friday|saturday|sunday"
+    r"|switch\w*|chang\w*|mov(?:e|ed|ing)|allerg\w*|(?:dis)?lik(?:e|es|ed)"
+    r"|love|hate|want|need|start\w*|stop\w*)\b)"
+)
+
+# Claude model used for fact extraction. Kept constant so the cached
+# system prompt prefix is reused from call to call.
+FACT_EXTRACTION_MODEL = "claude-sonnet-4-20250514"
+
+# How many exchanges' extracted facts the Indexer remembers, so retries
+# and reindexing of the same exchange skip the Claude call
+FACT_CACHE_SIZE = 10_000
+
+# Optional contact params copied into a contact's structured data
+CONTACT_FIELDS = ("name", "company", "role", "phone")
+
+# Params index_memory needs to build a memory entity
+MEMORY_REQUIRED_PARAMS = ("conversation_id", "user_message", "sage_response")
+
+
+# Gmail's internalDate is epoch milliseconds (UTC)
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _from_gmail_internal_date(internal_date_ms: int) -> datetime:
+    """Convert a Gmail internalDate to a naive UTC datetime."""
+    return _EPOCH + timedelta(milliseconds=internal_date_ms)
+
+
+def _short_id() -> str:
+    """Random 12-hex-character ID for entities with no source ID."""
+    return secrets.token_hex(6)
+
+
+# Email address -> contact entity ID slug ("a.b@c.com" -> "a_b_at_c_com")
+_CONTACT_SLUG_TABLE = str.maketrans({"@": "_at_", ".": "_"})
+
+
+@lru_cache(maxsize=16384)
+def _contact_id(email: str) -> str:
+    """Get the contact entity ID for an email address."""
+    return f"contact_{email.lower().translate(_CONTACT_SLUG_TABLE)}"
+
+
+@dataclass(slots=True)
+class _PendingEntity:
+    """A built entity waiting for its batch to be stored."""
+    position: int
+    entity: IndexedEntity
+    # Created after the entity, with from_id rebound to the stored ID
+    relationships: Sequence[Relationship] = ()
+    # Payload digest of a content-hashed generic entity, remembered once stored
+    content_digest: str | None = None
+
 
 class IndexerAgent(BaseAgent):
     """
@@ -51,12 +140,13 @@ class IndexerAgent(BaseAgent):
         - delete_entity: Remove from all indices
         - link_entities: Create relationship between entities
         - supersede_fact: Mark old fact as superseded by new one
+        - supersede_facts: Apply many supersessions in one batch
     """
 
     name = "indexer"
     description = "Ingests and optimizes data for retrieval across all storage systems"
     agent_type = AgentType.FOUNDATIONAL
-    capabilities = [
+    capabilities = (
         "index_email",
         "index_meeting",
         "index_contact",
@@ -68,16 +158,11 @@ class IndexerAgent(BaseAgent):
         "delete_entity",
         "link_entities",
         "supersede_fact",
-    ]
-
-    # Fact extraction prompt for Claude
-    FACT_EXTRACTION_PROMPT = """Analyze the following conversation exchange and extract any important information.
-
-User message: {user_message}
-
-Assistant response: {sage_response}
+        "supersede_facts",
+    )
 
-Extract the following types of information if present:
+    # What to extract and how to describe each item, shared by the prompts
+    FACT_ITEM_INSTRUCTIONS = """Extract the following types of information if present:
 
 1. **Facts** - New information stated (e.g., "Luke's birthday is February 13", "The meeting is at 3pm")
 2. **Fact Corrections** - Updates to existing information (e.g., "The deadline changed from Jan 31 to Feb 15")
@@ -91,25 +176,57 @@ For each extracted item, provide:
 - confidence: 0.0-1.0 (how certain you are this is meaningful information)
 - entities_mentioned: List of people, projects, dates, or other entities mentioned
 
-Return a JSON array. If nothing meaningful to extract, return an empty array [].
+"""
+
+    # Fact extraction instructions for Claude. Sent as a cached system
+    # prompt, so only the exchange itself varies between calls.
+    FACT_EXTRACTION_SYSTEM = """Analyze the conversation exchange you are given and extract any important information.
+
+""" + FACT_ITEM_INSTRUCTIONS + """Return a JSON array. If nothing meaningful to extract, return an empty array [].
 
 Example output:
 [
-  {{
+  {
     "type": "fact",
     "content": "Insurance renewal deadline is February 15, 2026",
     "confidence": 1.0,
     "entities_mentioned": ["insurance renewal", "February 15, 2026"]
-  }},
-  {{
+  },
+  {
     "type": "preference",
     "content": "Prefers email over phone calls for non-urgent matters",
     "confidence": 0.8,
     "entities_mentioned": []
-  }}
-]
+  }
+]"""
+
+    # The exchange to extract facts from
+    FACT_EXTRACTION_PROMPT = """User message: {user_message}
+
+Assistant response: {sage_response}"""
+
+    # Fact extraction instructions for several numbered exchanges in one call
+    FACT_EXTRACTION_BATCH_SYSTEM = """Analyze each of the numbered conversation exchanges you are given and extract any important information.
 
-Now analyze the conversation and extract information:"""
+""" + FACT_ITEM_INSTRUCTIONS + """Return a JSON object mapping each exchange number to a JSON array of the items extracted from that exchange. Include every exchange number, using an empty array [] when there is nothing meaningful to extract.
+
+Example output:
+{
+  "1": [
+    {
+      "type": "fact",
+      "content": "Insurance renewal deadline is February 15, 2026",
+      "confidence": 1.0,
+      "entities_mentioned": ["insurance renewal", "February 15, 2026"]
+    }
+  ],
+  "2": []
+}"""
+
+    # One exchange within a batch extraction request
+    FACT_EXTRACTION_BATCH_ITEM = """Exchange {number}:
+User message: {user_message}
+Assistant response: {sage_response}"""
 
     def __init__(self, data_layer: DataLayerInterface):
         """
@@ -121,27 +238,73 @@ Now analyze the conversation and extract information:"""
         # Indexer doesn't use search/indexer refs - it IS the indexer
         super().__init__(search_agent=None, indexer_agent=None)
         self.data_layer = data_layer
-        self._claude_client = None
+
+        # Content-hashed ID -> payload digest of generic entities stored
+        # recently through the bound data layer, so re-ingesting an
+        # identical payload skips the write and embedding. Reset whenever a
+        # different data layer (session) is bound; see _stored_digests()
+        self._stored_content: OrderedDict[str, str] = OrderedDict()
+        self._stored_content_owner: weakref.ref | None = None
+
+        # Content hash of an exchange -> facts extracted from it
+        self._fact_cache: OrderedDict[str, list[dict]] = OrderedDict()
+
+        # Exchanges checked by _looks_fact_bearing, and how many it filtered
+        # out before extraction; see get_fact_filter_stats()
+        self._fact_signal_checks = 0
+        self._fact_signal_skips = 0
+
+        # Last _now_iso() value and the millisecond it was formatted for
+        self._now_ms = 0
+        self._now_iso_str = ""
+
+        # Capability name -> handler, for execute()
+        self._capability_dispatch = {
+            "index_email": self._index_email,
+            "index_meeting": self._index_meeting,
+            "index_contact": self._index_contact,
+            "index_document": self._index_document,
+            "index_event": self._index_event,
+            "index_memory": self._index_memory,
+            "extract_facts": self._extract_facts,
+            "reindex_entity": self._reindex_entity,
+            "delete_entity": self._delete_entity,
+            "link_entities": self._link_entities,
+            "supersede_fact": self._supersede_fact,
+            "supersede_facts": self._supersede_facts,
+        }
+        # Entity type -> handler, for index_entity(); other types are
+        # stored generically
+        self._entity_type_dispatch = {
+            "email": self._index_email,
+            "meeting": self._index_meeting,
+            "contact": self._index_contact,
+            "document": self._index_document,
+            "event": self._index_event,
+            "memory": self._index_memory,
+        }
 
     async def _get_claude(self):
-        """Get or create Claude client for AI operations."""
-        if self._claude_client is None:
-            from anthropic import AsyncAnthropic
-            from sage.config import get_settings
+        """Get the shared Claude client for AI operations."""
+        from sage.core.claude_agent import get_async_anthropic
 
-            settings = get_settings()
-            self._claude_client = AsyncAnthropic(api_key=settings.anthropic_api_key)
-        return self._claude_client
+        return get_async_anthropic()
 
     def _generate_entity_id(self, entity_type: str, source_id: str | None = None) -> str:
         """Generate a unique entity ID."""
         if source_id:
             return f"{entity_type}_{source_id}"
-        return f"{entity_type}_{uuid.uuid4().hex[:12]}"
+        return f"{entity_type}_{_short_id()}"
 
     def _now_iso(self) -> str:
-        """Get current timestamp in ISO format."""
-        return datetime.utcnow().isoformat()
+        """Get current timestamp in ISO format (naive UTC, millisecond precision)."""
+        # Indexing stamps several fields per entity; within the same
+        # millisecond reuse the formatted string
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms != self._now_ms:
+            self._now_ms = now_ms
+            self._now_iso_str = (_EPOCH + timedelta(milliseconds=now_ms)).isoformat()
+        return self._now_iso_str
 
     async def execute(
         self,
@@ -163,41 +326,13 @@ Now analyze the conversation and extract information:"""
         self._validate_capability(capability)
 
         try:
-            if capability == "index_email":
-                return await self._index_email(params)
-            elif capability == "index_meeting":
-                return await self._index_meeting(params)
-            elif capability == "index_contact":
-                return await self._index_contact(params)
-            elif capability == "index_document":
-                return await self._index_document(params)
-            elif capability == "index_event":
-                return await self._index_event(params)
-            elif capability == "index_memory":
-                return await self._index_memory(params)
-            elif capability == "extract_facts":
-                return await self._extract_facts(params)
-            elif capability == "reindex_entity":
-                return await self._reindex_entity(params)
-            elif capability == "delete_entity":
-                return await self._delete_entity(params)
-            elif capability == "link_entities":
-                return await self._link_entities(params)
-            elif capability == "supersede_fact":
-                return await self._supersede_fact(params)
-            else:
-                return AgentResult(
-                    success=False,
-                    data={},
-                    errors=[f"Unknown capability: {capability}"]
-                )
+            handler = self._capability_dispatch.get(capability)
+            if handler is None:
+                return AgentResult.fail(f"Unknown capability: {capability}")
+            return await handler(params)
         except Exception as e:
-            logger.error(f"Indexing error in {capability}: {e}", exc_info=True)
-            return AgentResult(
-                success=False,
-                data={},
-                errors=[f"Indexing error: {str(e)}"]
-            )
+            logger.error("Indexing error in %s: %s", capability, e, exc_info=True)
+            return AgentResult.fail(f"Indexing error: {str(e)}")
 
     async def index_entity(self, entity_data: dict) -> str:
         """
@@ -213,34 +348,224 @@ Now analyze the conversation and extract information:"""
         """
         entity_type = entity_data.get("entity_type", "unknown")
 
-        if entity_type == "email":
-            result = await self._index_email(entity_data)
-        elif entity_type == "meeting":
-            result = await self._index_meeting(entity_data)
-        elif entity_type == "contact":
-            result = await self._index_contact(entity_data)
-        elif entity_type == "document":
-            result = await self._index_document(entity_data)
-        elif entity_type == "event":
-            result = await self._index_event(entity_data)
-        elif entity_type == "memory":
-            result = await self._index_memory(entity_data)
-        else:
+        handler = self._entity_type_dispatch.get(entity_type)
+        if handler is None:
             # Generic indexing
-            entity = IndexedEntity(
-                id=entity_data.get("id", self._generate_entity_id(entity_type)),
-                entity_type=entity_type,
-                source=entity_data.get("source", "unknown"),
-                structured=entity_data.get("structured", {}),
-                analyzed=entity_data.get("analyzed", {}),
-                relationships=entity_data.get("relationships", {}),
-                embeddings=entity_data.get("embeddings", {}),
-                metadata=entity_data.get("metadata", {}),
-            )
-            return await self.data_layer.store_entity(entity)
-
+            entity = self._build_generic_entity(entity_data)
+            digest = self._payload_digest(entity)
+            if self._already_stored(entity_data, entity.id, digest):
+                return entity.id
+            entity_id = await self.data_layer.store_entity(entity)
+            if not entity_data.get("id"):
+                self._remember_stored(entity_id, digest)
+            return entity_id
+
+        result = await handler(entity_data)
         return result.data.get("entity_id", "")
 
+    async def index_entities(self, entity_data_list: list[dict]) -> list[str]:
+        """
+        Index several entities, batching what can be batched.
+
+        Generic entities, emails and meetings are stored INDEX_BATCH_SIZE
+        at a time with one store_entities call, so their embeddings are
+        computed and upserted together, and the emails' sender and the
+        meetings' participant relationships follow in one
+        create_relationships call. Memories are stored the same way, after
+        their facts are extracted with _extract_facts_batch (a few
+        exchanges per Claude call rather than one call each). Other typed
+        entities (contact, event, ...) still go through index_entity,
+        since their handlers also extract fields or look up existing data.
+
+        For backfills, feed this through persist_stream, which bounds how
+        many entities are in flight at once.
+
+        Args:
+            entity_data_list: Entity data dicts with entity_type fields
+
+        Returns:
+            The entity IDs, in the order given ("" for emails without a
+            gmail_id, meetings without a title or memories missing required
+            params, as with index_entity)
+        """
+        entity_ids: list[str] = [""] * len(entity_data_list)
+        batch: list[_PendingEntity] = []
+        memories: list[tuple[int, dict]] = []
+
+        for position, entity_data in enumerate(entity_data_list):
+            entity_type = entity_data.get("entity_type", "unknown")
+
+            if entity_type == "email":
+                parsed = self._parse_email_params(entity_data)
+                if not parsed.get("gmail_id"):
+                    continue
+                entity, sender_relationship = self._build_email_entity(parsed, entity_data)
+                batch.append(_PendingEntity(
+                    position, entity, (sender_relationship,) if sender_relationship else ()
+                ))
+            elif entity_type == "meeting":
+                if not entity_data.get("title"):
+                    continue
+                entity, participant_relationships = self._build_meeting_entity(entity_data)
+                batch.append(_PendingEntity(position, entity, participant_relationships))
+            elif entity_type == "memory":
+                if all(entity_data.get(key) for key in MEMORY_REQUIRED_PARAMS):
+                    memories.append((position, entity_data))
+                continue
+            elif entity_type in self._entity_type_dispatch:
+                entity_ids[position] = await self.index_entity(entity_data)
+                continue
+            else:
+                entity = self._build_generic_entity(entity_data)
+                digest = self._payload_digest(entity)
+                if self._already_stored(entity_data, entity.id, digest):
+                    entity_ids[position] = entity.id
+                    continue
+                batch.append(_PendingEntity(
+                    position, entity,
+                    content_digest=None if entity_data.get("id") else digest,
+                ))
+
+            if len(batch) >= INDEX_BATCH_SIZE:
+                await self._store_batch(batch, entity_ids)
+                batch = []
+
+        if memories:
+            batch.extend(await self._build_memory_batch(memories))
+
+        for start in range(0, len(batch), INDEX_BATCH_SIZE):
+            await self._store_batch(batch[start:start + INDEX_BATCH_SIZE], entity_ids)
+
+        return entity_ids
+
+    async def _build_memory_batch(
+        self, memories: list[tuple[int, dict]]
+    ) -> list[_PendingEntity]:
+        """Build memory entities, extracting facts for all of them at once."""
+        to_extract = [params for _, params in memories if params.get("extract_facts", True)]
+        extracted = iter(await self._extract_facts_batch(to_extract))
+
+        pending = []
+        for position, params in memories:
+            facts = next(extracted) if params.get("extract_facts", True) else []
+            pending.append(_PendingEntity(position, self._build_memory_entity(params, facts)))
+        return pending
+
+    async def _store_batch(self, batch: list[_PendingEntity], entity_ids: list[str]) -> None:
+        """Store a batch of built entities, then their relationships."""
+        stored_ids = await self.data_layer.store_entities([p.entity for p in batch])
+
+        relationships = []
+        for pending, stored_id in zip(batch, stored_ids):
+            entity_ids[pending.position] = stored_id
+            if pending.content_digest is not None:
+                self._remember_stored(stored_id, pending.content_digest)
+            for relationship in pending.relationships:
+                relationship.from_id = stored_id
+                relationships.append(relationship)
+
+        if relationships:
+            await self.data_layer.create_relationships(relationships)
+
+    async def _store_with_relationships(
+        self, entity: IndexedEntity, relationships: Sequence[Relationship] = ()
+    ) -> str:
+        """Store one entity, then create its relationships in one call."""
+        stored_id = await self.data_layer.store_entity(entity)
+        for relationship in relationships:
+            relationship.from_id = stored_id
+        if relationships:
+            await self.data_layer.create_relationships(list(relationships))
+        return stored_id
+
+    def _build_generic_entity(self, entity_data: dict) -> IndexedEntity:
+        """Build an IndexedEntity from a dict with no type-specific handling."""
+        entity_type = entity_data.get("entity_type", "unknown")
+        return IndexedEntity(
+            id=entity_data.get("id") or self._content_entity_id(entity_type, entity_data),
+            entity_type=entity_type,
+            source=entity_data.get("source", "unknown"),
+            structured=entity_data.get("structured", {}),
+            analyzed=entity_data.get("analyzed", {}),
+            relationships=entity_data.get("relationships", {}),
+            embeddings=entity_data.get("embeddings", {}),
+            metadata=entity_data.get("metadata", {}),
+        )
+
+    def _content_entity_id(self, entity_type: str, entity_data: dict) -> str:
+        """
+        Derive a stable entity ID from an entity's type, source and structured data.
+
+        The same payload always gets the same ID, across runs, so
+        re-ingesting it overwrites the existing entity rather than adding a
+        duplicate.
+        """
+        canonical = json.dumps(
+            {
+                "t": entity_type,
+                "s": entity_data.get("source", ""),
+                "k": entity_data.get("structured", {}),
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        ).encode()
+        digest = hashlib.blake2b(canonical, digest_size=16).hexdigest()
+        return f"{entity_type}_{digest}"
+
+    def _payload_digest(self, entity: IndexedEntity) -> str:
+        """
+        Digest everything a store would write for an entity.
+
+        The content-hash ID only covers type, source and structured data,
+        so two payloads with the same ID can still differ in analyzed data,
+        metadata or relationships; those must be written, not skipped.
+        """
+        canonical = json.dumps(
+            {
+                "k": entity.structured,
+                "a": entity.analyzed,
+                "m": entity.metadata,
+                "r": entity.relationships,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        ).encode()
+        return hashlib.blake2b(canonical, digest_size=16).hexdigest()
+
+    def _stored_digests(self) -> OrderedDict[str, str]:
+        """
+        The stored-content cache for the currently bound data layer.
+
+        Pooled agents are rebound to a new data layer (and session) per
+        request, and a write is only durable once that session commits, so
+        entries never carry over from one data layer to the next.
+        """
+        owner = self._stored_content_owner() if self._stored_content_owner else None
+        if owner is not self.data_layer:
+            self._stored_content.clear()
+            self._stored_content_owner = weakref.ref(self.data_layer)
+        return self._stored_content
+
+    def _already_stored(self, entity_data: dict, entity_id: str, digest: str) -> bool:
+        """Check whether an identical content-hashed entity was stored recently."""
+        if entity_data.get("id"):
+            return False
+        stored = self._stored_digests()
+        if stored.get(entity_id) != digest:
+            return False
+        stored.move_to_end(entity_id)
+        return True
+
+    def _remember_stored(self, entity_id: str, digest: str) -> None:
+        """Record a stored content-hashed entity and its payload digest (bounded LRU)."""
+        stored = self._stored_digests()
+        stored[entity_id] = digest
+        stored.move_to_end(entity_id)
+        if len(stored) > STORED_CONTENT_CACHE_SIZE:
+            stored.popitem(last=False)
+
     # =========================================================================
     # Simple Capabilities
     # =========================================================================
@@ -254,13 +579,10 @@ Now analyze the conversation and extract information:"""
         """
         entity_id = params.get("entity_id")
         if not entity_id:
-            return AgentResult(
-                success=False,
-                data={},
-                errors=["entity_id is required"]
-            )
+            return AgentResult.fail("entity_id is required")
 
         deleted = await self.data_layer.delete_entity(entity_id)
+        self._stored_digests().pop(entity_id, None)
 
         return AgentResult(
             success=deleted,
@@ -287,11 +609,7 @@ Now analyze the conversation and extract information:"""
         metadata = params.get("metadata", {})
 
         if not all([from_id, to_id, rel_type]):
-            return AgentResult(
-                success=False,
-                data={},
-                errors=["from_id, to_id, and rel_type are required"]
-            )
+            return AgentResult.fail("from_id, to_id, and rel_type are required")
 
         created = await self.data_layer.create_relationship(
             from_id=from_id,
@@ -300,15 +618,12 @@ Now analyze the conversation and extract information:"""
             metadata=metadata
         )
 
-        return AgentResult(
-            success=True,
-            data={
-                "from_id": from_id,
-                "to_id": to_id,
-                "rel_type": rel_type,
-                "created": created
-            }
-        )
+        return AgentResult.ok({
+            "from_id": from_id,
+            "to_id": to_id,
+            "rel_type": rel_type,
+            "created": created
+        })
 
     async def _reindex_entity(self, params: dict) -> AgentResult:
         """
@@ -325,20 +640,12 @@ Now analyze the conversation and extract information:"""
         force_analyze = params.get("force_analyze", False)
 
         if not entity_id:
-            return AgentResult(
-                success=False,
-                data={},
-                errors=["entity_id is required"]
-            )
+            return AgentResult.fail("entity_id is required")
 
         # Get existing entity
         entity = await self.data_layer.get_entity(entity_id)
         if not entity:
-            return AgentResult(
-                success=False,
-                data={},
-                errors=[f"Entity {entity_id} not found"]
-            )
+            return AgentResult.fail(f"Entity {entity_id} not found")
 
         # Update metadata
         entity.metadata["reindexed_at"] = self._now_iso()
@@ -347,14 +654,11 @@ Now analyze the conversation and extract information:"""
         # Re-store (will regenerate embeddings)
         new_id = await self.data_layer.store_entity(entity)
 
-        return AgentResult(
-            success=True,
-            data={
-                "entity_id": new_id,
-                "reindexed": True,
-                "entity_type": entity.entity_type
-            }
-        )
+        return AgentResult.ok({
+            "entity_id": new_id,
+            "reindexed": True,
+            "entity_type": entity.entity_type
+        })
 
     # =========================================================================
     # Email Indexing
@@ -384,33 +688,58 @@ Now analyze the conversation and extract information:"""
             category: str - Pre-determined category
             priority: str - Pre-determined priority
         """
+        parsed = self._parse_email_params(params)
+
+        if not parsed.get("gmail_id"):
+            return AgentResult.fail("gmail_id is required")
+
+        entity, sender_relationship = self._build_email_entity(parsed, params)
+
+        # Store entity (auto-creates embedding) and the relationship to the
+        # sender contact if identifiable
+        stored_id = await self._store_with_relationships(
+            entity, (sender_relationship,) if sender_relationship else ()
+        )
+
+        logger.info("Indexed email %s", stored_id)
+
+        return AgentResult.ok({
+            "entity_id": stored_id,
+            "gmail_id": parsed["gmail_id"],
+            "subject": parsed.get("subject"),
+            "indexed": True
+        })
+
+    def _parse_email_params(self, params: dict) -> dict:
+        """Get the structured email fields from raw Gmail data or pre-parsed params."""
         # Handle raw Gmail API data
         email_data = params.get("email_data")
         if email_data:
-            parsed = self._parse_gmail_response(email_data)
-        else:
-            parsed = {
-                "gmail_id": params.get("gmail_id"),
-                "thread_id": params.get("thread_id"),
-                "subject": params.get("subject", "(No Subject)"),
-                "sender_email": params.get("sender_email"),
-                "sender_name": params.get("sender_name"),
-                "to_emails": params.get("to_emails", []),
-                "cc_emails": params.get("cc_emails", []),
-                "body_text": params.get("body_text"),
-                "snippet": params.get("snippet"),
-                "received_at": params.get("received_at"),
-                "labels": params.get("labels", []),
-                "has_attachments": params.get("has_attachments", False),
-            }
+            return self._parse_gmail_response(email_data)
+        return {
+            "gmail_id": params.get("gmail_id"),
+            "thread_id": params.get("thread_id"),
+            "subject": params.get("subject", "(No Subject)"),
+            "sender_email": params.get("sender_email"),
+            "sender_name": params.get("sender_name"),
+            "to_emails": params.get("to_emails", []),
+            "cc_emails": params.get("cc_emails", []),
+            "body_text": params.get("body_text"),
+            "snippet": params.get("snippet"),
+            "received_at": params.get("received_at"),
+            "labels": params.get("labels", []),
+            "has_attachments": params.get("has_attachments", False),
+        }
 
-        if not parsed.get("gmail_id"):
-            return AgentResult(
-                success=False,
-                data={},
-                errors=["gmail_id is required"]
-            )
+    def _build_email_entity(
+        self, parsed: dict, params: dict
+    ) -> tuple[IndexedEntity, Relationship | None]:
+        """
+        Build an email entity and its sender relationship without storing them.
 
+        The relationship's from_id is the entity's ID; callers should use
+        the ID returned by the data layer when creating it.
+        """
         entity_id = self._generate_entity_id("email", parsed["gmail_id"])
 
         # Build analyzed section
@@ -439,35 +768,21 @@ Now analyze the conversation and extract information:"""
             }
         )
 
-        # Store entity (auto-creates embedding)
-        stored_id = await self.data_layer.store_entity(entity)
-
-        # Create relationship to sender contact if identifiable
+        # Relationship to sender contact if identifiable
+        sender_relationship = None
         if parsed.get("sender_email"):
-            contact_id = f"contact_{parsed['sender_email'].lower().replace('@', '_at_').replace('.', '_')}"
-            await self.data_layer.create_relationship(
-                from_id=stored_id,
+            contact_id = _contact_id(parsed["sender_email"])
+            sender_relationship = Relationship(
+                from_id=entity_id,
                 to_id=contact_id,
                 rel_type="received_from",
                 metadata={"sender_name": parsed.get("sender_name")}
             )
 
-        logger.info(f"Indexed email {stored_id}")
-
-        return AgentResult(
-            success=True,
-            data={
-                "entity_id": stored_id,
-                "gmail_id": parsed["gmail_id"],
-                "subject": parsed.get("subject"),
-                "indexed": True
-            }
-        )
+        return entity, sender_relationship
 
     def _parse_gmail_response(self, email_data: dict) -> dict:
         """Parse Gmail API response into structured format."""
-        import base64
-
         gmail_id = email_data.get("id")
         thread_id = email_data.get("threadId", "")
 
@@ -480,12 +795,12 @@ Now analyze the conversation and extract information:"""
         from_header = headers.get("from", "")
         sender_email, sender_name = self._parse_email_address(from_header)
 
-        # Extract body
-        body_text = self._extract_body(email_data.get("payload", {}))
+        # Extract body and attachment flag in one walk of the MIME tree
+        body_text, has_attachments = self._walk_payload(email_data.get("payload", {}))
 
         # Parse received date
-        internal_date = int(email_data.get("internalDate", 0)) / 1000
-        received_at = datetime.fromtimestamp(internal_date).isoformat() if internal_date else None
+        internal_date = int(email_data.get("internalDate", 0))
+        received_at = _from_gmail_internal_date(internal_date).isoformat() if internal_date else None
 
         return {
             "gmail_id": gmail_id,
@@ -499,54 +814,49 @@ Now analyze the conversation and extract information:"""
             "snippet": email_data.get("snippet"),
             "received_at": received_at,
             "labels": email_data.get("labelIds", []),
-            "has_attachments": self._has_attachments(email_data.get("payload", {})),
+            "has_attachments": has_attachments,
             "history_id": email_data.get("historyId"),
         }
 
     def _parse_email_address(self, header: str) -> tuple[str, str | None]:
         """Parse email address from header like 'Name <email@example.com>'."""
-        import re
-        match = re.match(r"^(.+?)\s*<(.+?)>$", header.strip())
-        if match:
-            return match.group(2), match.group(1).strip('"')
-        return header.strip(), None
+        name, address = parseaddr(header)
+        return address, name or None
 
     def _parse_email_list(self, header: str) -> list[str]:
-        """Parse comma-separated email addresses."""
+        """Parse the addresses out of a To/Cc header."""
         if not header:
             return []
-        return [e.strip() for e in header.split(",") if e.strip()]
+        return [address for _, address in getaddresses([header]) if address]
 
-    def _extract_body(self, payload: dict) -> str | None:
-        """Extract plain text body from email payload."""
-        import base64
-
-        mime_type = payload.get("mimeType", "")
+    def _walk_payload(self, payload: dict) -> tuple[str | None, bool]:
+        """
+        Extract the plain text body and detect attachments in one pass.
 
-        if mime_type == "text/plain":
-            data = payload.get("body", {}).get("data", "")
-            if data:
-                return base64.urlsafe_b64decode(data).decode("utf-8", errors="ignore")
+        Walks the MIME tree iteratively in document order, so the body is the
+        first text/plain part, and stops as soon as both answers are known.
 
-        for part in payload.get("parts", []):
-            if part.get("mimeType") == "text/plain":
+        Returns:
+            Tuple of (body_text, has_attachments)
+        """
+        b64decode = base64.urlsafe_b64decode
+        body_text = None
+        has_attachments = False
+        pending = deque([payload])
+        while pending:
+            part = pending.popleft()
+            if body_text is None and part.get("mimeType") == "text/plain":
                 data = part.get("body", {}).get("data", "")
                 if data:
-                    return base64.urlsafe_b64decode(data).decode("utf-8", errors="ignore")
-            body = self._extract_body(part)
-            if body:
-                return body
-
-        return None
-
-    def _has_attachments(self, payload: dict) -> bool:
-        """Check if email has attachments."""
-        for part in payload.get("parts", []):
-            if part.get("filename"):
-                return True
-            if self._has_attachments(part):
-                return True
-        return False
+                    body_text = b64decode(data).decode("utf-8", errors="ignore")
+            children = part.get("parts", [])
+            if not has_attachments:
+                has_attachments = any(child.get("filename") for child in children)
+            if body_text is not None and has_attachments:
+                break
+            # Children go to the front, in order, so the walk stays depth-first
+            pending.extendleft(reversed(children))
+        return body_text, has_attachments
 
     # =========================================================================
     # Contact Indexing
@@ -568,27 +878,20 @@ Now analyze the conversation and extract information:"""
         """
         email = params.get("email")
         if not email:
-            return AgentResult(
-                success=False,
-                data={},
-                errors=["email is required for contact"]
-            )
+            return AgentResult.fail("email is required for contact")
 
         # Generate consistent contact ID from email
-        email_normalized = email.lower().replace("@", "_at_").replace(".", "_")
-        entity_id = f"contact_{email_normalized}"
-
-        structured = {
-            "email": email.lower(),
-            "name": params.get("name"),
-            "company": params.get("company"),
-            "role": params.get("role"),
-            "phone": params.get("phone"),
-            "category": params.get("category", "external"),
-        }
-
-        # Remove None values
-        structured = {k: v for k, v in structured.items() if v is not None}
+        entity_id = _contact_id(email)
+
+        # Only fields that were given (None values are left out)
+        structured = {"email": email.lower()}
+        for field in CONTACT_FIELDS:
+            value = params.get(field)
+            if value is not None:
+                structured[field] = value
+        category = params.get("category", "external")
+        if category is not None:
+            structured["category"] = category
 
         entity = IndexedEntity(
             id=entity_id,
@@ -606,30 +909,26 @@ Now analyze the conversation and extract information:"""
             }
         )
 
-        stored_id = await self.data_layer.store_entity(entity)
-
         # Create reports_to relationship if specified
+        relationships = []
         if params.get("reports_to"):
             supervisor = params["reports_to"]
             if not supervisor.startswith("contact_"):
-                supervisor = f"contact_{supervisor.lower().replace('@', '_at_').replace('.', '_')}"
-            await self.data_layer.create_relationship(
-                from_id=stored_id,
-                to_id=supervisor,
-                rel_type="reports_to"
+                supervisor = _contact_id(supervisor)
+            relationships.append(
+                Relationship(from_id=entity_id, to_id=supervisor, rel_type="reports_to")
             )
 
-        logger.info(f"Indexed contact {stored_id}")
+        stored_id = await self._store_with_relationships(entity, relationships)
 
-        return AgentResult(
-            success=True,
-            data={
-                "entity_id": stored_id,
-                "email": email,
-                "name": params.get("name"),
-                "indexed": True
-            }
-        )
+        logger.info("Indexed contact %s", stored_id)
+
+        return AgentResult.ok({
+            "entity_id": stored_id,
+            "email": email,
+            "name": params.get("name"),
+            "indexed": True
+        })
 
     # =========================================================================
     # Memory Indexing
@@ -651,30 +950,60 @@ Now analyze the conversation and extract information:"""
             turn_number: int (optional)
             extract_facts: bool (optional, default True)
         """
-        conversation_id = params.get("conversation_id")
-        user_message = params.get("user_message")
-        sage_response = params.get("sage_response")
-
-        if not all([conversation_id, user_message, sage_response]):
-            return AgentResult(
-                success=False,
-                data={},
-                errors=["conversation_id, user_message, and sage_response are required"]
-            )
+        if not all(params.get(key) for key in MEMORY_REQUIRED_PARAMS):
+            return AgentResult.fail("conversation_id, user_message, and sage_response are required")
+
+        facts = []
+        # Extract facts if requested
+        if params.get("extract_facts", True):
+            try:
+                facts_result = await self._extract_facts({
+                    "user_message": params["user_message"],
+                    "sage_response": params["sage_response"],
+                    "context": {"conversation_id": params["conversation_id"]}
+                })
+                if facts_result.success:
+                    facts = facts_result.data.get("facts") or []
+            except Exception as e:
+                logger.warning("Fact extraction failed for memory: %s", e)
+
+        entity = self._build_memory_entity(params, facts)
+        analyzed = entity.analyzed
+
+        stored_id = await self.data_layer.store_entity(entity)
+
+        logger.info("Indexed memory %s with %d facts", stored_id, len(analyzed["facts_extracted"]))
+
+        return AgentResult.ok({
+            "entity_id": stored_id,
+            "conversation_id": params["conversation_id"],
+            "facts_extracted": len(analyzed.get("facts_extracted", [])),
+            "importance": analyzed.get("importance"),
+            "indexed": True
+        })
+
+    def _build_memory_entity(self, params: dict, facts: list[dict]) -> IndexedEntity:
+        """Build a memory IndexedEntity from index_memory params and its facts."""
+        conversation_id = params["conversation_id"]
+        now = self._now_iso()
+        timestamp = params.get("timestamp", now)
 
-        timestamp = params.get("timestamp", self._now_iso())
         turn_number = params.get("turn_number", 0)
 
-        # Generate memory ID
-        ts_suffix = timestamp.replace(":", "").replace("-", "").replace("T", "_")[:15]
-        entity_id = f"memory_{conversation_id}_{ts_suffix}"
+        # Memory ID from a hash of the full timestamp and turn, so two turns
+        # in the same second don't collide and a retried exchange (same
+        # timestamp) keeps its ID
+        key = hashlib.blake2b(
+            f"{conversation_id}|{timestamp}|{turn_number}".encode(), digest_size=8
+        ).hexdigest()
+        entity_id = f"memory_{conversation_id}_{key}"
 
         structured = {
             "conversation_id": conversation_id,
             "timestamp": timestamp,
             "turn_number": turn_number,
-            "user_message": user_message,
-            "sage_response": sage_response,
+            "user_message": params["user_message"],
+            "sage_response": params["sage_response"],
         }
 
         analyzed = {
@@ -683,29 +1012,19 @@ Now analyze the conversation and extract information:"""
             "facts_extracted": [],
             "entities_mentioned": [],
         }
-
-        # Extract facts if requested
-        if params.get("extract_facts", True):
-            try:
-                facts_result = await self._extract_facts({
-                    "user_message": user_message,
-                    "sage_response": sage_response,
-                    "context": {"conversation_id": conversation_id}
-                })
-                if facts_result.success and facts_result.data.get("facts"):
-                    analyzed["facts_extracted"] = facts_result.data["facts"]
-                    analyzed["entities_mentioned"] = list(set(
-                        entity
-                        for fact in facts_result.data["facts"]
-                        for entity in fact.get("entities_mentioned", [])
-                    ))
-                    # Upgrade importance if significant facts found
-                    if any(f.get("confidence", 0) > 0.8 for f in facts_result.data["facts"]):
-                        analyzed["importance"] = "high"
-            except Exception as e:
-                logger.warning(f"Fact extraction failed for memory: {e}")
-
-        entity = IndexedEntity(
+        if facts:
+            analyzed["facts_extracted"] = facts
+            # Deduplicated, in order of first mention
+            analyzed["entities_mentioned"] = list(dict.fromkeys(
+                entity
+                for fact in facts
+                for entity in fact.get("entities_mentioned", [])
+            ))
+            # Upgrade importance if significant facts found
+            if any(f.get("confidence", 0) > 0.8 for f in facts):
+                analyzed["importance"] = "high"
+
+        return IndexedEntity(
             id=entity_id,
             entity_type="memory",
             source="conversation",
@@ -716,26 +1035,11 @@ Now analyze the conversation and extract information:"""
             },
             embeddings={},
             metadata={
-                "indexed_at": self._now_iso(),
+                "indexed_at": now,
                 "index_version": 1
             }
         )
 
-        stored_id = await self.data_layer.store_entity(entity)
-
-        logger.info(f"Indexed memory {stored_id} with {len(analyzed.get('facts_extracted', []))} facts")
-
-        return AgentResult(
-            success=True,
-            data={
-                "entity_id": stored_id,
-                "conversation_id": conversation_id,
-                "facts_extracted": len(analyzed.get("facts_extracted", [])),
-                "importance": analyzed.get("importance"),
-                "indexed": True
-            }
-        )
-
     # =========================================================================
     # Fact Extraction
     # =========================================================================
@@ -755,18 +1059,18 @@ Now analyze the conversation and extract information:"""
         sage_response = params.get("sage_response", "")
 
         if not user_message and not sage_response:
-            return AgentResult(
-                success=False,
-                data={},
-                errors=["user_message or sage_response is required"]
-            )
+            return AgentResult.fail("user_message or sage_response is required")
 
         # Skip extraction for very short exchanges
-        if len(user_message) + len(sage_response) < 50:
-            return AgentResult(
-                success=True,
-                data={"facts": [], "skipped": True, "reason": "too_short"}
-            )
+        if len(user_message) + len(sage_response) < MIN_FACT_EXCHANGE_LENGTH:
+            return AgentResult.ok({"facts": [], "skipped": True, "reason": "too_short"})
+        if not self._looks_fact_bearing(user_message, sage_response):
+            return AgentResult.ok({"facts": [], "skipped": True, "reason": "no_signal"})
+
+        cache_key = self._fact_cache_key(user_message, sage_response)
+        cached = self._cached_facts(cache_key)
+        if cached is not None:
+            return AgentResult.ok({"facts": cached, "count": len(cached), "cached": True})
 
         try:
             claude = await self._get_claude()
@@ -777,55 +1081,168 @@ Now analyze the conversation and extract information:"""
             )
 
             response = await claude.messages.create(
-                model="claude-sonnet-4-20250514",
+                model=FACT_EXTRACTION_MODEL,
                 max_tokens=1024,
+                system=self._cached_system(self.FACT_EXTRACTION_SYSTEM),
                 messages=[{"role": "user", "content": prompt}]
             )
 
-            # Parse JSON response
-            response_text = response.content[0].text.strip()
-
-            # Handle markdown code blocks
-            if response_text.startswith("```"):
-                lines = response_text.split("\n")
-                response_text = "\n".join(lines[1:-1])
-
-            import json
-            facts = json.loads(response_text)
-
-            # Validate and filter facts
-            valid_facts = []
-            for fact in facts:
-                if isinstance(fact, dict) and fact.get("content"):
-                    valid_facts.append({
-                        "type": fact.get("type", "fact"),
-                        "content": fact["content"],
-                        "confidence": float(fact.get("confidence", 0.5)),
-                        "entities_mentioned": fact.get("entities_mentioned", [])
-                    })
-
-            return AgentResult(
-                success=True,
-                data={
-                    "facts": valid_facts,
-                    "count": len(valid_facts)
-                }
-            )
+            facts = self._parse_claude_json(response)
+            valid_facts = self._validate_facts(facts)
+            self._cache_facts(cache_key, valid_facts)
+
+            return AgentResult.ok({
+                "facts": valid_facts,
+                "count": len(valid_facts)
+            })
 
         except json.JSONDecodeError as e:
-            logger.warning(f"Failed to parse fact extraction response: {e}")
-            return AgentResult(
-                success=True,
-                data={"facts": [], "parse_error": str(e)}
-            )
+            logger.warning("Failed to parse fact extraction response: %s", e)
+            return AgentResult.ok({"facts": [], "parse_error": str(e)})
         except Exception as e:
-            logger.error(f"Fact extraction error: {e}")
-            return AgentResult(
-                success=False,
-                data={},
-                errors=[f"Fact extraction failed: {str(e)}"]
+            logger.error("Fact extraction error: %s", e)
+            return AgentResult.fail(f"Fact extraction failed: {str(e)}")
+
+    async def _extract_facts_batch(self, exchanges: list[dict]) -> list[list[dict]]:
+        """
+        Extract facts from several exchanges, FACT_BATCH_SIZE per Claude call.
+
+        Used by index_entities so a memory backfill makes one extraction
+        call per few exchanges instead of one per exchange. Interactive
+        extraction keeps going through _extract_facts.
+
+        Args:
+            exchanges: Dicts with user_message and sage_response
+
+        Returns:
+            The validated facts for each exchange, in order. Short exchanges,
+            exchanges with no sign of facts, and every exchange in a call
+            that fails, get an empty list.
+            Exchanges already in the fact cache are not sent to Claude.
+        """
+        results: list[list[dict]] = [[] for _ in exchanges]
+        cache_keys: dict[int, str] = {}
+        to_extract = []
+        for i, exchange in enumerate(exchanges):
+            user_message = exchange.get("user_message") or ""
+            sage_response = exchange.get("sage_response") or ""
+            if len(user_message) + len(sage_response) < MIN_FACT_EXCHANGE_LENGTH:
+                continue
+            if not self._looks_fact_bearing(user_message, sage_response):
+                continue
+            cache_keys[i] = self._fact_cache_key(user_message, sage_response)
+            cached = self._cached_facts(cache_keys[i])
+            if cached is not None:
+                results[i] = cached
+            else:
+                to_extract.append(i)
+        if not to_extract:
+            return results
+
+        claude = await self._get_claude()
+
+        for start in range(0, len(to_extract), FACT_BATCH_SIZE):
+            chunk = to_extract[start:start + FACT_BATCH_SIZE]
+            prompt = "\n\n".join(
+                self.FACT_EXTRACTION_BATCH_ITEM.format(
+                    number=number,
+                    user_message=exchanges[i].get("user_message") or "",
+                    sage_response=exchanges[i].get("sage_response") or "",
+                )
+                for number, i in enumerate(chunk, start=1)
             )
 
+            try:
+                response = await claude.messages.create(
+                    model=FACT_EXTRACTION_MODEL,
+                    max_tokens=1024 * len(chunk),
+                    system=self._cached_system(self.FACT_EXTRACTION_BATCH_SYSTEM),
+                    messages=[{"role": "user", "content": prompt}]
+                )
+                facts_by_number = self._parse_claude_json(response)
+                if not isinstance(facts_by_number, dict):
+                    raise ValueError("expected a JSON object keyed by exchange number")
+                for number, i in enumerate(chunk, start=1):
+                    results[i] = self._validate_facts(facts_by_number.get(str(number), []))
+                    self._cache_facts(cache_keys[i], results[i])
+            except Exception as e:
+                logger.warning("Batch fact extraction failed for %d exchanges: %s", len(chunk), e)
+
+        return results
+
+    def _looks_fact_bearing(self, user_message: str, sage_response: str) -> bool:
+        """Check an exchange for any sign of extractable facts (see _FACT_SIGNAL_RE)."""
+        self._fact_signal_checks += 1
+        if _FACT_SIGNAL_RE.search(user_message) or _FACT_SIGNAL_RE.search(sage_response):
+            return True
+        self._fact_signal_skips += 1
+        logger.debug(
+            "Skipped fact extraction with no signal (%d of %d exchanges skipped)",
+            self._fact_signal_skips, self._fact_signal_checks,
+        )
+        return False
+
+    def get_fact_filter_stats(self) -> dict:
+        """Get how often the fact signal filter spared a Claude call."""
+        checks = self._fact_signal_checks
+        return {
+            "checked": checks,
+            "skipped": self._fact_signal_skips,
+            "skip_rate": self._fact_signal_skips / checks if checks else 0.0,
+        }
+
+    def _fact_cache_key(self, user_message: str, sage_response: str) -> str:
+        """Hash an exchange's text into a fact cache key."""
+        content = f"{user_message}\x1f{sage_response}".encode()
+        return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+    def _cached_facts(self, key: str) -> list[dict] | None:
+        """Look up previously extracted facts for an exchange."""
+        facts = self._fact_cache.get(key)
+        if facts is None:
+            return None
+        self._fact_cache.move_to_end(key)
+        return list(facts)
+
+    def _cache_facts(self, key: str, facts: list[dict]) -> None:
+        """Remember the facts extracted from an exchange (bounded LRU)."""
+        self._fact_cache[key] = list(facts)
+        self._fact_cache.move_to_end(key)
+        if len(self._fact_cache) > FACT_CACHE_SIZE:
+            self._fact_cache.popitem(last=False)
+
+    def _cached_system(self, text: str) -> list[dict]:
+        """Wrap a system prompt so Anthropic caches it as a prompt prefix."""
+        return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+
+    def _parse_claude_json(self, response) -> Any:
+        """Parse the JSON in a Claude response, allowing a markdown code block."""
+        response_text = response.content[0].text.strip()
+
+        # Handle markdown code blocks: drop the fence line (and any language
+        # tag), then everything from the closing fence on
+        if response_text.startswith("```"):
+            body = response_text.partition("\n")[2]
+            content, fence, _ = body.rpartition("```")
+            response_text = content if fence else body
+
+        return json.loads(response_text)
+
+    def _validate_facts(self, facts: Any) -> list[dict]:
+        """Keep well-formed extracted facts, filling in defaults."""
+        if not isinstance(facts, list):
+            return []
+        return [
+            {
+                "type": fact.get("type", "fact"),
+                "content": fact["content"],
+                "confidence": float(fact.get("confidence", 0.5)),
+                "entities_mentioned": fact.get("entities_mentioned", [])
+            }
+            for fact in facts
+            if isinstance(fact, dict) and fact.get("content")
+        ]
+
     # =========================================================================
     # Fact Supersession
     # =========================================================================
@@ -847,28 +1264,22 @@ Now analyze the conversation and extract information:"""
         reason = params.get("reason", "")
 
         if not old_fact_id or not new_fact_id:
-            return AgentResult(
-                success=False,
-                data={},
-                errors=["old_fact_id and new_fact_id are required"]
-            )
+            return AgentResult.fail("old_fact_id and new_fact_id are required")
+
+        now = self._now_iso()
 
         # Update old fact metadata
         old_update_success = await self.data_layer.update_entity(old_fact_id, {
             "metadata": {
                 "superseded_by": new_fact_id,
-                "superseded_at": self._now_iso(),
+                "superseded_at": now,
                 "supersession_reason": reason,
                 "is_current": False
             }
         })
 
         if not old_update_success:
-            return AgentResult(
-                success=False,
-                data={},
-                errors=[f"Old fact {old_fact_id} not found"]
-            )
+            return AgentResult.fail(f"Old fact {old_fact_id} not found")
 
         # Update new fact metadata
         await self.data_layer.update_entity(new_fact_id, {
@@ -883,20 +1294,82 @@ Now analyze the conversation and extract information:"""
             from_id=new_fact_id,
             to_id=old_fact_id,
             rel_type="supersedes",
-            metadata={"reason": reason, "superseded_at": self._now_iso()}
+            metadata={"reason": reason, "superseded_at": now}
         )
 
-        logger.info(f"Fact {old_fact_id} superseded by {new_fact_id}")
+        logger.info("Fact %s superseded by %s", old_fact_id, new_fact_id)
 
-        return AgentResult(
-            success=True,
-            data={
-                "old_fact_id": old_fact_id,
-                "new_fact_id": new_fact_id,
-                "reason": reason,
-                "superseded": True
-            }
-        )
+        return AgentResult.ok({
+            "old_fact_id": old_fact_id,
+            "new_fact_id": new_fact_id,
+            "reason": reason,
+            "superseded": True
+        })
+
+    async def _supersede_facts(self, params: dict) -> AgentResult:
+        """
+        Apply many fact supersessions as one batch.
+
+        Re-indexing a contact or conversation tends to supersede facts in
+        waves; this loads and updates the old facts together, then the new
+        facts, then creates all the supersedes relationships at once.
+
+        Expected params:
+            pairs: list[dict] - Each with old_fact_id, new_fact_id and an
+                optional reason, as for supersede_fact
+        """
+        pairs = params.get("pairs") or []
+        if any(not p.get("old_fact_id") or not p.get("new_fact_id") for p in pairs):
+            return AgentResult.fail("Each pair requires old_fact_id and new_fact_id")
+
+        now = self._now_iso()
+
+        # Update old facts; a pair whose old fact is missing is skipped
+        old_found = await self.data_layer.update_entities([
+            (p["old_fact_id"], {
+                "metadata": {
+                    "superseded_by": p["new_fact_id"],
+                    "superseded_at": now,
+                    "supersession_reason": p.get("reason", ""),
+                    "is_current": False
+                }
+            })
+            for p in pairs
+        ])
+        applied = [p for p, found in zip(pairs, old_found) if found]
+        not_found = [p["old_fact_id"] for p, found in zip(pairs, old_found) if not found]
+
+        # Update new facts
+        await self.data_layer.update_entities([
+            (p["new_fact_id"], {
+                "metadata": {
+                    "supersedes": p["old_fact_id"],
+                    "is_current": True
+                }
+            })
+            for p in applied
+        ])
+
+        # Create supersession relationships
+        await self.data_layer.create_relationships([
+            Relationship(
+                from_id=p["new_fact_id"],
+                to_id=p["old_fact_id"],
+                rel_type="supersedes",
+                metadata={"reason": p.get("reason", ""), "superseded_at": now}
+            )
+            for p in applied
+        ])
+
+        logger.info("Superseded %d facts (%d not found)", len(applied), len(not_found))
+
+        return AgentResult.ok({
+            "superseded": [
+                {"old_fact_id": p["old_fact_id"], "new_fact_id": p["new_fact_id"]}
+                for p in applied
+            ],
+            "not_found": not_found,
+        })
 
     # =========================================================================
     # Meeting Indexing
@@ -917,23 +1390,43 @@ Now analyze the conversation and extract information:"""
             source: str (optional) - "fireflies", "plaud", "manual"
         """
         title = params.get("title")
-        date = params.get("date")
-        participants = params.get("participants", [])
 
         if not title:
-            return AgentResult(
-                success=False,
-                data={},
-                errors=["title is required for meeting"]
-            )
+            return AgentResult.fail("title is required for meeting")
+
+        entity, participant_relationships = self._build_meeting_entity(params)
+
+        # Store with relationships to participant contacts
+        stored_id = await self._store_with_relationships(entity, participant_relationships)
+
+        logger.info("Indexed meeting %s", stored_id)
+
+        return AgentResult.ok({
+            "entity_id": stored_id,
+            "meeting_id": entity.structured["meeting_id"],
+            "title": title,
+            "participants": len(participant_relationships),
+            "indexed": True
+        })
+
+    def _build_meeting_entity(
+        self, params: dict
+    ) -> tuple[IndexedEntity, list[Relationship]]:
+        """
+        Build a meeting entity and its participant relationships without storing them.
 
-        meeting_id = params.get("meeting_id", uuid.uuid4().hex[:12])
+        The relationships' from_id is the entity's ID; callers should use
+        the ID returned by the data layer when creating them.
+        """
+        participants = params.get("participants", [])
+        meeting_id = params.get("meeting_id") or _short_id()
         entity_id = f"meeting_{meeting_id}"
+        now = self._now_iso()
 
         structured = {
             "meeting_id": meeting_id,
-            "title": title,
-            "date": date or self._now_iso(),
+            "title": params["title"],
+            "date": params.get("date") or now,
             "participants": participants,
             "transcript": params.get("transcript"),
             "duration_minutes": params.get("duration_minutes"),
@@ -954,34 +1447,15 @@ Now analyze the conversation and extract information:"""
             relationships={},
             embeddings={},
             metadata={
-                "indexed_at": self._now_iso(),
+                "indexed_at": now,
                 "index_version": 1
             }
         )
-
-        stored_id = await self.data_layer.store_entity(entity)
-
-        # Create relationships to participant contacts
-        for participant_email in participants:
-            contact_id = f"contact_{participant_email.lower().replace('@', '_at_').replace('.', '_')}"
-            await self.data_layer.create_relationship(
-                from_id=stored_id,
-                to_id=contact_id,
-                rel_type="has_participant"
-            )
-
-        logger.info(f"Indexed meeting {stored_id}")
-
-        return AgentResult(
-            success=True,
-            data={
-                "entity_id": stored_id,
-                "meeting_id": meeting_id,
-                "title": title,
-                "participants": len(participants),
-                "indexed": True
-            }
-        )
+        relationships = [
+            Relationship(from_id=entity_id, to_id=_contact_id(email), rel_type="has_participant")
+            for email in participants
+        ]
+        return entity, relationships
 
     # =========================================================================
     # Event Indexing
@@ -1005,14 +1479,14 @@ Now analyze the conversation and extract information:"""
         start_time = params.get("start_time")
 
         if not title or not start_time:
-            return AgentResult(
-                success=False,
-                data={},
-                errors=["title and start_time are required for event"]
-            )
+            return AgentResult.fail("title and start_time are required for event")
 
-        event_id = params.get("event_id", uuid.uuid4().hex[:12])
+        event_id = params.get("event_id") or _short_id()
         entity_id = f"event_{event_id}"
+        attendees = params.get("attendees", [])
+        # Canonical contact IDs, stored on the event so lookups by contact
+        # can match the structured JSONB directly instead of re-deriving them
+        attendee_contact_ids = [_contact_id(email) for email in attendees]
 
         structured = {
             "event_id": event_id,
@@ -1021,7 +1495,8 @@ Now analyze the conversation and extract information:"""
             "end_time": params.get("end_time"),
             "location": params.get("location"),
             "description": params.get("description"),
-            "attendees": params.get("attendees", []),
+            "attendees": attendees,
+            "attendee_contact_ids": attendee_contact_ids,
             "calendar_id": params.get("calendar_id", "primary"),
             "is_all_day": params.get("is_all_day", False),
         }
@@ -1040,29 +1515,21 @@ Now analyze the conversation and extract information:"""
             }
         )
 
-        stored_id = await self.data_layer.store_entity(entity)
-
-        # Create relationships to attendee contacts
-        for attendee_email in params.get("attendees", []):
-            contact_id = f"contact_{attendee_email.lower().replace('@', '_at_').replace('.', '_')}"
-            await self.data_layer.create_relationship(
-                from_id=stored_id,
-                to_id=contact_id,
-                rel_type="has_attendee"
-            )
+        # Store with relationships to attendee contacts
+        stored_id = await self._store_with_relationships(entity, [
+            Relationship(from_id=entity_id, to_id=contact_id, rel_type="has_attendee")
+            for contact_id in attendee_contact_ids
+        ])
 
-        logger.info(f"Indexed event {stored_id}")
+        logger.info("Indexed event %s", stored_id)
 
-        return AgentResult(
-            success=True,
-            data={
-                "entity_id": stored_id,
-                "event_id": event_id,
-                "title": title,
-                "start_time": start_time,
-                "indexed": True
-            }
-        )
+        return AgentResult.ok({
+            "entity_id": stored_id,
+            "event_id": event_id,
+            "title": title,
+            "start_time": start_time,
+            "indexed": True
+        })
 
     # =========================================================================
     # Document Indexing (Stub)
@@ -1085,11 +1552,7 @@ Now analyze the conversation and extract information:"""
         file_name = params.get("file_name")
 
         if not drive_file_id or not file_name:
-            return AgentResult(
-                success=False,
-                data={},
-                errors=["drive_file_id and file_name are required"]
-            )
+            return AgentResult.fail("drive_file_id and file_name are required")
 
         entity_id = f"document_{drive_file_id}"
 
@@ -1116,14 +1579,11 @@ Now analyze the conversation and extract information:"""
 
         stored_id = await self.data_layer.store_entity(entity)
 
-        logger.info(f"Indexed document {stored_id}")
+        logger.info("Indexed document %s", stored_id)
 
-        return AgentResult(
-            success=True,
-            data={
-                "entity_id": stored_id,
-                "drive_file_id": drive_file_id,
-                "file_name": file_name,
-                "indexed": True
-            }
-        )
+        return AgentResult.ok({
+            "entity_id": stored_id,
+            "drive_file_id": drive_file_id,
+            "file_name": file_name,
+            "indexed": True
+        })
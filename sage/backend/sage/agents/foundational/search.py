@@ -12,8 +12,12 @@ It retrieves relevant context for any task:
 See sage-agent-architecture.md Section 3.1 for specifications.
 """
 
+import inspect
 import logging
 import re
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -22,6 +26,7 @@ from ..base import (
     AgentResult,
     AgentType,
     SearchContext,
+    ContextRequest,
     DataLayerInterface,
     SearchResult,
     IndexedEntity,
@@ -30,6 +35,121 @@ from ..base import (
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class EnrichmentQuery:
+    """
+    One structured query in an agent's enrichment plan.
+
+    The filters dict is shared by every request that runs the plan, so
+    data layer adapters must treat it as read-only.
+    """
+
+    entity_type: str
+    filters: dict[str, Any]
+    limit: int | None = None  # Fixed limit; None scales the request's max_results
+    scale: int = 1
+
+
+_ACTIVE_FOLLOWUPS = {"status": ["pending", "reminded", "escalated"]}
+_UNREAD_EMAILS = {"is_unread": True}
+_ANY: dict[str, Any] = {}
+
+# Requesting agent -> structured queries that enrich its context, in order.
+# Built once at import rather than per request.
+ENRICHMENT_PLANS: dict[str, tuple[EnrichmentQuery, ...]] = {
+    # General chat gets balanced context - emails, followups
+    "chat": (
+        EnrichmentQuery("email", _UNREAD_EMAILS),
+        EnrichmentQuery("followup", _ACTIVE_FOLLOWUPS),
+    ),
+    # Email-focused: unread then recent emails at double the limit,
+    # light followup context
+    "chat_email": (
+        EnrichmentQuery("email", _UNREAD_EMAILS, scale=2),
+        EnrichmentQuery("email", _ANY, scale=2),
+        EnrichmentQuery("followup", _ACTIVE_FOLLOWUPS, limit=5),
+    ),
+    "chat_followup": (
+        EnrichmentQuery("followup", _ACTIVE_FOLLOWUPS, scale=2),
+        EnrichmentQuery("email", _UNREAD_EMAILS, limit=5),
+    ),
+    "chat_meeting": (
+        EnrichmentQuery("meeting", _ANY, scale=2),
+        EnrichmentQuery("followup", _ACTIVE_FOLLOWUPS, limit=5),
+    ),
+    # Contacts mostly come from semantic search; add VIPs, plus emails and
+    # followups to show interaction history
+    "chat_contact": (
+        EnrichmentQuery("contact", {"is_vip": True}, scale=2),
+        EnrichmentQuery("email", _ANY, limit=10),
+        EnrichmentQuery("followup", _ACTIVE_FOLLOWUPS, limit=10),
+    ),
+    # Todos live outside the entity system; meetings (a primary source of
+    # action items) and followups stand in for them
+    "chat_todo": (
+        EnrichmentQuery("meeting", _ANY),
+        EnrichmentQuery("followup", _ACTIVE_FOLLOWUPS),
+        EnrichmentQuery("email", _UNREAD_EMAILS, limit=5),
+    ),
+    "followup": (
+        EnrichmentQuery("followup", _ACTIVE_FOLLOWUPS),
+    ),
+    "email": (
+        EnrichmentQuery("email", _UNREAD_EMAILS),
+    ),
+    # Briefings: high-priority emails and overdue followups
+    "briefing": (
+        EnrichmentQuery("email", {"priority": ["urgent", "high"]}, limit=10),
+        EnrichmentQuery("followup", _ACTIVE_FOLLOWUPS, limit=10),
+    ),
+    "meeting": (
+        EnrichmentQuery("meeting", _ANY),
+    ),
+}
+
+# Entity type -> the SearchContext list its entities are collected in
+_CONTEXT_LISTS = {
+    "email": "relevant_emails",
+    "contact": "relevant_contacts",
+    "followup": "relevant_followups",
+    "meeting": "relevant_meetings",
+    "memory": "relevant_memories",
+}
+
+# Entity type -> get_contact_context result list for related entities
+_CONTACT_CONTEXT_KEYS = {
+    "email": "recent_emails",
+    "meeting": "meetings",
+    "followup": "followups",
+}
+
+# Entity hint shapes: an email address, or an entity ID ("contact_123")
+_EMAIL_HINT_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_ENTITY_ID_HINT_RE = re.compile(r'^(email|contact|followup|meeting|memory)_[a-zA-Z0-9_-]+$')
+
+# Recent vector search results kept per agent, so the same query asked again
+# within a conversation skips the embedding and Qdrant round trip
+SEARCH_CACHE_SIZE = 256
+SEARCH_CACHE_TTL_SECONDS = 30.0
+
+
+def _check_params(arguments: dict[str, Any]) -> None:
+    """
+    Reject malformed entity IDs and timestamps before a handler runs.
+
+    Raises:
+        ValueError: If an entity_id has no type prefix or a start_time /
+            end_time string isn't ISO 8601
+    """
+    entity_id = arguments.get("entity_id")
+    if isinstance(entity_id, str) and entity_id and "_" not in entity_id:
+        raise ValueError(f"Invalid entity ID format: {entity_id}")
+    for name in ("start_time", "end_time"):
+        value = arguments.get(name)
+        if isinstance(value, str):
+            datetime.fromisoformat(value)
+
+
 class SearchAgent(BaseAgent):
     """
     The Search Agent retrieves relevant context for any sub-agent task.
@@ -50,14 +170,14 @@ class SearchAgent(BaseAgent):
     name = "search"
     description = "Retrieves relevant context from the Data Layer for agent tasks"
     agent_type = AgentType.FOUNDATIONAL
-    capabilities = [
+    capabilities = (
         "search_for_task",
         "semantic_search",
         "entity_lookup",
         "relationship_traverse",
         "temporal_search",
         "get_relevant_memories",
-    ]
+    )
 
     def __init__(self, data_layer: DataLayerInterface):
         """
@@ -71,6 +191,23 @@ class SearchAgent(BaseAgent):
         self.search = self  # Self-reference for compatibility
         self.data_layer = data_layer
 
+        # _search_cache_key() -> (cached_at, vector search results)
+        self._search_cache: OrderedDict[tuple, tuple[float, list[SearchResult]]] = OrderedDict()
+
+        # Capability name -> (handler, key of its result in AgentResult.data,
+        # handler signature that params are bound against)
+        self._capability_dispatch = {
+            name: (handler, result_key, inspect.signature(handler))
+            for name, (handler, result_key) in {
+                "search_for_task": (self.search_for_task, "context"),
+                "semantic_search": (self.semantic_search, "results"),
+                "entity_lookup": (self.entity_lookup, "entity"),
+                "relationship_traverse": (self.relationship_traverse, "related"),
+                "temporal_search": (self.temporal_search, "results"),
+                "get_relevant_memories": (self.get_relevant_memories, "context"),
+            }.items()
+        }
+
     async def execute(
         self,
         capability: str,
@@ -90,44 +227,29 @@ class SearchAgent(BaseAgent):
         """
         self._validate_capability(capability)
 
-        try:
-            if capability == "search_for_task":
-                ctx = await self.search_for_task(**params)
-                return AgentResult(success=True, data={"context": ctx})
-
-            elif capability == "semantic_search":
-                results = await self.semantic_search(**params)
-                return AgentResult(success=True, data={"results": results})
-
-            elif capability == "entity_lookup":
-                entity = await self.entity_lookup(**params)
-                return AgentResult(success=True, data={"entity": entity})
-
-            elif capability == "relationship_traverse":
-                related = await self.relationship_traverse(**params)
-                return AgentResult(success=True, data={"related": related})
+        dispatch = self._capability_dispatch.get(capability)
+        if dispatch is None:
+            return AgentResult.fail(f"Unknown capability: {capability}")
+        handler, result_key, signature = dispatch
 
-            elif capability == "temporal_search":
-                results = await self.temporal_search(**params)
-                return AgentResult(success=True, data={"results": results})
-
-            elif capability == "get_relevant_memories":
-                ctx = await self.get_relevant_memories(**params)
-                return AgentResult(success=True, data={"context": ctx})
+        # Check the arguments up front, so any error raised inside the
+        # handler is reported as a search error with its traceback
+        try:
+            _check_params(signature.bind(**params).arguments)
+        except (TypeError, ValueError) as e:
+            return self._invalid_params(capability, e)
 
-            else:
-                return AgentResult(
-                    success=False,
-                    data={},
-                    errors=[f"Unknown capability: {capability}"]
-                )
+        try:
+            return AgentResult.ok({result_key: await handler(**params)})
         except Exception as e:
-            logger.exception(f"Search error in capability '{capability}'")
-            return AgentResult(
-                success=False,
-                data={},
-                errors=[f"Search error: {str(e)}"]
-            )
+            logger.exception("Search error in capability '%s'", capability)
+            return AgentResult.fail(f"Search error: {e}")
+
+    def _invalid_params(self, capability: str, error: Exception) -> AgentResult:
+        """Report bad params: the caller's mistake, so no traceback."""
+        message = f"Invalid params for '{capability}': {error}"
+        logger.warning(message)
+        return AgentResult.fail(message)
 
     async def search_for_task(
         self,
@@ -152,53 +274,100 @@ class SearchAgent(BaseAgent):
         Returns:
             SearchContext with relevant data for the task
         """
+        contexts = await self.get_contexts_batch([
+            ContextRequest(
+                requesting_agent=requesting_agent,
+                task_description=task_description,
+                entity_hints=entity_hints,
+                max_results=max_results,
+            )
+        ])
+        return contexts[0]
+
+    async def get_contexts_batch(
+        self,
+        requests: list[ContextRequest],
+    ) -> list[SearchContext]:
+        """
+        Build context packages for several tasks at once.
+
+        Distinct task descriptions are embedded and searched together in a
+        single data layer call (one query per description, at the largest
+        max_results asked for), then each request takes its own top
+        max_results hits. Entity hints and agent-specific enrichment still
+        run per request.
+
+        Args:
+            requests: One ContextRequest per task
+
+        Returns:
+            One SearchContext per request, in order
+        """
+        descriptions = list(dict.fromkeys(r.task_description for r in requests))
+        limit = max((r.max_results for r in requests), default=0)
+
+        # 1. Semantic search based on task descriptions
+        if len(descriptions) == 1:
+            batches = [await self.semantic_search(
+                query=descriptions[0],
+                entity_types=None,  # Search all types
+                limit=limit,
+                score_threshold=0.3
+            )]
+        else:
+            batches = await self.semantic_search_batch(
+                queries=descriptions,
+                limit=limit,
+                score_threshold=0.3
+            )
+        semantic_by_description = dict(zip(descriptions, batches))
+
+        contexts = []
+        for request in requests:
+            semantic_results = semantic_by_description[request.task_description]
+            contexts.append(
+                await self._build_context(request, semantic_results[:request.max_results])
+            )
+        return contexts
+
+    async def _build_context(
+        self,
+        request: ContextRequest,
+        semantic_results: list[SearchResult],
+    ) -> SearchContext:
+        """Assemble one SearchContext from its semantic results."""
+        requesting_agent = request.requesting_agent
+        max_results = request.max_results
+
         logger.info(
-            f"Building context for agent '{requesting_agent}': {task_description[:100]}..."
+            f"Building context for agent '{requesting_agent}': {request.task_description[:100]}..."
         )
 
         context = SearchContext(
             retrieval_metadata={
                 "requesting_agent": requesting_agent,
-                "task_description": task_description,
+                "task_description": request.task_description,
                 "timestamp": datetime.now(timezone.utc).isoformat(),
             }
         )
 
-        # 1. Semantic search based on task description
-        semantic_results = await self.semantic_search(
-            query=task_description,
-            entity_types=None,  # Search all types
-            limit=max_results,
-            score_threshold=0.3
-        )
+        # Entity type -> IDs already in its context list, shared by every
+        # merge phase below
+        seen: dict[str, set[str]] = {}
 
         # Categorize semantic results by type
-        for result in semantic_results:
-            entity = result.entity
-            entity_dict = self._entity_to_dict(entity, result.score)
-
-            if entity.entity_type == "email":
-                context.relevant_emails.append(entity_dict)
-            elif entity.entity_type == "contact":
-                context.relevant_contacts.append(entity_dict)
-            elif entity.entity_type == "followup":
-                context.relevant_followups.append(entity_dict)
-            elif entity.entity_type == "meeting":
-                context.relevant_meetings.append(entity_dict)
-            elif entity.entity_type == "memory":
-                context.relevant_memories.append(entity_dict)
+        self._add_results_to_context(context, semantic_results, seen)
 
         # 2. If entity hints provided, use them to enhance search
         # Entity hints are names, email addresses, or keywords - NOT entity IDs
-        if entity_hints:
-            for hint in entity_hints:
-                await self._process_entity_hint(context, hint, max_results)
+        if request.entity_hints:
+            await self._process_entity_hints(context, request.entity_hints, max_results, seen)
 
         # 3. Agent-specific context enrichment
-        await self._enrich_for_agent(context, requesting_agent, max_results)
+        await self._enrich_for_agent(context, requesting_agent, max_results, seen)
 
         # 4. Generate temporal summary
-        context.temporal_summary = await self._generate_temporal_summary(context)
+        context.temporal_summary = self._generate_temporal_summary(context)
 
         # Update metadata
         context.retrieval_metadata["entities_retrieved"] = (
@@ -219,394 +388,101 @@ class SearchAgent(BaseAgent):
         self,
         context: SearchContext,
         requesting_agent: str,
-        max_results: int
+        max_results: int,
+        seen: dict[str, set[str]]
     ) -> None:
         """Add agent-specific context enrichment.
 
-        Supports intent-based enrichment for chat queries:
-        - chat: General chat, balanced context
-        - chat_email: Email-focused queries, prioritize email context
-        - chat_followup: Follow-up queries, prioritize followup context
-        - chat_meeting: Meeting queries, prioritize meeting/calendar context
-        - chat_contact: Contact queries, prioritize contact context
-        - chat_todo: Todo queries, prioritize todo context
+        Runs the agent's plan from ENRICHMENT_PLANS in order, skipping a
+        query whose context list already holds as many entities as it would
+        fetch. Chat intents (chat, chat_email, chat_followup, chat_meeting,
+        chat_contact, chat_todo) are best effort: a failing query is logged
+        and the rest of the plan still runs.
         """
+        best_effort = requesting_agent.startswith("chat")
 
-        if requesting_agent == "chat":
-            # General chat gets balanced context - emails, followups, contacts
-            await self._enrich_chat_general(context, max_results)
-
-        elif requesting_agent == "chat_email":
-            # Email-focused: prioritize email context with more results
-            await self._enrich_chat_email(context, max_results)
-
-        elif requesting_agent == "chat_followup":
-            # Follow-up focused: prioritize followup context
-            await self._enrich_chat_followup(context, max_results)
-
-        elif requesting_agent == "chat_meeting":
-            # Meeting focused: prioritize meeting/calendar context
-            await self._enrich_chat_meeting(context, max_results)
-
-        elif requesting_agent == "chat_contact":
-            # Contact focused: prioritize contact context
-            await self._enrich_chat_contact(context, max_results)
+        for query in ENRICHMENT_PLANS.get(requesting_agent, ()):
+            limit = query.limit or max_results * query.scale
+            # Skip the round trip when earlier phases already filled the list
+            entity_list = getattr(context, _CONTEXT_LISTS[query.entity_type])
+            if len(entity_list) >= limit:
+                continue
 
-        elif requesting_agent == "chat_todo":
-            # Todo focused: prioritize todo context
-            await self._enrich_chat_todo(context, max_results)
-
-        elif requesting_agent == "followup":
-            # Get active follow-ups
-            followups = await self.data_layer.structured_query(
-                filters={"status": ["pending", "reminded", "escalated"]},
-                entity_type="followup",
-                limit=max_results
-            )
-            for entity in followups:
-                if not self._entity_in_list(entity.id, context.relevant_followups):
-                    context.relevant_followups.append(self._entity_to_dict(entity))
-
-        elif requesting_agent == "email":
-            # Get recent unread emails
-            emails = await self.data_layer.structured_query(
-                filters={"is_unread": True},
-                entity_type="email",
-                limit=max_results
-            )
-            for entity in emails:
-                if not self._entity_in_list(entity.id, context.relevant_emails):
-                    context.relevant_emails.append(self._entity_to_dict(entity))
-
-        elif requesting_agent == "briefing":
-            # Get comprehensive briefing context
-            # Recent high-priority emails
-            emails = await self.data_layer.structured_query(
-                filters={"priority": ["urgent", "high"]},
-                entity_type="email",
-                limit=10
-            )
-            for entity in emails:
-                if not self._entity_in_list(entity.id, context.relevant_emails):
-                    context.relevant_emails.append(self._entity_to_dict(entity))
-
-            # Overdue follow-ups
-            followups = await self.data_layer.structured_query(
-                filters={"status": ["pending", "reminded", "escalated"]},
-                entity_type="followup",
-                limit=10
-            )
-            for entity in followups:
-                if not self._entity_in_list(entity.id, context.relevant_followups):
-                    context.relevant_followups.append(self._entity_to_dict(entity))
-
-        elif requesting_agent == "meeting":
-            # Get recent meetings
-            meetings = await self.data_layer.structured_query(
-                filters={},
-                entity_type="meeting",
-                limit=max_results
-            )
-            for entity in meetings:
-                if not self._entity_in_list(entity.id, context.relevant_meetings):
-                    context.relevant_meetings.append(self._entity_to_dict(entity))
-
-    async def _enrich_chat_general(
-        self,
-        context: SearchContext,
-        max_results: int
-    ) -> None:
-        """Enrich context for general chat queries - balanced approach."""
-        # Get recent/unread emails
-        try:
-            emails = await self.data_layer.structured_query(
-                filters={"is_unread": True},
-                entity_type="email",
-                limit=max_results
-            )
-            for entity in emails:
-                if not self._entity_in_list(entity.id, context.relevant_emails):
-                    context.relevant_emails.append(self._entity_to_dict(entity))
-        except Exception as e:
-            logger.warning(f"Error fetching emails for chat: {e}")
-
-        # Get active/overdue follow-ups
-        try:
-            followups = await self.data_layer.structured_query(
-                filters={"status": ["pending", "reminded", "escalated"]},
-                entity_type="followup",
-                limit=max_results
-            )
-            for entity in followups:
-                if not self._entity_in_list(entity.id, context.relevant_followups):
-                    context.relevant_followups.append(self._entity_to_dict(entity))
-        except Exception as e:
-            logger.warning(f"Error fetching followups for chat: {e}")
-
-    async def _enrich_chat_email(
-        self,
-        context: SearchContext,
-        max_results: int
-    ) -> None:
-        """Enrich context for email-focused queries - prioritize email data."""
-        # Get more emails with higher limit
-        email_limit = max_results * 2  # Double the limit for email-focused queries
-
-        try:
-            # Get unread emails
-            unread_emails = await self.data_layer.structured_query(
-                filters={"is_unread": True},
-                entity_type="email",
-                limit=email_limit
-            )
-            for entity in unread_emails:
-                if not self._entity_in_list(entity.id, context.relevant_emails):
-                    context.relevant_emails.append(self._entity_to_dict(entity))
-        except Exception as e:
-            logger.warning(f"Error fetching unread emails: {e}")
-
-        try:
-            # Also get recent emails (even if read)
-            recent_emails = await self.data_layer.structured_query(
-                filters={},
-                entity_type="email",
-                limit=email_limit
-            )
-            for entity in recent_emails:
-                if not self._entity_in_list(entity.id, context.relevant_emails):
-                    context.relevant_emails.append(self._entity_to_dict(entity))
-        except Exception as e:
-            logger.warning(f"Error fetching recent emails: {e}")
-
-        # Light followup context
-        try:
-            followups = await self.data_layer.structured_query(
-                filters={"status": ["pending", "reminded", "escalated"]},
-                entity_type="followup",
-                limit=5  # Fewer followups for email queries
-            )
-            for entity in followups:
-                if not self._entity_in_list(entity.id, context.relevant_followups):
-                    context.relevant_followups.append(self._entity_to_dict(entity))
-        except Exception as e:
-            logger.warning(f"Error fetching followups: {e}")
-
-    async def _enrich_chat_followup(
-        self,
-        context: SearchContext,
-        max_results: int
-    ) -> None:
-        """Enrich context for follow-up focused queries."""
-        followup_limit = max_results * 2  # More followups for followup queries
-
-        try:
-            # Get all active followups with more results
-            followups = await self.data_layer.structured_query(
-                filters={"status": ["pending", "reminded", "escalated"]},
-                entity_type="followup",
-                limit=followup_limit
-            )
-            for entity in followups:
-                if not self._entity_in_list(entity.id, context.relevant_followups):
-                    context.relevant_followups.append(self._entity_to_dict(entity))
-        except Exception as e:
-            logger.warning(f"Error fetching followups: {e}")
-
-        # Light email context (related to followups)
-        try:
-            emails = await self.data_layer.structured_query(
-                filters={"is_unread": True},
-                entity_type="email",
-                limit=5
-            )
-            for entity in emails:
-                if not self._entity_in_list(entity.id, context.relevant_emails):
-                    context.relevant_emails.append(self._entity_to_dict(entity))
-        except Exception as e:
-            logger.warning(f"Error fetching emails: {e}")
-
-    async def _enrich_chat_meeting(
-        self,
-        context: SearchContext,
-        max_results: int
-    ) -> None:
-        """Enrich context for meeting/calendar focused queries."""
-        meeting_limit = max_results * 2
-
-        try:
-            # Get recent meetings
-            meetings = await self.data_layer.structured_query(
-                filters={},
-                entity_type="meeting",
-                limit=meeting_limit
-            )
-            for entity in meetings:
-                if not self._entity_in_list(entity.id, context.relevant_meetings):
-                    context.relevant_meetings.append(self._entity_to_dict(entity))
-        except Exception as e:
-            logger.warning(f"Error fetching meetings: {e}")
-
-        # Light followup context (meeting-related followups)
-        try:
-            followups = await self.data_layer.structured_query(
-                filters={"status": ["pending", "reminded", "escalated"]},
-                entity_type="followup",
-                limit=5
-            )
-            for entity in followups:
-                if not self._entity_in_list(entity.id, context.relevant_followups):
-                    context.relevant_followups.append(self._entity_to_dict(entity))
-        except Exception as e:
-            logger.warning(f"Error fetching followups: {e}")
-
-    async def _enrich_chat_contact(
-        self,
-        context: SearchContext,
-        max_results: int
-    ) -> None:
-        """Enrich context for contact/people focused queries."""
-        contact_limit = max_results * 2
-
-        try:
-            # Get contacts (will primarily come from semantic search,
-            # but add any VIP contacts as well)
-            contacts = await self.data_layer.structured_query(
-                filters={"is_vip": True},
-                entity_type="contact",
-                limit=contact_limit
-            )
-            for entity in contacts:
-                if not self._entity_in_list(entity.id, context.relevant_contacts):
-                    context.relevant_contacts.append(self._entity_to_dict(entity))
-        except Exception as e:
-            logger.warning(f"Error fetching contacts: {e}")
-
-        # Get emails to show interaction history
-        try:
-            emails = await self.data_layer.structured_query(
-                filters={},
-                entity_type="email",
-                limit=10
-            )
-            for entity in emails:
-                if not self._entity_in_list(entity.id, context.relevant_emails):
-                    context.relevant_emails.append(self._entity_to_dict(entity))
-        except Exception as e:
-            logger.warning(f"Error fetching emails: {e}")
-
-        # Get followups to show pending items with contacts
-        try:
-            followups = await self.data_layer.structured_query(
-                filters={"status": ["pending", "reminded", "escalated"]},
-                entity_type="followup",
-                limit=10
-            )
-            for entity in followups:
-                if not self._entity_in_list(entity.id, context.relevant_followups):
-                    context.relevant_followups.append(self._entity_to_dict(entity))
-        except Exception as e:
-            logger.warning(f"Error fetching followups: {e}")
-
-    async def _enrich_chat_todo(
-        self,
-        context: SearchContext,
-        max_results: int
-    ) -> None:
-        """Enrich context for todo/task focused queries.
-
-        Note: Todos are stored in a separate table, not in the entity system.
-        For now, we provide meeting context (source of many action items)
-        and followup context (related to tasks).
-        """
-        # Meetings are a primary source of action items
-        try:
-            meetings = await self.data_layer.structured_query(
-                filters={},
-                entity_type="meeting",
-                limit=max_results
-            )
-            for entity in meetings:
-                if not self._entity_in_list(entity.id, context.relevant_meetings):
-                    context.relevant_meetings.append(self._entity_to_dict(entity))
-        except Exception as e:
-            logger.warning(f"Error fetching meetings: {e}")
-
-        # Followups are related to tasks
-        try:
-            followups = await self.data_layer.structured_query(
-                filters={"status": ["pending", "reminded", "escalated"]},
-                entity_type="followup",
-                limit=max_results
-            )
-            for entity in followups:
-                if not self._entity_in_list(entity.id, context.relevant_followups):
-                    context.relevant_followups.append(self._entity_to_dict(entity))
-        except Exception as e:
-            logger.warning(f"Error fetching followups: {e}")
+            try:
+                entities = await self.data_layer.structured_query(
+                    filters=query.filters,
+                    entity_type=query.entity_type,
+                    limit=limit
+                )
+            except Exception as e:
+                if not best_effort:
+                    raise
+                logger.warning(
+                    "Error fetching %ss for %s: %s", query.entity_type, requesting_agent, e
+                )
+                continue
 
-        # Light email context for task-related emails
-        try:
-            emails = await self.data_layer.structured_query(
-                filters={"is_unread": True},
-                entity_type="email",
-                limit=5
-            )
-            for entity in emails:
-                if not self._entity_in_list(entity.id, context.relevant_emails):
-                    context.relevant_emails.append(self._entity_to_dict(entity))
-        except Exception as e:
-            logger.warning(f"Error fetching emails: {e}")
+            for entity in entities:
+                self._add_entity_to_context(context, entity, seen)
 
-    async def _process_entity_hint(
+    async def _process_entity_hints(
         self,
         context: SearchContext,
-        hint: str,
-        max_results: int
+        hints: list[str],
+        max_results: int,
+        seen: dict[str, set[str]]
     ) -> None:
         """
-        Process an entity hint to enhance search context.
+        Process entity hints to enhance search context.
 
         Entity hints are extracted from user messages and can be:
         - Email addresses (e.g., "john@example.com")
         - Names (e.g., "Laura Hodgson")
         - Keywords or phrases
 
-        This method uses hints for targeted searches, NOT direct entity lookups.
-        Entity IDs have the format "type_id" (e.g., "contact_123").
+        Hints are used for targeted searches, NOT direct entity lookups,
+        unless a hint has the entity ID format "type_id" (e.g.,
+        "contact_123"). Entity IDs are loaded in one call; names, keywords
+        and IDs that turn out not to be stored are then semantic-searched
+        together in one batch. Results are added in hint order.
         """
-        hint = hint.strip()
-        if not hint:
-            return
-
-        logger.debug(f"Processing entity hint: {hint}")
-
-        # Check if hint looks like an email address
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if re.match(email_pattern, hint):
-            await self._search_by_email(context, hint, max_results)
-            return
+        hints = [hint.strip() for hint in hints]
 
-        # Check if hint looks like an actual entity ID (format: type_id)
-        entity_id_pattern = r'^(email|contact|followup|meeting|memory)_[a-zA-Z0-9_-]+$'
-        if re.match(entity_id_pattern, hint):
+        # Hints that look like actual entity IDs (format: type_id)
+        id_hints = [hint for hint in hints if hint and _ENTITY_ID_HINT_RE.match(hint)]
+        entities_by_id = {}
+        if id_hints:
             try:
-                entity = await self.data_layer.get_entity(hint)
-                if entity:
-                    entity_dict = self._entity_to_dict(entity)
-                    self._add_entity_to_context(context, entity, entity_dict)
-                    return
+                entities_by_id = await self.data_layer.get_entities(id_hints)
             except Exception as e:
-                logger.debug(f"Entity ID lookup failed for {hint}: {e}")
+                logger.debug(f"Entity ID lookup failed for {id_hints}: {e}")
+
+        # Everything else but email addresses is searched as a keyword
+        keywords = [
+            hint for hint in hints
+            if hint and hint not in entities_by_id and not _EMAIL_HINT_RE.match(hint)
+        ]
+        keyword_results = dict(zip(keywords, await self._search_keywords(keywords, max_results)))
+
+        for hint in hints:
+            if not hint:
+                continue
 
-        # For names and other keywords, use semantic search
-        # This is more robust than trying to do structured lookups
-        await self._search_by_keyword(context, hint, max_results)
+            logger.debug(f"Processing entity hint: {hint}")
+
+            if hint in entities_by_id:
+                self._add_entity_to_context(context, entities_by_id[hint], seen)
+            elif hint in keyword_results:
+                self._add_results_to_context(context, keyword_results[hint], seen)
+            else:
+                await self._search_by_email(context, hint, max_results, seen)
 
     async def _search_by_email(
         self,
         context: SearchContext,
         email_address: str,
-        max_results: int
+        max_results: int,
+        seen: dict[str, set[str]]
     ) -> None:
         """Search for entities related to an email address."""
         try:
@@ -617,8 +493,7 @@ class SearchAgent(BaseAgent):
                 limit=max_results
             )
             for entity in emails:
-                if not self._entity_in_list(entity.id, context.relevant_emails):
-                    context.relevant_emails.append(self._entity_to_dict(entity))
+                self._add_entity_to_context(context, entity, seen)
         except Exception as e:
             logger.debug(f"Email search by sender failed: {e}")
 
@@ -630,8 +505,7 @@ class SearchAgent(BaseAgent):
                 limit=5
             )
             for entity in contacts:
-                if not self._entity_in_list(entity.id, context.relevant_contacts):
-                    context.relevant_contacts.append(self._entity_to_dict(entity))
+                self._add_entity_to_context(context, entity, seen)
         except Exception as e:
             logger.debug(f"Contact search by email failed: {e}")
 
@@ -643,36 +517,41 @@ class SearchAgent(BaseAgent):
                 limit=max_results
             )
             for entity in followups:
-                if not self._entity_in_list(entity.id, context.relevant_followups):
-                    context.relevant_followups.append(self._entity_to_dict(entity))
+                self._add_entity_to_context(context, entity, seen)
         except Exception as e:
             logger.debug(f"Followup search by contact failed: {e}")
 
-    async def _search_by_keyword(
+    async def _search_keywords(
         self,
-        context: SearchContext,
-        keyword: str,
+        keywords: list[str],
         max_results: int
-    ) -> None:
-        """Search for entities matching a keyword using semantic search."""
+    ) -> list[list[SearchResult]]:
+        """Semantic-search names/keywords in one batch, one result list per keyword."""
+        if not keywords:
+            return []
         try:
-            # Use semantic search which is more flexible for names/keywords
-            results = await self.semantic_search(
-                query=keyword,
+            # Semantic search is more flexible than structured lookups for names
+            return await self.semantic_search_batch(
+                queries=keywords,
                 entity_types=None,  # Search all types
                 limit=max_results // 2,  # Limit per hint to avoid overwhelming context
                 score_threshold=0.4  # Slightly higher threshold for hint-based searches
             )
-
-            for result in results:
-                entity = result.entity
-                entity_dict = self._entity_to_dict(entity, result.score)
-                self._add_entity_to_context(context, entity, entity_dict)
-
         except Exception as e:
-            logger.debug(f"Semantic search for keyword '{keyword}' failed: {e}")
+            logger.debug(f"Semantic search for keywords {keywords} failed: {e}")
+            return [[] for _ in keywords]
+
+    def _add_results_to_context(
+        self,
+        context: SearchContext,
+        results: list[SearchResult],
+        seen: dict[str, set[str]]
+    ) -> None:
+        """Add scored search results to the appropriate context lists."""
+        for result in results:
+            self._add_entity_to_context(context, result.entity, seen, result.score)
 
-    async def _generate_temporal_summary(self, context: SearchContext) -> str:
+    def _generate_temporal_summary(self, context: SearchContext) -> str:
         """Generate a natural language summary of temporal context."""
         parts = []
 
@@ -702,9 +581,9 @@ class SearchAgent(BaseAgent):
             "id": entity.id,
             "entity_type": entity.entity_type,
             "source": entity.source,
-            **entity.structured,
-            **entity.analyzed,
         }
+        result.update(entity.structured)
+        result.update(entity.analyzed)
         if score is not None:
             result["relevance_score"] = score
         return result
@@ -713,28 +592,27 @@ class SearchAgent(BaseAgent):
         self,
         context: SearchContext,
         entity: IndexedEntity,
-        entity_dict: dict
+        seen: dict[str, set[str]],
+        score: float | None = None
     ) -> None:
-        """Add an entity to the appropriate context list."""
-        if entity.entity_type == "email":
-            if not self._entity_in_list(entity.id, context.relevant_emails):
-                context.relevant_emails.append(entity_dict)
-        elif entity.entity_type == "contact":
-            if not self._entity_in_list(entity.id, context.relevant_contacts):
-                context.relevant_contacts.append(entity_dict)
-        elif entity.entity_type == "followup":
-            if not self._entity_in_list(entity.id, context.relevant_followups):
-                context.relevant_followups.append(entity_dict)
-        elif entity.entity_type == "meeting":
-            if not self._entity_in_list(entity.id, context.relevant_meetings):
-                context.relevant_meetings.append(entity_dict)
-        elif entity.entity_type == "memory":
-            if not self._entity_in_list(entity.id, context.relevant_memories):
-                context.relevant_memories.append(entity_dict)
-
-    def _entity_in_list(self, entity_id: str, entity_list: list[dict]) -> bool:
-        """Check if an entity is already in a list."""
-        return any(e.get("id") == entity_id for e in entity_list)
+        """
+        Add an entity to the appropriate context list, unless already there.
+
+        seen maps entity type to the IDs in that list (filled from the list
+        on first use), so the duplicate check is a set lookup rather than a
+        scan, and the entity dict is only built for new entities.
+        """
+        list_name = _CONTEXT_LISTS.get(entity.entity_type)
+        if list_name is None:
+            return
+        entity_list = getattr(context, list_name)
+
+        ids = seen.get(entity.entity_type)
+        if ids is None:
+            ids = seen[entity.entity_type] = {e.get("id") for e in entity_list}
+        if entity.id not in ids:
+            ids.add(entity.id)
+            entity_list.append(self._entity_to_dict(entity, score))
 
     async def semantic_search(
         self,
@@ -755,15 +633,96 @@ class SearchAgent(BaseAgent):
         Returns:
             List of SearchResult ordered by relevance
         """
-        results = await self.data_layer.vector_search(
-            query=query,
-            entity_types=entity_types,
-            limit=limit
-        )
+        key = self._search_cache_key(query, entity_types, limit)
+        results = self._cached_search(key)
+        if results is None:
+            results = await self.data_layer.vector_search(
+                query=query,
+                entity_types=entity_types,
+                limit=limit
+            )
+            self._cache_search(key, results)
 
         # Filter by score threshold
         return [r for r in results if r.score >= score_threshold]
 
+    async def semantic_search_batch(
+        self,
+        queries: list[str],
+        entity_types: list[str] | None = None,
+        limit: int = 10,
+        score_threshold: float = 0.3
+    ) -> list[list[SearchResult]]:
+        """
+        Perform several semantic similarity searches in one data layer call.
+
+        Args:
+            queries: Natural language queries
+            entity_types: Filter by entity types (email, contact, etc.)
+            limit: Maximum number of results per query
+            score_threshold: Minimum similarity score
+
+        Returns:
+            One list of SearchResult per query, ordered by relevance
+        """
+        keys = [self._search_cache_key(query, entity_types, limit) for query in queries]
+        found = {key: self._cached_search(key) for key in keys}
+        # Only queries not cached (each once) go to the data layer
+        missing = {
+            key: query for key, query in zip(keys, queries) if found[key] is None
+        }
+
+        if missing:
+            batches = await self.data_layer.vector_search_batch(
+                queries=list(missing.values()),
+                entity_types=entity_types,
+                limit=limit
+            )
+            for key, results in zip(missing, batches):
+                found[key] = results
+                self._cache_search(key, results)
+
+        # Filter by score threshold
+        return [[r for r in found[key] if r.score >= score_threshold] for key in keys]
+
+    def _search_cache_key(
+        self, query: str, entity_types: list[str] | None, limit: int
+    ) -> tuple:
+        """
+        Key for the search cache (the score threshold is applied after).
+
+        The embedding model is uncased and splits on whitespace, so queries
+        differing only in case or spacing embed identically and share a key;
+        so do entity type filters listed in a different order. The data
+        layer's write generation is part of the key, so any entity write
+        (such as a newly persisted memory) makes earlier results miss.
+        """
+        return (
+            " ".join(query.lower().split()),
+            tuple(sorted(entity_types or ())),
+            limit,
+            self.data_layer.write_generation,
+        )
+
+    def _cached_search(self, key: tuple) -> list[SearchResult] | None:
+        """Get cached vector search results, if fresh."""
+        cached = self._search_cache.get(key)
+        if cached is None:
+            return None
+        cached_at, results = cached
+        if time.monotonic() - cached_at > SEARCH_CACHE_TTL_SECONDS:
+            del self._search_cache[key]
+            return None
+        self._search_cache.move_to_end(key)
+        return results
+
+    def _cache_search(self, key: tuple, results: list[SearchResult]) -> None:
+        """Remember vector search results (bounded LRU)."""
+        self._search_cache[key] = (time.monotonic(), results)
+        self._search_cache.move_to_end(key)
+        if len(self._search_cache) > SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
+
     async def entity_lookup(
         self,
         entity_id: str | None = None,
@@ -788,11 +747,13 @@ class SearchAgent(BaseAgent):
             return None
 
         if entity_type and filters:
-            entities = await self.data_layer.structured_query(
-                filters=filters,
-                entity_type=entity_type
-            )
-            return [self._entity_to_dict(e) for e in entities]
+            return [
+                self._entity_to_dict(e)
+                async for e in self.data_layer.structured_query_iter(
+                    filters=filters,
+                    entity_type=entity_type
+                )
+            ]
 
         return None
 
@@ -805,34 +766,63 @@ class SearchAgent(BaseAgent):
         """
         Traverse relationships from an entity.
 
+        Walks breadth-first up to depth levels, visiting each entity once,
+        so an entity reachable by several relationships or paths appears
+        only at its nearest level.
+
         Args:
             entity_id: Starting entity
             rel_types: Filter by relationship types
-            depth: How many levels to traverse (currently only supports depth=1)
+            depth: How many levels to traverse
 
         Returns:
-            List of related entity dicts with relationship info
+            List of related entity dicts with relationship info (the
+            relationship that first reached the entity, and its depth)
         """
-        relationships = await self.data_layer.get_relationships(
-            entity_id=entity_id,
-            rel_types=rel_types
-        )
-
         related = []
-        for rel in relationships:
-            # Get the related entity
-            related_id = rel.to_id if rel.from_id == entity_id else rel.from_id
-            entity = await self.data_layer.get_entity(related_id)
+        visited = {entity_id}
+        frontier = deque([(entity_id, 1)])
+
+        while frontier:
+            current_id, level = frontier.popleft()
+            relationships = await self.data_layer.get_relationships(
+                entity_id=current_id,
+                rel_types=rel_types
+            )
+
+            # Pick out newly reached entities, then load them in one call
+            reached = []
+            for rel in relationships:
+                outgoing = rel.from_id == current_id
+                related_id = rel.to_id if outgoing else rel.from_id
+                if related_id in visited:
+                    continue
+                visited.add(related_id)
+                reached.append((rel, outgoing, related_id))
+
+            if not reached:
+                continue
+            entities = await self.data_layer.get_entities(
+                [related_id for _, _, related_id in reached]
+            )
+
+            for rel, outgoing, related_id in reached:
+                entity = entities.get(related_id)
+                if not entity:
+                    continue
 
-            if entity:
                 entity_dict = self._entity_to_dict(entity)
                 entity_dict["relationship"] = {
                     "type": rel.rel_type,
-                    "direction": "outgoing" if rel.from_id == entity_id else "incoming",
-                    "metadata": rel.metadata
+                    "direction": "outgoing" if outgoing else "incoming",
+                    "metadata": rel.metadata,
+                    "depth": level,
                 }
                 related.append(entity_dict)
 
+                if level < depth:
+                    frontier.append((related_id, level + 1))
+
         return related
 
     async def temporal_search(
@@ -853,33 +843,31 @@ class SearchAgent(BaseAgent):
         Returns:
             List of entities in the time range
         """
-        # Parse times if strings
+        # Parse times if strings (fromisoformat accepts a trailing "Z")
         if isinstance(start_time, str):
-            start_time = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
+            start_time = datetime.fromisoformat(start_time)
         if isinstance(end_time, str):
-            end_time = datetime.fromisoformat(end_time.replace("Z", "+00:00"))
+            end_time = datetime.fromisoformat(end_time)
 
         results = []
 
+        # Time-based filter, shared by every entity type
+        filters = {
+            "date_range": {
+                "start": start_time.isoformat(),
+                "end": end_time.isoformat()
+            }
+        }
+
         # Search each entity type
         types_to_search = entity_types or ["email", "meeting", "followup"]
 
         for entity_type in types_to_search:
-            # Build time-based filter
-            filters = {
-                "date_range": {
-                    "start": start_time.isoformat(),
-                    "end": end_time.isoformat()
-                }
-            }
-
-            entities = await self.data_layer.structured_query(
+            async for entity in self.data_layer.structured_query_iter(
                 filters=filters,
                 entity_type=entity_type,
                 limit=limit
-            )
-
-            for entity in entities:
+            ):
                 results.append(self._entity_to_dict(entity))
 
         return results
@@ -912,11 +900,12 @@ class SearchAgent(BaseAgent):
             }
         )
 
-        # Search for relevant memories using semantic search
-        results = await self.data_layer.vector_search(
+        # Search for relevant memories using semantic search (cached, unfiltered)
+        results = await self.semantic_search(
             query=query,
             entity_types=["memory"],
-            limit=limit
+            limit=limit,
+            score_threshold=float("-inf")
         )
 
         for result in results:
@@ -932,8 +921,10 @@ class SearchAgent(BaseAgent):
                 limit=limit
             )
 
+            seen_ids = {result.entity.id for result in results}
             for entity in conversation_memories:
-                if not self._entity_in_list(entity.id, context.relevant_memories):
+                if entity.id not in seen_ids:
+                    seen_ids.add(entity.id)
                     context.relevant_memories.append(self._entity_to_dict(entity))
 
         return context
@@ -977,13 +968,9 @@ class SearchAgent(BaseAgent):
             )
 
             for entity_dict in related:
-                entity_type = entity_dict.get("entity_type")
-                if entity_type == "email":
-                    result["recent_emails"].append(entity_dict)
-                elif entity_type == "meeting":
-                    result["meetings"].append(entity_dict)
-                elif entity_type == "followup":
-                    result["followups"].append(entity_dict)
+                key = _CONTACT_CONTEXT_KEYS.get(entity_dict.get("entity_type"))
+                if key is not None:
+                    result[key].append(entity_dict)
 
         # Also search for emails from this sender
         emails = await self.data_layer.structured_query(
@@ -992,10 +979,11 @@ class SearchAgent(BaseAgent):
             limit=20
         )
 
+        seen_ids = {e["id"] for e in result["recent_emails"]}
         for entity in emails:
-            entity_dict = self._entity_to_dict(entity)
-            if not self._entity_in_list(entity.id, result["recent_emails"]):
-                result["recent_emails"].append(entity_dict)
+            if entity.id not in seen_ids:
+                seen_ids.add(entity.id)
+                result["recent_emails"].append(self._entity_to_dict(entity))
 
         result["total_interactions"] = (
             len(result["recent_emails"]) +
@@ -1030,36 +1018,34 @@ class SearchAgent(BaseAgent):
             limit=100
         )
 
-        participant_emails = set()
-
-        for entity in emails:
-            entity_dict = self._entity_to_dict(entity)
-            result["emails"].append(entity_dict)
-
-            # Collect participants
-            sender = entity.structured.get("sender_email")
-            if sender:
-                participant_emails.add(sender)
-
-            to_emails = entity.structured.get("to_emails", [])
-            if to_emails:
-                participant_emails.update(to_emails)
-
-        # Sort emails by date
-        result["emails"].sort(
-            key=lambda e: e.get("received_at", ""),
-            reverse=False
+        # Collect participants: senders plus every recipient list
+        participant_emails = {
+            entity.structured["sender_email"]
+            for entity in emails
+            if entity.structured.get("sender_email")
+        }
+        participant_emails.update(
+            *(entity.structured.get("to_emails") or () for entity in emails)
         )
 
-        # Get participant contact info
-        for email_addr in participant_emails:
+        # Sort emails by date, flattening each one only once it is in place
+        emails = sorted(emails, key=lambda e: e.structured.get("received_at", ""))
+        result["emails"] = [self._entity_to_dict(entity) for entity in emails]
+
+        # Get participant contact info, all participants in one query
+        contacts_by_email = {}
+        if participant_emails:
             contacts = await self.data_layer.structured_query(
-                filters={"email": email_addr},
+                filters={"email": list(participant_emails)},
                 entity_type="contact",
-                limit=1
+                limit=len(participant_emails)
             )
-            if contacts:
-                result["participants"].append(self._entity_to_dict(contacts[0]))
+            contacts_by_email = {c.structured.get("email"): c for c in contacts}
+
+        for email_addr in participant_emails:
+            contact = contacts_by_email.get(email_addr)
+            if contact:
+                result["participants"].append(self._entity_to_dict(contact))
             else:
                 result["participants"].append({"email": email_addr})
 
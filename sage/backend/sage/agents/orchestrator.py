@@ -23,6 +23,7 @@ from .foundational.search import SearchAgent
 from .foundational.indexer import IndexerAgent
 from sage.services.data_layer.service import DataLayerService
 from sage.config import get_settings
+from sage.core.claude_agent import get_async_anthropic
 
 logger = logging.getLogger(__name__)
 
@@ -121,11 +122,8 @@ class SageOrchestrator:
         self.data_layer = data_layer
         self.settings = get_settings()
 
-        # Initialize Claude client
-        if claude_client:
-            self.claude = claude_client
-        else:
-            self.claude = AsyncAnthropic(api_key=self.settings.anthropic_api_key)
+        # Initialize Claude client (the shared one unless given)
+        self.claude = claude_client or get_async_anthropic()
 
         # Foundational agents
         self.search_agent = SearchAgent(data_layer)
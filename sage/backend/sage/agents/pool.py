@@ -0,0 +1,172 @@
+"""
+Agent pool for reusing agent instances across requests.
+
+API handlers used to build a fresh SearchAgent/IndexerAgent for every
+request, throwing away warm state such as the IndexerAgent's Anthropic
+client. The pool keeps released agents per (class, config) and hands them
+back out, rebinding only the per-request data layer.
+
+Usage:
+    async with agent_pool.lease(SearchAgent, data_layer=data_layer) as agent:
+        result = await agent.execute("search_for_task", params)
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any, TypeVar
+
+from .base import BaseAgent, DataLayerInterface
+
+logger = logging.getLogger(__name__)
+
+AgentT = TypeVar("AgentT", bound=BaseAgent)
+
+# Upper bounds (ms) of the lock wait-time histogram buckets
+WAIT_BUCKETS_MS = (1, 5, 25, 100)
+
+
+class AgentPool:
+    """
+    Pool of idle agent instances keyed by agent class and constructor config.
+
+    Agents are bound to a data layer (and so to a database session) only
+    while leased; release() unbinds them so a pooled agent never holds on
+    to a finished request's session. Agents idle for longer than
+    max_idle_seconds are dropped when the pool is next released into.
+    """
+
+    def __init__(self, max_idle_seconds: float = 300.0, max_idle_per_key: int = 8):
+        """
+        Initialize the pool.
+
+        Args:
+            max_idle_seconds: Idle agents older than this are discarded
+            max_idle_per_key: Most idle agents kept per (class, config)
+        """
+        self.max_idle_seconds = max_idle_seconds
+        self.max_idle_per_key = max_idle_per_key
+
+        # (agent class, frozenset(config.items())) -> (released_at, agent)
+        self._pools: dict[tuple[type, frozenset], deque[tuple[float, BaseAgent]]] = {}
+        # id(agent) -> pool key, for agents currently leased
+        self._leased: dict[int, tuple[type, frozenset]] = {}
+        self._lock = asyncio.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evicted = 0
+        self._wait_histogram = [0] * (len(WAIT_BUCKETS_MS) + 1)
+
+    async def acquire(
+        self,
+        agent_class: type[AgentT],
+        data_layer: DataLayerInterface | None = None,
+        **config: Any,
+    ) -> AgentT:
+        """
+        Get an agent from the pool, constructing one on a miss.
+
+        Args:
+            agent_class: The agent class to acquire
+            data_layer: Data layer to bind for this request
+            **config: Other constructor arguments; part of the pool key, so
+                they must be hashable
+
+        Returns:
+            An agent bound to data_layer
+        """
+        key = (agent_class, frozenset(config.items()))
+
+        started = time.monotonic()
+        async with self._lock:
+            self._record_wait((time.monotonic() - started) * 1000)
+            idle = self._pools.get(key)
+            agent = idle.pop()[1] if idle else None
+            if agent is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+
+        if agent is None:
+            agent = agent_class(data_layer=data_layer, **config)
+        else:
+            agent.data_layer = data_layer
+
+        self._leased[id(agent)] = key
+        return agent
+
+    async def release(self, agent: BaseAgent) -> None:
+        """
+        Return an agent to the pool.
+
+        Unbinds its data layer and prunes idle agents past max_idle_seconds.
+        Agents that weren't acquired from this pool are ignored.
+        """
+        key = self._leased.pop(id(agent), None)
+        if key is None:
+            return
+
+        agent.data_layer = None
+        now = time.monotonic()
+
+        async with self._lock:
+            idle = self._pools.setdefault(key, deque())
+            if len(idle) < self.max_idle_per_key:
+                idle.append((now, agent))
+            self._prune(now)
+
+    @asynccontextmanager
+    async def lease(
+        self,
+        agent_class: type[AgentT],
+        data_layer: DataLayerInterface | None = None,
+        **config: Any,
+    ) -> AsyncIterator[AgentT]:
+        """Acquire an agent for the duration of an async with block."""
+        agent = await self.acquire(agent_class, data_layer=data_layer, **config)
+        try:
+            yield agent
+        finally:
+            await self.release(agent)
+
+    def get_stats(self) -> dict:
+        """Snapshot of pool usage for health checks."""
+        lookups = self._hits + self._misses
+        buckets = [f"<={ms}ms" for ms in WAIT_BUCKETS_MS] + [f">{WAIT_BUCKETS_MS[-1]}ms"]
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+            "idle": sum(len(idle) for idle in self._pools.values()),
+            "leased": len(self._leased),
+            "evicted": self._evicted,
+            "wait_ms": dict(zip(buckets, self._wait_histogram)),
+        }
+
+    def _prune(self, now: float) -> None:
+        """Drop idle agents released more than max_idle_seconds ago."""
+        cutoff = now - self.max_idle_seconds
+        for key in list(self._pools):
+            idle = self._pools[key]
+            # Oldest releases are at the left
+            while idle and idle[0][0] < cutoff:
+                idle.popleft()
+                self._evicted += 1
+            if not idle:
+                del self._pools[key]
+
+    def _record_wait(self, wait_ms: float) -> None:
+        """Count a lock wait in the histogram."""
+        for i, bound in enumerate(WAIT_BUCKETS_MS):
+            if wait_ms <= bound:
+                self._wait_histogram[i] += 1
+                return
+        self._wait_histogram[-1] += 1
+
+
+# Shared pool used by the API handlers
+agent_pool = AgentPool()
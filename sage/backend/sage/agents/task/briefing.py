@@ -37,11 +37,11 @@ class BriefingAgent(BaseAgent):
     name = "briefing"
     description = "Generates daily briefings and weekly reviews"
     agent_type = AgentType.TASK
-    capabilities = [
+    capabilities = (
         "generate_morning",
         "generate_weekly",
         "generate_custom",
-    ]
+    )
 
     async def execute(
         self,
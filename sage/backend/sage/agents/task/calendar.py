@@ -40,13 +40,13 @@ class CalendarAgent(BaseAgent):
     name = "calendar"
     description = "Manages calendar, detects conflicts, suggests times"
     agent_type = AgentType.TASK
-    capabilities = [
+    capabilities = (
         "get_schedule",
         "detect_conflicts",
         "check_availability",
         "family_coordination",
         "suggest_times",
-    ]
+    )
 
     async def execute(
         self,
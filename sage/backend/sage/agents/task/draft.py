@@ -52,12 +52,12 @@ class DraftAgent(BaseAgent):
     name = "draft"
     description = "Writes content in Dave's voice"
     agent_type = AgentType.TASK
-    capabilities = [
+    capabilities = (
         "draft_email",
         "draft_message",
         "revise_draft",
         "adapt_tone",
-    ]
+    )
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
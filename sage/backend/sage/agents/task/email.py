@@ -40,13 +40,13 @@ class EmailAgent(BaseAgent):
     name = "email"
     description = "Analyzes emails, identifies actions, prioritizes inbox"
     agent_type = AgentType.TASK
-    capabilities = [
+    capabilities = (
         "analyze_email",
         "summarize_thread",
         "prioritize_inbox",
         "find_related",
         "extract_actions",
-    ]
+    )
 
     async def execute(
         self,
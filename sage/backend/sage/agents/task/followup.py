@@ -40,14 +40,14 @@ class FollowUpAgent(BaseAgent):
     name = "followup"
     description = "Tracks and manages follow-up items and commitments"
     agent_type = AgentType.TASK
-    capabilities = [
+    capabilities = (
         "create_followup",
         "update_followup",
         "find_overdue",
         "suggest_action",
         "get_status",
         "snooze",
-    ]
+    )
 
     async def execute(
         self,
@@ -39,13 +39,13 @@ class MeetingAgent(BaseAgent):
     name = "meeting"
     description = "Prepares meeting context and generates summaries"
     agent_type = AgentType.TASK
-    capabilities = [
+    capabilities = (
         "prepare_meeting",
         "summarize_meeting",
         "extract_actions",
         "participant_context",
         "meeting_history",
-    ]
+    )
 
     async def execute(
         self,
@@ -65,13 +65,13 @@ class PropertyAgent(BaseAgent):
     name = "property"
     description = "Handles property-specific queries for Highlands properties"
     agent_type = AgentType.TASK
-    capabilities = [
+    capabilities = (
         "get_metrics",
         "analyze_trend",
         "compare_competitors",
         "summarize_issues",
         "deadline_check",
-    ]
+    )
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
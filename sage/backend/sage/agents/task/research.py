@@ -40,13 +40,13 @@ class ResearchAgent(BaseAgent):
     name = "research"
     description = "Gathers information from external sources"
     agent_type = AgentType.TASK
-    capabilities = [
+    capabilities = (
         "web_search",
         "fetch_document",
         "market_research",
         "competitor_lookup",
         "news_search",
-    ]
+    )
 
     async def execute(
         self,
@@ -24,11 +24,12 @@ from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
-from sage.services.database import get_db
+from sage.services.database import get_db, ingest_session_maker
 from sage.schemas.chat import ChatRequest, ChatResponse
 from sage.core.claude_agent import get_claude_agent
 from sage.services.data_layer.service import DataLayerService
 from sage.agents.foundational.search import SearchAgent
+from sage.agents.pool import agent_pool
 from sage.agents.base import SearchContext
 from sage.api.auth import get_current_user
 from sage.models.user import User
@@ -521,9 +522,7 @@ async def get_chat_context(
         Formatted context dict, or None if retrieval fails
     """
     try:
-        # Create DataLayerService and SearchAgent
         data_layer = DataLayerService(session=db)
-        search_agent = SearchAgent(data_layer=data_layer)
 
         # Phase 3.9.3: Detect intent from user message
         intent = detect_chat_intent(user_message)
@@ -545,23 +544,24 @@ async def get_chat_context(
         }
         requesting_agent = intent_to_agent.get(intent, "chat")
 
-        # Call SearchAgent to get context with intent-based prioritization
-        context = await search_agent.search_for_task(
-            requesting_agent=requesting_agent,
-            task_description=user_message,
-            entity_hints=entity_hints if entity_hints else None,
-            max_results=15,  # Balance between context richness and token usage
-        )
-
-        # Also get relevant memories for conversation continuity
-        if conversation_id:
-            memory_context = await search_agent.get_relevant_memories(
-                query=user_message,
-                conversation_id=conversation_id,
-                limit=5,
+        async with agent_pool.lease(SearchAgent, data_layer=data_layer) as search_agent:
+            # Call SearchAgent to get context with intent-based prioritization
+            context = await search_agent.search_for_task(
+                requesting_agent=requesting_agent,
+                task_description=user_message,
+                entity_hints=entity_hints if entity_hints else None,
+                max_results=15,  # Balance between context richness and token usage
             )
-            # Merge memories into main context
-            context.relevant_memories.extend(memory_context.relevant_memories)
+
+            # Also get relevant memories for conversation continuity
+            if conversation_id:
+                memory_context = await search_agent.get_relevant_memories(
+                    query=user_message,
+                    conversation_id=conversation_id,
+                    limit=5,
+                )
+                # Merge memories into main context
+                context.relevant_memories.extend(memory_context.relevant_memories)
 
         # Format for Claude
         formatted = format_search_context(context)
@@ -645,32 +645,37 @@ async def get_chat_context(
 
 
 async def _persist_memory(
-    db: AsyncSession,
     conversation_id: str,
     user_message: str,
     sage_response: str,
     turn_number: int,
 ) -> None:
-    """Background task to persist conversation memory via IndexerAgent."""
+    """
+    Background task to persist conversation memory via IndexerAgent.
+
+    Runs on its own session from the ingestion pool rather than the request's
+    session, so memory writes never hold connections that searches need.
+    """
     try:
         from sage.services.data_layer.service import DataLayerService
         from sage.agents.foundational.indexer import IndexerAgent
 
-        # Create IndexerAgent with DataLayerService
-        data_layer = DataLayerService(session=db)
-        indexer = IndexerAgent(data_layer=data_layer)
-
-        # Index the memory
-        result = await indexer.execute(
-            "index_memory",
-            {
-                "conversation_id": conversation_id,
-                "user_message": user_message,
-                "sage_response": sage_response,
-                "turn_number": turn_number,
-                "extract_facts": True,  # Enable fact extraction
-            }
-        )
+        async with ingest_session_maker() as db:
+            data_layer = DataLayerService(session=db)
+
+            # Index the memory with a pooled IndexerAgent (keeps its Claude client warm)
+            async with agent_pool.lease(IndexerAgent, data_layer=data_layer) as indexer:
+                result = await indexer.execute(
+                    "index_memory",
+                    {
+                        "conversation_id": conversation_id,
+                        "user_message": user_message,
+                        "sage_response": sage_response,
+                        "turn_number": turn_number,
+                        "extract_facts": True,  # Enable fact extraction
+                    }
+                )
+            await db.commit()
 
         if result.success:
             logger.info(
@@ -771,7 +776,6 @@ async def chat(
     # Persist memory in background (non-blocking)
     background_tasks.add_task(
         _persist_memory,
-        db,
         conversation_id,
         request.message,
         sage_response,
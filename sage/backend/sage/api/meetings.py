@@ -22,6 +22,7 @@ from sage.schemas.meeting import (
     UnifiedMeetingItem,
     UnifiedSyncResponse,
 )
+from sage.services.bulk_load import copy_insert
 from sage.services.database import get_db
 from sage.services.fireflies import get_fireflies_service
 
@@ -124,7 +125,7 @@ async def sync_meetings(
     try:
         meetings = await service.list_recent_meetings(limit=limit)
 
-        new_count = 0
+        new_rows = []
         updated_count = 0
 
         for meeting_data in meetings:
@@ -157,24 +158,22 @@ async def sync_meetings(
                 existing.last_synced_at = datetime.utcnow()
                 updated_count += 1
             else:
-                # Create new record
-                meeting_note = MeetingNote(
-                    user_id=user.id,
-                    fireflies_id=fireflies_id,
-                    title=meeting_data["title"],
-                    meeting_date=meeting_date,
-                    duration_minutes=meeting_data.get("duration_minutes"),
-                    participants=meeting_data.get("participants"),
-                    last_synced_at=datetime.utcnow(),
-                )
-                db.add(meeting_note)
-                new_count += 1
-
+                # Collect new records for a single bulk insert
+                new_rows.append({
+                    "user_id": user.id,
+                    "fireflies_id": fireflies_id,
+                    "title": meeting_data["title"],
+                    "meeting_date": meeting_date,
+                    "duration_minutes": meeting_data.get("duration_minutes"),
+                    "participants": meeting_data.get("participants"),
+                })
+
+        await copy_insert(db, MeetingNote.__table__, new_rows)
         await db.commit()
 
         return MeetingSyncResponse(
             synced_count=len(meetings),
-            new_count=new_count,
+            new_count=len(new_rows),
             updated_count=updated_count,
         )
     except Exception as e:
@@ -573,6 +572,7 @@ async def sync_unified_meetings(
     if service.is_configured:
         try:
             meetings = await service.list_recent_meetings(limit=limit)
+            new_rows = []
 
             for meeting_data in meetings:
                 fireflies_id = meeting_data["id"]
@@ -601,18 +601,17 @@ async def sync_unified_meetings(
                     existing.last_synced_at = datetime.utcnow()
                     fireflies_updated += 1
                 else:
-                    meeting_note = MeetingNote(
-                        user_id=user.id,
-                        fireflies_id=fireflies_id,
-                        title=meeting_data["title"],
-                        meeting_date=meeting_date,
-                        duration_minutes=meeting_data.get("duration_minutes"),
-                        participants=meeting_data.get("participants"),
-                        last_synced_at=datetime.utcnow(),
-                    )
-                    db.add(meeting_note)
-                    fireflies_new += 1
-
+                    new_rows.append({
+                        "user_id": user.id,
+                        "fireflies_id": fireflies_id,
+                        "title": meeting_data["title"],
+                        "meeting_date": meeting_date,
+                        "duration_minutes": meeting_data.get("duration_minutes"),
+                        "participants": meeting_data.get("participants"),
+                    })
+
+            await copy_insert(db, MeetingNote.__table__, new_rows)
+            fireflies_new = len(new_rows)
             await db.commit()
             fireflies_synced = len(meetings)
         except Exception as e:
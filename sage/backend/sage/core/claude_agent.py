@@ -3,7 +3,8 @@
 import json
 from typing import Any
 
-from anthropic import Anthropic
+import httpx
+from anthropic import Anthropic, AsyncAnthropic, DefaultAsyncHttpxClient
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -548,3 +549,20 @@ async def get_claude_agent() -> ClaudeAgent:
     if _agent is None:
         _agent = ClaudeAgent()
     return _agent
+
+
+# Shared async client, so agents created per request reuse one connection pool
+_async_client: AsyncAnthropic | None = None
+
+
+def get_async_anthropic() -> AsyncAnthropic:
+    """Get the process-wide AsyncAnthropic client."""
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncAnthropic(
+            api_key=settings.anthropic_api_key,
+            http_client=DefaultAsyncHttpxClient(
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+            ),
+        )
+    return _async_client
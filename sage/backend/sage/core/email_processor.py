@@ -1,9 +1,12 @@
 """Email processing and sync logic."""
 
 import asyncio
+import base64
 import logging
 import uuid
+from collections import deque
 from datetime import datetime, timedelta
+from email.utils import getaddresses, parseaddr
 from typing import Any, Callable, TYPE_CHECKING
 
 from google.oauth2.credentials import Credentials
@@ -23,6 +26,15 @@ if TYPE_CHECKING:
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+# Gmail's internalDate is epoch milliseconds (UTC)
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _from_gmail_internal_date(internal_date_ms: int) -> datetime:
+    """Convert a Gmail internalDate to a naive UTC datetime."""
+    return _EPOCH + timedelta(milliseconds=internal_date_ms)
+
+
 # In-memory storage for import progress (could be moved to Redis for production)
 _import_progress: dict[str, BulkImportProgress] = {}
 
@@ -301,8 +313,8 @@ class EmailProcessor:
         from_header = headers.get("from", "")
         sender_email, sender_name = self._parse_email_address(from_header)
 
-        # Extract body
-        body_text = self._extract_body(email_data.get("payload", {}))
+        # Extract body and attachment flag in one walk of the MIME tree
+        body_text, has_attachments = self._walk_payload(email_data.get("payload", {}))
 
         # Create email cache entry
         email = EmailCache(
@@ -318,10 +330,8 @@ class EmailProcessor:
             snippet=email_data.get("snippet"),
             labels=email_data.get("labelIds", []),
             is_unread="UNREAD" in email_data.get("labelIds", []),
-            has_attachments=self._has_attachments(email_data.get("payload", {})),
-            received_at=datetime.fromtimestamp(
-                int(email_data.get("internalDate", 0)) / 1000
-            ),
+            has_attachments=has_attachments,
+            received_at=_from_gmail_internal_date(int(email_data.get("internalDate", 0))),
         )
 
         self.db.add(email)
@@ -411,51 +421,43 @@ class EmailProcessor:
 
     def _parse_email_address(self, header: str) -> tuple[str, str | None]:
         """Parse email address from header like 'Name <email@example.com>'."""
-        import re
-
-        match = re.match(r"^(.+?)\s*<(.+?)>$", header.strip())
-        if match:
-            return match.group(2), match.group(1).strip('"')
-        return header.strip(), None
+        name, address = parseaddr(header)
+        return address, name or None
 
     def _parse_email_list(self, header: str) -> list[str]:
-        """Parse comma-separated email addresses."""
+        """Parse the addresses out of a To/Cc header."""
         if not header:
             return []
-        return [e.strip() for e in header.split(",") if e.strip()]
-
-    def _extract_body(self, payload: dict) -> str | None:
-        """Extract plain text body from email payload."""
-        import base64
+        return [address for _, address in getaddresses([header]) if address]
 
-        mime_type = payload.get("mimeType", "")
+    def _walk_payload(self, payload: dict) -> tuple[str | None, bool]:
+        """
+        Extract the plain text body and detect attachments in one pass.
 
-        if mime_type == "text/plain":
-            data = payload.get("body", {}).get("data", "")
-            if data:
-                return base64.urlsafe_b64decode(data).decode("utf-8", errors="ignore")
+        Walks the MIME tree iteratively in document order, so the body is the
+        first text/plain part, and stops as soon as both answers are known.
 
-        # Check parts for multipart messages
-        for part in payload.get("parts", []):
-            if part.get("mimeType") == "text/plain":
+        Returns:
+            Tuple of (body_text, has_attachments)
+        """
+        b64decode = base64.urlsafe_b64decode
+        body_text = None
+        has_attachments = False
+        pending = deque([payload])
+        while pending:
+            part = pending.popleft()
+            if body_text is None and part.get("mimeType") == "text/plain":
                 data = part.get("body", {}).get("data", "")
                 if data:
-                    return base64.urlsafe_b64decode(data).decode("utf-8", errors="ignore")
-            # Recursively check nested parts
-            body = self._extract_body(part)
-            if body:
-                return body
-
-        return None
-
-    def _has_attachments(self, payload: dict) -> bool:
-        """Check if email has attachments."""
-        for part in payload.get("parts", []):
-            if part.get("filename"):
-                return True
-            if self._has_attachments(part):
-                return True
-        return False
+                    body_text = b64decode(data).decode("utf-8", errors="ignore")
+            children = part.get("parts", [])
+            if not has_attachments:
+                has_attachments = any(child.get("filename") for child in children)
+            if body_text is not None and has_attachments:
+                break
+            # Children go to the front, in order, so the walk stays depth-first
+            pending.extendleft(reversed(children))
+        return body_text, has_attachments
 
     async def sync_emails_by_query(self, query: str, max_results: int = 100) -> int:
         """Sync emails from Gmail matching a search query.
@@ -884,12 +886,12 @@ class BulkEmailImporter:
         from_header = headers.get("from", "")
         sender_email, sender_name = self._parse_email_address(from_header)
 
-        # Extract body
-        body_text = self._extract_body(email_data.get("payload", {}))
+        # Extract body and attachment flag in one walk of the MIME tree
+        body_text, has_attachments = self._walk_payload(email_data.get("payload", {}))
 
         # Parse received date
-        internal_date = int(email_data.get("internalDate", 0)) / 1000
-        received_at = datetime.fromtimestamp(internal_date) if internal_date else datetime.utcnow()
+        internal_date = int(email_data.get("internalDate", 0))
+        received_at = _from_gmail_internal_date(internal_date) if internal_date else datetime.utcnow()
 
         # Truncate fields to match database constraints
         subject = headers.get("subject", "(No Subject)")
@@ -919,7 +921,7 @@ class BulkEmailImporter:
             snippet=email_data.get("snippet"),
             labels=email_data.get("labelIds", []),
             is_unread="UNREAD" in email_data.get("labelIds", []),
-            has_attachments=self._has_attachments(email_data.get("payload", {})),
+            has_attachments=has_attachments,
             received_at=received_at,
         )
 
@@ -969,45 +971,40 @@ class BulkEmailImporter:
     # Helper methods (same as EmailProcessor)
     def _parse_email_address(self, header: str) -> tuple[str, str | None]:
         """Parse email address from header like 'Name <email@example.com>'."""
-        import re
-        match = re.match(r"^(.+?)\s*<(.+?)>$", header.strip())
-        if match:
-            return match.group(2), match.group(1).strip('"')
-        return header.strip(), None
+        name, address = parseaddr(header)
+        return address, name or None
 
     def _parse_email_list(self, header: str) -> list[str]:
-        """Parse comma-separated email addresses."""
+        """Parse the addresses out of a To/Cc header."""
         if not header:
             return []
-        return [e.strip() for e in header.split(",") if e.strip()]
+        return [address for _, address in getaddresses([header]) if address]
 
-    def _extract_body(self, payload: dict) -> str | None:
-        """Extract plain text body from email payload."""
-        import base64
-
-        mime_type = payload.get("mimeType", "")
+    def _walk_payload(self, payload: dict) -> tuple[str | None, bool]:
+        """
+        Extract the plain text body and detect attachments in one pass.
 
-        if mime_type == "text/plain":
-            data = payload.get("body", {}).get("data", "")
-            if data:
-                return base64.urlsafe_b64decode(data).decode("utf-8", errors="ignore")
+        Walks the MIME tree iteratively in document order, so the body is the
+        first text/plain part, and stops as soon as both answers are known.
 
-        for part in payload.get("parts", []):
-            if part.get("mimeType") == "text/plain":
+        Returns:
+            Tuple of (body_text, has_attachments)
+        """
+        b64decode = base64.urlsafe_b64decode
+        body_text = None
+        has_attachments = False
+        pending = deque([payload])
+        while pending:
+            part = pending.popleft()
+            if body_text is None and part.get("mimeType") == "text/plain":
                 data = part.get("body", {}).get("data", "")
                 if data:
-                    return base64.urlsafe_b64decode(data).decode("utf-8", errors="ignore")
-            body = self._extract_body(part)
-            if body:
-                return body
-
-        return None
-
-    def _has_attachments(self, payload: dict) -> bool:
-        """Check if email has attachments."""
-        for part in payload.get("parts", []):
-            if part.get("filename"):
-                return True
-            if self._has_attachments(part):
-                return True
-        return False
+                    body_text = b64decode(data).decode("utf-8", errors="ignore")
+            children = part.get("parts", [])
+            if not has_attachments:
+                has_attachments = any(child.get("filename") for child in children)
+            if body_text is not None and has_attachments:
+                break
+            # Children go to the front, in order, so the walk stays depth-first
+            pending.extendleft(reversed(children))
+        return body_text, has_attachments
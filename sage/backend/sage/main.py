@@ -9,7 +9,8 @@ import redis.asyncio as redis
 
 from sage.config import get_settings
 from sage.api import auth, emails, followups, todos, calendar, briefings, chat, dashboard, meetings
-from sage.services.database import init_db, close_db
+from sage.services.database import init_db, close_db, pool_stats
+from sage.agents.pool import agent_pool
 from sage.scheduler.jobs import start_scheduler, stop_scheduler
 
 settings = get_settings()
@@ -71,6 +72,8 @@ async def health_check() -> dict:
         "status": "healthy",
         "app": settings.app_name,
         "version": settings.app_version,
+        "db_pool": pool_stats(),
+        "agent_pool": agent_pool.get_stats(),
     }
 
 
@@ -3,10 +3,10 @@
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import String, DateTime, Text, Integer, ForeignKey, Enum as SQLEnum
+from sqlalchemy import String, DateTime, Text, Integer, ForeignKey, Enum as SQLEnum, func
 from sqlalchemy.orm import Mapped, mapped_column
 
-from sage.services.database import Base
+from sage.services.database import Base, BigIntId
 
 
 class ContactCategory(str, Enum):
@@ -26,7 +26,7 @@ class Contact(Base):
 
     __tablename__ = "contacts"
 
-    id: Mapped[int] = mapped_column(primary_key=True)
+    id: Mapped[int] = mapped_column(BigIntId, primary_key=True)
     email: Mapped[str] = mapped_column(String(255), unique=True, index=True)
     name: Mapped[str | None] = mapped_column(String(255), nullable=True)
     company: Mapped[str | None] = mapped_column(String(255), nullable=True)
@@ -39,17 +39,18 @@ class Contact(Base):
             ContactCategory,
             values_callable=lambda x: [e.value for e in x],
         ),
-        default=ContactCategory.OTHER
+        default=ContactCategory.OTHER,
+        server_default=ContactCategory.OTHER.value,
     )
 
     # Escalation chain (for follow-up escalation)
     reports_to_id: Mapped[int | None] = mapped_column(
-        ForeignKey("contacts.id"), nullable=True
+        BigIntId, ForeignKey("contacts.id"), nullable=True, index=True
     )
     supervisor_email: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
     # Response expectations
-    expected_response_days: Mapped[int] = mapped_column(Integer, default=2)
+    expected_response_days: Mapped[int] = mapped_column(Integer, default=2, server_default="2")
 
     # Notes and context
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -58,10 +59,12 @@ class Contact(Base):
     # Interaction tracking
     last_email_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     last_meeting_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
-    email_count: Mapped[int] = mapped_column(Integer, default=0)
+    email_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, server_default=func.now()
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, server_default=func.now()
     )
@@ -3,11 +3,13 @@
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import String, DateTime, Text, Integer, Enum as SQLEnum, Index
+from sqlalchemy import (
+    String, DateTime, Text, Integer, Enum as SQLEnum, Index, CheckConstraint, desc, false, func, true,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import ARRAY
 
-from sage.services.database import Base
+from sage.services.database import Base, BigIntId, UTCDateTime
 
 
 class EmailCategory(str, Enum):
@@ -36,7 +38,7 @@ class EmailCache(Base):
 
     __tablename__ = "email_cache"
 
-    id: Mapped[int] = mapped_column(primary_key=True)
+    id: Mapped[int] = mapped_column(BigIntId, primary_key=True)
 
     # Gmail identifiers
     gmail_id: Mapped[str] = mapped_column(String(255), unique=True, index=True)
@@ -45,7 +47,7 @@ class EmailCache(Base):
 
     # Email content
     subject: Mapped[str] = mapped_column(String(500))
-    sender_email: Mapped[str] = mapped_column(String(255), index=True)
+    sender_email: Mapped[str] = mapped_column(String(255))
     sender_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
     to_emails: Mapped[list[str] | None] = mapped_column(ARRAY(String(255)), nullable=True)
     cc_emails: Mapped[list[str] | None] = mapped_column(ARRAY(String(255)), nullable=True)
@@ -55,17 +57,27 @@ class EmailCache(Base):
 
     # Gmail metadata
     labels: Mapped[list[str] | None] = mapped_column(ARRAY(String(100)), nullable=True)
-    is_unread: Mapped[bool] = mapped_column(default=True)
-    has_attachments: Mapped[bool] = mapped_column(default=False)
-    received_at: Mapped[datetime] = mapped_column(DateTime, index=True)
+    is_unread: Mapped[bool] = mapped_column(default=True, server_default=true())
+    has_attachments: Mapped[bool] = mapped_column(default=False, server_default=false())
+    received_at: Mapped[datetime] = mapped_column(UTCDateTime, index=True)
 
     # AI analysis results
     category: Mapped[EmailCategory | None] = mapped_column(
-        SQLEnum(EmailCategory, values_callable=lambda x: [e.value for e in x]),
+        SQLEnum(
+            EmailCategory,
+            values_callable=lambda x: [e.value for e in x],
+            native_enum=False,
+            length=20,
+        ),
         nullable=True
     )
     priority: Mapped[EmailPriority | None] = mapped_column(
-        SQLEnum(EmailPriority, values_callable=lambda x: [e.value for e in x]),
+        SQLEnum(
+            EmailPriority,
+            values_callable=lambda x: [e.value for e in x],
+            native_enum=False,
+            length=20,
+        ),
         nullable=True
     )
     summary: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -77,11 +89,30 @@ class EmailCache(Base):
     qdrant_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
     # Timestamps
-    synced_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    synced_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, server_default=func.now()
+    )
     analyzed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
     __table_args__ = (
-        Index("ix_email_cache_received_sender", "received_at", "sender_email"),
+        # Serves "from sender X within a time window" lookups
+        Index("ix_email_cache_sender_received", "sender_email", desc("received_at")),
+        # Created by migrations 010 and 014; declared here so a squashed init
+        # builds the same schema
+        CheckConstraint(
+            "category IN ({})".format(", ".join(f"'{c.value}'" for c in EmailCategory)),
+            name="ck_email_cache_category",
+        ).ddl_if(dialect="postgresql"),
+        CheckConstraint(
+            "priority IN ({})".format(", ".join(f"'{p.value}'" for p in EmailPriority)),
+            name="ck_email_cache_priority",
+        ).ddl_if(dialect="postgresql"),
+        CheckConstraint(
+            "char_length(body_html) < 2097152",
+            name="ck_email_cache_body_html_length",
+        ).ddl_if(dialect="postgresql"),
+        # Set by migration 015: leaves room on each page for HOT updates
+        {"postgresql_with": {"fillfactor": 85}},
     )
 
     @property
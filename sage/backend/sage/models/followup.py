@@ -4,10 +4,10 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, DateTime, Text, Integer, ForeignKey, Enum as SQLEnum, Index
+from sqlalchemy import String, DateTime, Text, Integer, ForeignKey, Enum as SQLEnum, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from sage.services.database import Base
+from sage.services.database import Base, BigIntId, UTCDateTime
 
 if TYPE_CHECKING:
     from sage.models.user import User
@@ -37,22 +37,24 @@ class Followup(Base):
 
     __tablename__ = "followups"
 
-    id: Mapped[int] = mapped_column(primary_key=True)
+    id: Mapped[int] = mapped_column(BigIntId, primary_key=True)
 
     # User relationship
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True)
+    user_id: Mapped[int] = mapped_column(BigIntId, ForeignKey("users.id"), index=True)
     user: Mapped["User"] = relationship(back_populates="followups")
 
     # Email reference (nullable for meeting-based followups)
     email_id: Mapped[int | None] = mapped_column(
-        ForeignKey("email_cache.id"), nullable=True
+        BigIntId, ForeignKey("email_cache.id"), nullable=True, index=True
     )
     gmail_id: Mapped[str | None] = mapped_column(String(255), nullable=True, index=True)
     thread_id: Mapped[str | None] = mapped_column(String(255), nullable=True, index=True)
     subject: Mapped[str] = mapped_column(String(500))
 
     # Source tracking (where the followup came from)
-    source_type: Mapped[str] = mapped_column(String(50), default="email")  # email, meeting
+    source_type: Mapped[str] = mapped_column(
+        String(50), nullable=True, default="email", server_default="email"
+    )  # email, meeting
     source_id: Mapped[str | None] = mapped_column(String(255), nullable=True)  # meeting_id if from meeting
 
     # Contact info
@@ -63,13 +65,14 @@ class Followup(Base):
     status: Mapped[FollowupStatus] = mapped_column(
         SQLEnum(FollowupStatus, values_callable=lambda x: [e.value for e in x]),
         default=FollowupStatus.PENDING,
-        index=True
+        server_default=FollowupStatus.PENDING.value,
     )
     priority: Mapped[FollowupPriority] = mapped_column(
         SQLEnum(FollowupPriority, values_callable=lambda x: [e.value for e in x]),
-        default=FollowupPriority.NORMAL
+        default=FollowupPriority.NORMAL,
+        server_default=FollowupPriority.NORMAL.value,
     )
-    due_date: Mapped[datetime] = mapped_column(DateTime, index=True)
+    due_date: Mapped[datetime] = mapped_column(UTCDateTime, index=True)
 
     # Notes and context
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -77,7 +80,7 @@ class Followup(Base):
 
     # Escalation settings
     escalation_email: Mapped[str | None] = mapped_column(String(255), nullable=True)
-    escalation_days: Mapped[int] = mapped_column(Integer, default=7)
+    escalation_days: Mapped[int] = mapped_column(Integer, default=7, server_default="7")
 
     # Action timestamps
     reminder_sent_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
@@ -86,14 +89,19 @@ class Followup(Base):
     completed_reason: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, server_default=func.now()
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, server_default=func.now()
     )
 
     __table_args__ = (
         Index("ix_followups_status_due", "status", "due_date"),
+        Index("ix_followups_source", "source_type", "source_id"),
         Index("ix_followups_user_status", "user_id", "status"),
+        # Set by migration 016: leaves room on each page for HOT updates
+        {"postgresql_with": {"fillfactor": 80}},
     )
 
     def mark_reminded(self) -> None:
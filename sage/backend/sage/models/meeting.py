@@ -7,7 +7,7 @@ from sqlalchemy import String, DateTime, Text, Integer, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 
-from sage.services.database import Base
+from sage.services.database import Base, BigIntId
 
 if TYPE_CHECKING:
     from sage.models.user import User
@@ -18,10 +18,10 @@ class MeetingNote(Base):
 
     __tablename__ = "meeting_notes"
 
-    id: Mapped[int] = mapped_column(primary_key=True)
+    id: Mapped[int] = mapped_column(BigIntId, primary_key=True)
 
     # User relationship
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True)
+    user_id: Mapped[int] = mapped_column(BigIntId, ForeignKey("users.id"), index=True)
     user: Mapped["User"] = relationship(back_populates="meeting_notes")
 
     # Fireflies identifiers
@@ -29,7 +29,7 @@ class MeetingNote(Base):
 
     # Meeting metadata
     title: Mapped[str] = mapped_column(String(500))
-    meeting_date: Mapped[datetime | None] = mapped_column(DateTime, nullable=True, index=True)
+    meeting_date: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     duration_minutes: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
     # Participants
@@ -41,8 +41,13 @@ class MeetingNote(Base):
     action_items: Mapped[list[str] | None] = mapped_column(ARRAY(String), nullable=True)
     keywords: Mapped[list[str] | None] = mapped_column(ARRAY(String), nullable=True)
 
-    # Full transcript stored as JSON array of {speaker, text, timestamp}
-    transcript: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    # Full transcript stored as JSON array of {speaker, text, timestamp}.
+    # Often hundreds of KB, so it is only fetched when a query asks for it
+    # with .options(undefer(MeetingNote.transcript)); touching it otherwise
+    # raises instead of lazy loading.
+    transcript: Mapped[dict | None] = mapped_column(
+        JSONB, nullable=True, deferred=True, deferred_raiseload=True
+    )
 
     # Cache management
     last_synced_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
@@ -4,10 +4,12 @@ from datetime import datetime, date
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, DateTime, Date, Text, Integer, ForeignKey, Enum as SQLEnum, Index
+from sqlalchemy import (
+    String, DateTime, Date, Text, Integer, ForeignKey, Enum as SQLEnum, Index, CheckConstraint, func,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from sage.services.database import Base
+from sage.services.database import Base, BigIntId
 
 if TYPE_CHECKING:
     from sage.models.user import User
@@ -46,10 +48,10 @@ class TodoItem(Base):
 
     __tablename__ = "todo_items"
 
-    id: Mapped[int] = mapped_column(primary_key=True)
+    id: Mapped[int] = mapped_column(BigIntId, primary_key=True)
 
     # User relationship
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True)
+    user_id: Mapped[int] = mapped_column(BigIntId, ForeignKey("users.id"))
     user: Mapped["User"] = relationship(back_populates="todos")
 
     # Core todo info
@@ -64,12 +66,18 @@ class TodoItem(Base):
     priority: Mapped[TodoPriority] = mapped_column(
         SQLEnum(TodoPriority, values_callable=lambda x: [e.value for e in x]),
         default=TodoPriority.NORMAL,
+        server_default=TodoPriority.NORMAL.value,
         index=True
     )
     status: Mapped[TodoStatus] = mapped_column(
-        SQLEnum(TodoStatus, values_callable=lambda x: [e.value for e in x]),
+        SQLEnum(
+            TodoStatus,
+            values_callable=lambda x: [e.value for e in x],
+            native_enum=False,
+            length=20,
+        ),
         default=TodoStatus.PENDING,
-        index=True
+        server_default=TodoStatus.PENDING.value,
     )
 
     # Timing
@@ -94,16 +102,26 @@ class TodoItem(Base):
     completed_reason: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, server_default=func.now()
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, server_default=func.now()
     )
 
     __table_args__ = (
         Index("ix_todo_status_due", "status", "due_date"),
         Index("ix_todo_user_status", "user_id", "status"),
-        Index("ix_todo_user_priority", "user_id", "priority"),
+        Index("ix_todo_items_created_brin", "created_at", postgresql_using="brin"),
         Index("ix_todo_source", "source_type", "source_id"),
+        # Created by migration 010; declared here so a squashed init builds
+        # the same schema
+        CheckConstraint(
+            "status IN ({})".format(", ".join(f"'{s.value}'" for s in TodoStatus)),
+            name="ck_todo_items_status",
+        ).ddl_if(dialect="postgresql"),
+        # Set by migration 016: leaves room on each page for HOT updates
+        {"postgresql_with": {"fillfactor": 80}},
     )
 
     def mark_completed(self, reason: str = "Completed") -> None:
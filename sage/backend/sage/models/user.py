@@ -3,10 +3,10 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, DateTime, Text, Boolean
+from sqlalchemy import String, DateTime, Text, Boolean, func, true
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from sage.services.database import Base
+from sage.services.database import Base, BigIntId
 
 if TYPE_CHECKING:
     from sage.models.followup import Followup
@@ -19,7 +19,7 @@ class User(Base):
 
     __tablename__ = "users"
 
-    id: Mapped[int] = mapped_column(primary_key=True)
+    id: Mapped[int] = mapped_column(BigIntId, primary_key=True)
     email: Mapped[str] = mapped_column(String(255), unique=True, index=True)
     name: Mapped[str] = mapped_column(String(255))
     picture: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -30,13 +30,17 @@ class User(Base):
     google_token_expires_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
     # User settings
-    is_active: Mapped[bool] = mapped_column(Boolean, default=True)
-    timezone: Mapped[str] = mapped_column(String(50), default="America/New_York")
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, server_default=true())
+    timezone: Mapped[str] = mapped_column(
+        String(50), default="America/New_York", server_default="America/New_York"
+    )
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, server_default=func.now()
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, server_default=func.now()
     )
     last_login_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
@@ -8,7 +8,7 @@ from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
 from sage.config import get_settings
-from sage.services.database import async_session_maker
+from sage.services.database import async_session_maker, ingest_session_maker
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
@@ -24,7 +24,7 @@ async def email_sync_job():
     """
     logger.info("Starting email sync job")
     try:
-        async with async_session_maker() as db:
+        async with ingest_session_maker() as db:
             from sage.core.email_processor import EmailProcessor
 
             processor = EmailProcessor(db)
@@ -11,6 +11,7 @@ from sqlalchemy import func, select, and_, distinct
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from sage.models.email import EmailCache
+from sage.services.bulk_load import copy_insert
 from sage.services.data_layer.models.indexed_entity import IndexedEntityModel
 
 
@@ -530,6 +531,7 @@ class BehavioralAnalyzer:
             List of entity IDs created
         """
         entity_ids = []
+        new_rows = []
 
         for vip in insights.vip_contacts:
             entity_id = f"insight_vip_{vip.email.replace('@', '_at_')}"
@@ -561,22 +563,23 @@ class BehavioralAnalyzer:
                 existing.updated_at = datetime.utcnow()
                 existing.deleted_at = None
             else:
-                model = IndexedEntityModel(
-                    id=entity_id,
-                    entity_type="insight",
-                    source="behavioral_analyzer",
-                    structured=data,
-                    analyzed={
+                # Keyed by column name for copy_insert ("metadata", not "metadata_")
+                new_rows.append({
+                    "id": entity_id,
+                    "entity_type": "insight",
+                    "source": "behavioral_analyzer",
+                    "structured": data,
+                    "analyzed": {
                         "summary": f"VIP contact: {vip.name or vip.email} - "
                                   f"{vip.response_rate:.0f}% response rate, "
                                   f"{vip.total_received} emails",
                     },
-                    metadata_={"insight_type": "vip_contact"},
-                )
-                session.add(model)
+                    "metadata": {"insight_type": "vip_contact"},
+                })
 
             entity_ids.append(entity_id)
 
         await session.flush()
+        await copy_insert(session, IndexedEntityModel.__table__, new_rows)
         logger.info(f"Saved {len(entity_ids)} VIP contact insights")
         return entity_ids
@@ -0,0 +1,239 @@
+"""Bulk loading helpers for large imports into PostgreSQL."""
+
+import json
+import logging
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timezone
+from enum import Enum
+from typing import Any
+
+from sqlalchemy import JSON, Table, insert, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+# Below this many rows a plain multi-row INSERT is as fast as COPY
+COPY_THRESHOLD = 100
+
+
+def _fill_defaults(table: Table, row: dict[str, Any]) -> dict[str, Any]:
+    """Apply Python-side column defaults that COPY would otherwise skip."""
+    filled = dict(row)
+    for column in table.columns:
+        if column.name in filled or column.default is None:
+            continue
+        default = column.default
+        if default.is_scalar:
+            filled[column.name] = default.arg
+        elif default.is_callable:
+            filled[column.name] = default.arg(None)
+    return filled
+
+
+def _csv_text(value: Any) -> str:
+    """Render a non-NULL value the way PostgreSQL's text input expects it."""
+    if isinstance(value, Enum):
+        return str(value.value)
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, datetime):
+        # Naive datetimes are UTC throughout the app; without an explicit
+        # offset a timestamptz column would read them in the session TimeZone
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return json.dumps(value)
+    if isinstance(value, (list, tuple)):
+        items = (
+            "NULL" if item is None
+            else '"' + _csv_text(item).replace("\\", "\\\\").replace('"', '\\"') + '"'
+            for item in value
+        )
+        return "{" + ",".join(items) + "}"
+    return str(value)
+
+
+async def _csv_lines(records: Sequence[tuple]) -> AsyncIterator[bytes]:
+    """
+    Encode records as CSV for COPY ... (FORMAT csv).
+
+    Every non-NULL field is quoted, so an unquoted empty field is
+    unambiguously NULL and an empty string stays an empty string.
+    """
+    for record in records:
+        fields = (
+            "" if value is None
+            else '"' + _csv_text(value).replace('"', '""') + '"'
+            for value in record
+        )
+        yield (",".join(fields) + "\n").encode("utf-8")
+
+
+async def copy_insert(
+    session: AsyncSession,
+    table: Table,
+    rows: Sequence[dict[str, Any]],
+    columns: Sequence[str] | None = None,
+    freeze: bool = False,
+) -> int:
+    """
+    Insert many rows, using PostgreSQL COPY for large batches.
+
+    Rows are keyed by column name (not ORM attribute name). Batches of at
+    least COPY_THRESHOLD rows on asyncpg are streamed with
+    copy_records_to_table, which skips per-statement planning and runs in
+    the session's current transaction. Smaller batches, or other drivers,
+    fall back to an executemany INSERT.
+
+    Unlike session.add(), no ORM events fire and generated primary keys are
+    not returned, so use this only for rows that are not needed as ORM
+    objects afterwards.
+
+    Args:
+        session: Session whose transaction the rows are written in
+        table: Target table (e.g. ``MeetingNote.__table__``)
+        rows: Row dicts keyed by column name
+        columns: Columns to write (defaults to the union of row keys)
+        freeze: COPY with FREEZE so the rows are written already frozen.
+            Only valid when the table was created or truncated earlier in
+            the same transaction (see initial_import_session)
+
+    Returns:
+        Number of rows written
+    """
+    if not rows:
+        return 0
+
+    rows = [_fill_defaults(table, row) for row in rows]
+    if columns is None:
+        columns = list(dict.fromkeys(key for row in rows for key in row))
+
+    conn = await session.connection()
+    if len(rows) < COPY_THRESHOLD or conn.dialect.driver != "asyncpg":
+        await session.execute(
+            insert(table), [{c: row.get(c) for c in columns} for row in rows]
+        )
+        return len(rows)
+
+    # asyncpg's binary COPY expects JSON columns as already-encoded text
+    json_columns = {c for c in columns if isinstance(table.c[c].type, JSON)}
+    records = [
+        tuple(
+            json.dumps(row.get(c)) if c in json_columns and row.get(c) is not None
+            else row.get(c)
+            for c in columns
+        )
+        for row in rows
+    ]
+
+    raw = await conn.get_raw_connection()
+    if freeze:
+        # FREEZE isn't available with copy_records_to_table's binary COPY
+        await raw.driver_connection.copy_to_table(
+            table.name,
+            source=_csv_lines(records),
+            columns=list(columns),
+            schema_name=table.schema,
+            format="csv",
+            freeze=True,
+        )
+    else:
+        await raw.driver_connection.copy_records_to_table(
+            table.name,
+            records=records,
+            columns=list(columns),
+            schema_name=table.schema,
+        )
+    logger.info(f"Copied {len(records)} rows into {table.name}")
+    return len(records)
+
+
+@asynccontextmanager
+async def disable_fks(session: AsyncSession, tables: Sequence[str]) -> AsyncIterator[None]:
+    """
+    Suspend foreign key checks on tables for the duration of a bulk load.
+
+    Issues ALTER TABLE ... DISABLE TRIGGER ALL, which turns off the internal
+    triggers PostgreSQL uses to enforce foreign keys, and re-enables them on
+    exit. Rows written inside the block are never re-checked, so only load
+    data whose references are known to be valid. Requires table ownership
+    and superuser (system triggers cannot be disabled otherwise).
+
+    The block runs in a savepoint: if it raises, its writes are rolled back
+    and the triggers are still re-enabled before the exception propagates.
+
+    Usage:
+        async with disable_fks(session, ["followups", "contacts"]):
+            await copy_insert(session, Followup.__table__, rows)
+
+    Args:
+        session: Session whose transaction the load runs in
+        tables: Names of the tables being loaded
+    """
+    conn = await session.connection()
+    quoted = [conn.dialect.identifier_preparer.quote(name) for name in tables]
+
+    for name in quoted:
+        await session.execute(text(f"ALTER TABLE {name} DISABLE TRIGGER ALL"))
+
+    # The savepoint rolls a failed body back, so the transaction is usable
+    # again and the triggers are re-enabled however the block exits
+    try:
+        async with session.begin_nested():
+            yield
+    finally:
+        for name in quoted:
+            await session.execute(text(f"ALTER TABLE {name} ENABLE TRIGGER ALL"))
+
+
+@asynccontextmanager
+async def initial_import_session(
+    session: AsyncSession,
+    tables: Sequence[str],
+    truncate: bool = False,
+) -> AsyncIterator[None]:
+    """
+    Tune the current transaction for seeding empty tables.
+
+    Sets synchronous_commit = OFF (the commit doesn't wait for the WAL
+    flush; a crash can lose the import but never corrupts the database)
+    and raises maintenance_work_mem, both scoped with SET LOCAL to this
+    transaction only. With truncate=True, the tables are emptied first so
+    that copy_insert(..., freeze=True) is allowed and the loaded rows never
+    need a later VACUUM FREEZE pass.
+
+    The TRUNCATE deliberately has no CASCADE, so nothing outside ``tables``
+    is ever emptied. PostgreSQL rejects it unless every table with a
+    foreign key into the list is listed too (e.g. followups, which
+    references email_cache).
+
+    The caller commits once the load is done:
+
+        async with initial_import_session(
+            session, ["email_cache", "followups"], truncate=True
+        ):
+            await copy_insert(session, EmailCache.__table__, emails, freeze=True)
+            await copy_insert(session, Followup.__table__, followups, freeze=True)
+        await session.commit()
+
+    Args:
+        session: Session whose transaction the import runs in
+        tables: Names of the tables being seeded, including every table
+            that references them when truncating
+        truncate: TRUNCATE the tables first (required for FREEZE); all
+            existing rows in them are deleted
+    """
+    conn = await session.connection()
+    await session.execute(text("SET LOCAL synchronous_commit = OFF"))
+    await session.execute(text("SET LOCAL maintenance_work_mem = '1GB'"))
+
+    if truncate and tables:
+        quoted = ", ".join(conn.dialect.identifier_preparer.quote(name) for name in tables)
+        await session.execute(text(f"TRUNCATE {quoted}"))
+        logger.info(f"Truncated {quoted} for initial import")
+
+    yield
@@ -1,8 +1,10 @@
 """Base adapter for entity conversion between SQLAlchemy models and IndexedEntity."""
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from typing import TypeVar, Generic, Any
 
+from sqlalchemy import Select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from sage.agents.base import IndexedEntity
@@ -10,6 +12,9 @@ from sage.agents.base import IndexedEntity
 # Type variable for the SQLAlchemy model
 T = TypeVar("T")
 
+# Rows fetched per round trip when streaming query results
+STREAM_CHUNK_SIZE = 100
+
 
 class BaseEntityAdapter(ABC, Generic[T]):
     """
@@ -65,6 +70,28 @@ class BaseEntityAdapter(ABC, Generic[T]):
         """
         pass
 
+    async def get_by_ids(self, session: AsyncSession, entity_ids: list[str]) -> dict[str, T]:
+        """
+        Retrieve several models by entity ID.
+
+        Adapters whose table can be filtered on entity ID directly should
+        override this with a single query; the default calls get_by_id once
+        per ID.
+
+        Args:
+            session: Database session
+            entity_ids: The entity IDs to load
+
+        Returns:
+            Found models keyed by entity ID (missing IDs are omitted)
+        """
+        models = {}
+        for entity_id in entity_ids:
+            model = await self.get_by_id(session, entity_id)
+            if model is not None:
+                models[entity_id] = model
+        return models
+
     @abstractmethod
     async def store(self, session: AsyncSession, entity: IndexedEntity) -> str:
         """
@@ -94,6 +121,19 @@ class BaseEntityAdapter(ABC, Generic[T]):
         pass
 
     @abstractmethod
+    def build_query(self, filters: dict[str, Any], limit: int = 100) -> Select:
+        """
+        Build the select statement for a filtered query.
+
+        Args:
+            filters: Filter conditions
+            limit: Maximum results to return
+
+        Returns:
+            Select statement returning matching models
+        """
+        pass
+
     async def query(
         self,
         session: AsyncSession,
@@ -111,7 +151,35 @@ class BaseEntityAdapter(ABC, Generic[T]):
         Returns:
             List of matching models
         """
-        pass
+        result = await session.execute(self.build_query(filters, limit))
+        return list(result.scalars().all())
+
+    async def stream(
+        self,
+        session: AsyncSession,
+        filters: dict[str, Any],
+        limit: int = 100,
+    ) -> AsyncIterator[T]:
+        """
+        Stream entities matching filters through a server-side cursor.
+
+        Rows are fetched in chunks of STREAM_CHUNK_SIZE, so peak memory does
+        not grow with the size of the result.
+
+        Args:
+            session: Database session
+            filters: Filter conditions
+            limit: Maximum results to return
+
+        Yields:
+            Matching models
+        """
+        query = self.build_query(filters, limit).execution_options(
+            yield_per=STREAM_CHUNK_SIZE
+        )
+        result = await session.stream_scalars(query)
+        async for model in result:
+            yield model
 
     @abstractmethod
     def get_embedding_text(self, entity: IndexedEntity) -> str:
@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from sage.agents.base import IndexedEntity
@@ -137,34 +137,34 @@ class ContactAdapter(BaseEntityAdapter[Contact]):
             return True
         return False
 
-    async def query(
-        self,
-        session: AsyncSession,
-        filters: dict[str, Any],
-        limit: int = 100,
-    ) -> list[Contact]:
-        """Query contacts with filters."""
+    def build_query(self, filters: dict[str, Any], limit: int = 100) -> Select:
+        """Build the query for contacts matching filters."""
         query = select(Contact)
 
         # Apply filters
         if "email" in filters:
-            query = query.where(Contact.email == filters["email"])
+            if isinstance(filters["email"], list):
+                # Several addresses at once (e.g. all participants of a thread)
+                query = query.where(Contact.email.in_(filters["email"]))
+            else:
+                query = query.where(Contact.email == filters["email"])
         if "name" in filters:
             query = query.where(Contact.name.ilike(f"%{filters['name']}%"))
         if "company" in filters:
             query = query.where(Contact.company.ilike(f"%{filters['company']}%"))
         if "category" in filters:
-            if isinstance(filters["category"], str):
+            # Convert a local copy; callers may share their filters dict
+            category = filters["category"]
+            if isinstance(category, str):
                 try:
-                    filters["category"] = ContactCategory(filters["category"])
+                    category = ContactCategory(category)
                 except ValueError:
                     pass
-            query = query.where(Contact.category == filters["category"])
+            query = query.where(Contact.category == category)
 
         query = query.order_by(Contact.updated_at.desc()).limit(limit)
 
-        result = await session.execute(query)
-        return list(result.scalars().all())
+        return query
 
     def get_embedding_text(self, entity: IndexedEntity) -> str:
         """Generate embedding text for contact."""
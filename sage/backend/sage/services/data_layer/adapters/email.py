@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from sage.agents.base import IndexedEntity
@@ -126,13 +126,8 @@ class EmailAdapter(BaseEntityAdapter[EmailCache]):
             return True
         return False
 
-    async def query(
-        self,
-        session: AsyncSession,
-        filters: dict[str, Any],
-        limit: int = 100,
-    ) -> list[EmailCache]:
-        """Query emails with filters."""
+    def build_query(self, filters: dict[str, Any], limit: int = 100) -> Select:
+        """Build the query for emails matching filters."""
         query = select(EmailCache)
 
         # Apply filters
@@ -151,8 +146,7 @@ class EmailAdapter(BaseEntityAdapter[EmailCache]):
 
         query = query.order_by(EmailCache.received_at.desc()).limit(limit)
 
-        result = await session.execute(query)
-        return list(result.scalars().all())
+        return query
 
     def get_embedding_text(self, entity: IndexedEntity) -> str:
         """Generate embedding text for email."""
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from sage.agents.base import IndexedEntity
@@ -163,13 +163,8 @@ class FollowupAdapter(BaseEntityAdapter[Followup]):
             return True
         return False
 
-    async def query(
-        self,
-        session: AsyncSession,
-        filters: dict[str, Any],
-        limit: int = 100,
-    ) -> list[Followup]:
-        """Query followups with filters."""
+    def build_query(self, filters: dict[str, Any], limit: int = 100) -> Select:
+        """Build the query for followups matching filters."""
         query = select(Followup)
 
         # Apply filters
@@ -204,8 +199,7 @@ class FollowupAdapter(BaseEntityAdapter[Followup]):
 
         query = query.order_by(Followup.due_date.asc()).limit(limit)
 
-        result = await session.execute(query)
-        return list(result.scalars().all())
+        return query
 
     def get_embedding_text(self, entity: IndexedEntity) -> str:
         """Generate embedding text for followup."""
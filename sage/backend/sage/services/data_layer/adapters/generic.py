@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Any
 import uuid
 
-from sqlalchemy import select, and_
+from sqlalchemy import Select, select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from sage.agents.base import IndexedEntity
@@ -74,6 +74,22 @@ class GenericAdapter(BaseEntityAdapter[IndexedEntityModel]):
         )
         return result.scalar_one_or_none()
 
+    async def get_by_ids(
+        self, session: AsyncSession, entity_ids: list[str]
+    ) -> dict[str, IndexedEntityModel]:
+        """Retrieve several IndexedEntityModels in one query."""
+        if not entity_ids:
+            return {}
+        result = await session.execute(
+            select(IndexedEntityModel).where(
+                and_(
+                    IndexedEntityModel.id.in_(entity_ids),
+                    IndexedEntityModel.deleted_at.is_(None),
+                )
+            )
+        )
+        return {model.id: model for model in result.scalars()}
+
     async def store(self, session: AsyncSession, entity: IndexedEntity) -> str:
         """Store a generic entity (upsert)."""
         # Generate ID if not provided
@@ -82,11 +98,9 @@ class GenericAdapter(BaseEntityAdapter[IndexedEntityModel]):
 
         data = self.from_indexed_entity(entity)
 
-        # Check if exists (and not deleted)
-        existing = await session.execute(
-            select(IndexedEntityModel).where(IndexedEntityModel.id == entity.id)
-        )
-        model = existing.scalar_one_or_none()
+        # Check if exists (deleted or not); a model already loaded in this
+        # session comes from the identity map without a query
+        model = await session.get(IndexedEntityModel, entity.id)
 
         if model:
             # Update existing (even if soft-deleted, revive it)
@@ -133,13 +147,8 @@ class GenericAdapter(BaseEntityAdapter[IndexedEntityModel]):
             return True
         return False
 
-    async def query(
-        self,
-        session: AsyncSession,
-        filters: dict[str, Any],
-        limit: int = 100,
-    ) -> list[IndexedEntityModel]:
-        """Query entities with filters."""
+    def build_query(self, filters: dict[str, Any], limit: int = 100) -> Select:
+        """Build the query for entities matching filters."""
         query = select(IndexedEntityModel).where(
             and_(
                 IndexedEntityModel.entity_type == self.entity_type,
@@ -151,24 +160,22 @@ class GenericAdapter(BaseEntityAdapter[IndexedEntityModel]):
         if "source" in filters:
             query = query.where(IndexedEntityModel.source == filters["source"])
 
-        # JSONB filters for structured data
+        # JSONB filters for structured data (containment, served by the
+        # jsonb_path_ops GIN index)
         if "structured" in filters and isinstance(filters["structured"], dict):
-            for key, value in filters["structured"].items():
-                query = query.where(
-                    IndexedEntityModel.structured[key].astext == str(value)
-                )
+            query = query.where(
+                IndexedEntityModel.structured.contains(filters["structured"])
+            )
 
         # JSONB filters for metadata
         if "metadata" in filters and isinstance(filters["metadata"], dict):
-            for key, value in filters["metadata"].items():
-                query = query.where(
-                    IndexedEntityModel.metadata_[key].astext == str(value)
-                )
+            query = query.where(
+                IndexedEntityModel.metadata_.contains(filters["metadata"])
+            )
 
         query = query.order_by(IndexedEntityModel.created_at.desc()).limit(limit)
 
-        result = await session.execute(query)
-        return list(result.scalars().all())
+        return query
 
     def get_embedding_text(self, entity: IndexedEntity) -> str:
         """Generate embedding text for generic entity."""
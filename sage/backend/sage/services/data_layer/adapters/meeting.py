@@ -3,8 +3,9 @@
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
 from sage.agents.base import IndexedEntity
 from sage.models.meeting import MeetingNote
@@ -77,7 +78,9 @@ class MeetingAdapter(BaseEntityAdapter[MeetingNote]):
         """Retrieve MeetingNote by entity ID."""
         fireflies_id = self.parse_entity_id(entity_id)
         result = await session.execute(
-            select(MeetingNote).where(MeetingNote.fireflies_id == fireflies_id)
+            select(MeetingNote)
+            .where(MeetingNote.fireflies_id == fireflies_id)
+            .options(undefer(MeetingNote.transcript))
         )
         return result.scalar_one_or_none()
 
@@ -124,14 +127,9 @@ class MeetingAdapter(BaseEntityAdapter[MeetingNote]):
             return True
         return False
 
-    async def query(
-        self,
-        session: AsyncSession,
-        filters: dict[str, Any],
-        limit: int = 100,
-    ) -> list[MeetingNote]:
-        """Query meetings with filters."""
-        query = select(MeetingNote)
+    def build_query(self, filters: dict[str, Any], limit: int = 100) -> Select:
+        """Build the query for meetings matching filters."""
+        query = select(MeetingNote).options(undefer(MeetingNote.transcript))
 
         # Apply filters
         if "user_id" in filters:
@@ -148,8 +146,7 @@ class MeetingAdapter(BaseEntityAdapter[MeetingNote]):
 
         query = query.order_by(MeetingNote.meeting_date.desc()).limit(limit)
 
-        result = await session.execute(query)
-        return list(result.scalars().all())
+        return query
 
     def get_embedding_text(self, entity: IndexedEntity) -> str:
         """Generate embedding text for meeting."""
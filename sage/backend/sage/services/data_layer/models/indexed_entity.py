@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import String, DateTime, Text, Index
+from sqlalchemy import String, DateTime, Text, Index, func
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import JSONB
 
@@ -42,9 +42,11 @@ class IndexedEntityModel(Base):
     qdrant_point_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, server_default=func.now()
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, server_default=func.now()
     )
 
     # Soft delete support
@@ -53,14 +55,16 @@ class IndexedEntityModel(Base):
     __table_args__ = (
         Index("ix_indexed_entities_type_created", "entity_type", "created_at"),
         Index(
-            "ix_indexed_entities_structured",
+            "ix_indexed_entities_structured_path",
             "structured",
             postgresql_using="gin",
+            postgresql_ops={"structured": "jsonb_path_ops"},
         ),
         Index(
-            "ix_indexed_entities_metadata",
+            "ix_indexed_entities_metadata_path",
             "metadata",
             postgresql_using="gin",
+            postgresql_ops={"metadata": "jsonb_path_ops"},
         ),
     )
 
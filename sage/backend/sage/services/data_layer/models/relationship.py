@@ -2,11 +2,15 @@
 
 from datetime import datetime
 
-from sqlalchemy import String, DateTime, Index, UniqueConstraint
+from sqlalchemy import String, DateTime, Index, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import JSONB
 
-from sage.services.database import Base
+from sage.services.database import Base, BigIntId
+
+# Relationship types with no direction: A-knows-B is the same edge as
+# B-knows-A, so only one of the two may be stored.
+SYMMETRIC_RELATIONSHIP_TYPES = frozenset({"knows", "works_with", "related_to"})
 
 
 class EntityRelationship(Base):
@@ -19,26 +23,28 @@ class EntityRelationship(Base):
 
     __tablename__ = "entity_relationships"
 
-    id: Mapped[int] = mapped_column(primary_key=True)
+    id: Mapped[int] = mapped_column(BigIntId, primary_key=True)
 
     # Source entity
-    from_entity_id: Mapped[str] = mapped_column(String(255), index=True, nullable=False)
+    from_entity_id: Mapped[str] = mapped_column(String(255), nullable=False)
     from_entity_type: Mapped[str] = mapped_column(String(50), nullable=False)
 
     # Target entity
-    to_entity_id: Mapped[str] = mapped_column(String(255), index=True, nullable=False)
+    to_entity_id: Mapped[str] = mapped_column(String(255), nullable=False)
     to_entity_type: Mapped[str] = mapped_column(String(50), nullable=False)
 
     # Relationship type (e.g., "sent_to", "mentions", "related_to", "follow_up_for")
-    relationship_type: Mapped[str] = mapped_column(String(100), index=True, nullable=False)
+    relationship_type: Mapped[str] = mapped_column(String(100), nullable=False)
 
     # Additional metadata about the relationship
     metadata_: Mapped[dict | None] = mapped_column("metadata", JSONB, nullable=True)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, server_default=func.now()
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, server_default=func.now()
     )
 
     __table_args__ = (
@@ -49,6 +55,19 @@ class EntityRelationship(Base):
             "relationship_type",
             name="uq_entity_relationship",
         ),
+        Index("ix_entity_rel_from_entity_id", "from_entity_id"),
+        Index("ix_entity_rel_to_entity_id", "to_entity_id"),
+        Index("ix_entity_rel_relationship_type", "relationship_type"),
         Index("ix_entity_rel_from_type", "from_entity_id", "relationship_type"),
         Index("ix_entity_rel_to_type", "to_entity_id", "relationship_type"),
+        # One edge per unordered pair for symmetric types (PostgreSQL only:
+        # SQLite has no LEAST/GREATEST)
+        Index(
+            "ix_entity_rel_undirected",
+            func.least(from_entity_id, to_entity_id),
+            func.greatest(from_entity_id, to_entity_id),
+            "relationship_type",
+            unique=True,
+            postgresql_where=relationship_type.in_(sorted(SYMMETRIC_RELATIONSHIP_TYPES)),
+        ).ddl_if(dialect="postgresql"),
     )
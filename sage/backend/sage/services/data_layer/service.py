@@ -4,10 +4,12 @@ DataLayerService - Concrete implementation of DataLayerInterface.
 Bridges the agent system to the storage infrastructure (PostgreSQL, Qdrant).
 """
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator
 from typing import Any
 
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from sage.agents.base import (
@@ -22,11 +24,24 @@ from sage.services.data_layer.adapters.contact import ContactAdapter
 from sage.services.data_layer.adapters.followup import FollowupAdapter
 from sage.services.data_layer.adapters.meeting import MeetingAdapter
 from sage.services.data_layer.adapters.generic import GenericAdapter
-from sage.services.data_layer.models.relationship import EntityRelationship
+from sage.services.data_layer.models.relationship import (
+    EntityRelationship,
+    SYMMETRIC_RELATIONSHIP_TYPES,
+)
 from sage.services.data_layer.vector import MultiEntityVectorService, get_multi_vector_service
 
 logger = logging.getLogger(__name__)
 
+# Bumped on every entity store, update and delete in this process, and
+# shared by all DataLayerService instances; see write_generation
+_write_generation = 0
+
+
+def _entities_written() -> None:
+    """Record that entities were written, invalidating cached reads."""
+    global _write_generation
+    _write_generation += 1
+
 
 class DataLayerService(DataLayerInterface):
     """
@@ -73,6 +88,11 @@ class DataLayerService(DataLayerInterface):
         for generic_type in self.GENERIC_TYPES:
             self._adapters[generic_type] = GenericAdapter(generic_type)
 
+    @property
+    def write_generation(self) -> int:
+        """Entity writes made through any DataLayerService in this process."""
+        return _write_generation
+
     def _get_adapter(self, entity_type: str) -> BaseEntityAdapter:
         """Get the adapter for an entity type."""
         if entity_type in self._adapters:
@@ -116,28 +136,77 @@ class DataLayerService(DataLayerInterface):
         # Index in Qdrant
         embedding_text = adapter.get_embedding_text(entity)
         if embedding_text:
-            payload = {
-                "source": entity.source,
-            }
-            # Add key structured fields to payload for filtering
-            if entity.structured:
-                for key in ["subject", "title", "name", "email"]:
-                    if key in entity.structured:
-                        payload[key] = entity.structured[key]
-
-            point_id = self.vector_service.index_entity(
+            point_id = await asyncio.to_thread(
+                self.vector_service.index_entity,
                 entity_id=entity_id,
                 entity_type=entity.entity_type,
                 text=embedding_text,
-                payload=payload,
+                payload=self._vector_payload(entity),
             )
 
             # Update entity with qdrant reference
             entity.metadata["qdrant_point_id"] = point_id
 
+        _entities_written()
         logger.info(f"Stored entity {entity_id} ({entity.entity_type})")
         return entity_id
 
+    async def store_entities(self, entities: list[IndexedEntity]) -> list[str]:
+        """
+        Store several entities, embedding and indexing them as one batch.
+
+        Rows are written through the adapters as in store_entity; the
+        embeddings are then computed in a single model call and sent to
+        Qdrant in a single upsert.
+
+        Args:
+            entities: The IndexedEntities to store
+
+        Returns:
+            The entity IDs, in the order given
+        """
+        entity_ids = []
+        to_index = []
+        indexed_entities = []
+        for entity in entities:
+            adapter = self._get_adapter(entity.entity_type)
+            entity_id = await adapter.store(self.session, entity)
+            if entity.id != entity_id:
+                entity.id = entity_id
+            entity_ids.append(entity_id)
+
+            embedding_text = adapter.get_embedding_text(entity)
+            if embedding_text:
+                to_index.append({
+                    "entity_id": entity_id,
+                    "entity_type": entity.entity_type,
+                    "text": embedding_text,
+                    "payload": self._vector_payload(entity),
+                })
+                indexed_entities.append(entity)
+
+        # Embedding is CPU-bound and the Qdrant client is synchronous, so run
+        # them in a worker thread rather than blocking the event loop
+        point_ids = await asyncio.to_thread(self.vector_service.index_entities, to_index)
+        for entity, point_id in zip(indexed_entities, point_ids):
+            entity.metadata["qdrant_point_id"] = point_id
+
+        _entities_written()
+        logger.info(f"Stored {len(entity_ids)} entities ({len(point_ids)} embedded)")
+        return entity_ids
+
+    def _vector_payload(self, entity: IndexedEntity) -> dict[str, Any]:
+        """Build the Qdrant payload for an entity."""
+        payload = {
+            "source": entity.source,
+        }
+        # Add key structured fields to payload for filtering
+        if entity.structured:
+            for key in ["subject", "title", "name", "email"]:
+                if key in entity.structured:
+                    payload[key] = entity.structured[key]
+        return payload
+
     async def update_entity(self, entity_id: str, updates: dict) -> bool:
         """
         Update an existing entity.
@@ -157,32 +226,92 @@ class DataLayerService(DataLayerInterface):
         if not model:
             return False
 
-        # Convert to IndexedEntity and apply updates
-        entity = adapter.to_indexed_entity(model)
-
-        # Merge updates
-        if "structured" in updates:
-            entity.structured.update(updates["structured"])
-        if "analyzed" in updates:
-            entity.analyzed.update(updates["analyzed"])
-        if "metadata" in updates:
-            entity.metadata.update(updates["metadata"])
-
-        # Store updated entity
+        # Convert to IndexedEntity, merge updates and store
+        entity = self._merge_updates(adapter.to_indexed_entity(model), updates)
         await adapter.store(self.session, entity)
 
-        # Re-index in Qdrant
-        embedding_text = adapter.get_embedding_text(entity)
+        # Re-index in Qdrant; embedding text never includes metadata, so a
+        # metadata-only update (e.g. fact supersession) keeps its vector
+        embedding_text = None
+        if "structured" in updates or "analyzed" in updates:
+            embedding_text = adapter.get_embedding_text(entity)
         if embedding_text:
-            self.vector_service.index_entity(
+            await asyncio.to_thread(
+                self.vector_service.index_entity,
                 entity_id=entity_id,
                 entity_type=entity_type,
                 text=embedding_text,
             )
 
+        _entities_written()
         logger.info(f"Updated entity {entity_id}")
         return True
 
+    async def update_entities(self, updates: list[tuple[str, dict]]) -> list[bool]:
+        """
+        Apply several updates, loading the entities up front and re-indexing
+        the changed embeddings as one batch.
+
+        Existing rows are fetched with one get_by_ids call per entity type,
+        so the per-entity store finds its row already in the session. Only
+        entities whose structured or analyzed fields changed are re-embedded.
+
+        Args:
+            updates: (entity_id, updates) pairs, as for update_entity
+
+        Returns:
+            Whether each entity was found and updated, in the order given
+        """
+        ids_by_type: dict[str, list[str]] = {}
+        for entity_id, _ in updates:
+            ids_by_type.setdefault(self._parse_entity_type(entity_id), []).append(entity_id)
+
+        models = {}
+        for entity_type, entity_ids in ids_by_type.items():
+            adapter = self._get_adapter(entity_type)
+            models.update(await adapter.get_by_ids(self.session, entity_ids))
+
+        updated = []
+        to_index = []
+        for entity_id, entity_updates in updates:
+            model = models.get(entity_id)
+            if model is None:
+                updated.append(False)
+                continue
+
+            entity_type = self._parse_entity_type(entity_id)
+            adapter = self._get_adapter(entity_type)
+            entity = self._merge_updates(adapter.to_indexed_entity(model), entity_updates)
+            await adapter.store(self.session, entity)
+            updated.append(True)
+
+            if "structured" in entity_updates or "analyzed" in entity_updates:
+                embedding_text = adapter.get_embedding_text(entity)
+                if embedding_text:
+                    to_index.append({
+                        "entity_id": entity_id,
+                        "entity_type": entity_type,
+                        "text": embedding_text,
+                    })
+
+        if to_index:
+            await asyncio.to_thread(self.vector_service.index_entities, to_index)
+
+        if any(updated):
+            _entities_written()
+        logger.info(f"Updated {sum(updated)} of {len(updates)} entities ({len(to_index)} re-embedded)")
+        return updated
+
+    def _merge_updates(self, entity: IndexedEntity, updates: dict) -> IndexedEntity:
+        """Merge structured, analyzed and metadata updates into an entity."""
+        if "structured" in updates:
+            entity.structured.update(updates["structured"])
+        if "analyzed" in updates:
+            entity.analyzed.update(updates["analyzed"])
+        if "metadata" in updates:
+            entity.metadata.update(updates["metadata"])
+        return entity
+
     async def delete_entity(self, entity_id: str) -> bool:
         """
         Delete an entity from all stores.
@@ -209,6 +338,7 @@ class DataLayerService(DataLayerInterface):
         await self._delete_entity_relationships(entity_id)
 
         if deleted:
+            _entities_written()
             logger.info(f"Deleted entity {entity_id}")
         return deleted
 
@@ -246,20 +376,39 @@ class DataLayerService(DataLayerInterface):
         from_type = self._parse_entity_type(from_id)
         to_type = self._parse_entity_type(to_id)
 
-        # Check if relationship already exists
+        # Check if relationship already exists, first among rows added to
+        # this session but not yet flushed (the session doesn't autoflush)
+        rel = self._pending_relationship(from_id, to_id, rel_type)
+        if rel:
+            if metadata:
+                rel.metadata_ = metadata
+                return True
+            return False
+
+        if rel_type in SYMMETRIC_RELATIONSHIP_TYPES:
+            # Either direction counts; matches ix_entity_rel_undirected so
+            # both directions are found with a single index probe
+            endpoints = and_(
+                func.least(EntityRelationship.from_entity_id, EntityRelationship.to_entity_id)
+                == func.least(from_id, to_id),
+                func.greatest(EntityRelationship.from_entity_id, EntityRelationship.to_entity_id)
+                == func.greatest(from_id, to_id),
+            )
+        else:
+            endpoints = and_(
+                EntityRelationship.from_entity_id == from_id,
+                EntityRelationship.to_entity_id == to_id,
+            )
         existing = await self.session.execute(
             select(EntityRelationship).where(
-                and_(
-                    EntityRelationship.from_entity_id == from_id,
-                    EntityRelationship.to_entity_id == to_id,
-                    EntityRelationship.relationship_type == rel_type,
-                )
+                endpoints,
+                EntityRelationship.relationship_type == rel_type,
             )
         )
-        if existing.scalar_one_or_none():
+        rel = existing.scalar_one_or_none()
+        if rel:
             # Update metadata if provided
             if metadata:
-                rel = existing.scalar_one()
                 rel.metadata_ = metadata
                 return True
             return False
@@ -278,6 +427,116 @@ class DataLayerService(DataLayerInterface):
         logger.debug(f"Created relationship: {from_id} --{rel_type}--> {to_id}")
         return True
 
+    def _pending_relationship(
+        self, from_id: str, to_id: str, rel_type: str
+    ) -> EntityRelationship | None:
+        """
+        Find a matching relationship added to the session but not yet flushed.
+
+        Symmetric types match in either direction, as in create_relationship.
+        """
+        endpoints = {(from_id, to_id)}
+        if rel_type in SYMMETRIC_RELATIONSHIP_TYPES:
+            endpoints.add((to_id, from_id))
+        for obj in self.session.new:
+            if (
+                isinstance(obj, EntityRelationship)
+                and obj.relationship_type == rel_type
+                and (obj.from_entity_id, obj.to_entity_id) in endpoints
+            ):
+                return obj
+        return None
+
+    async def create_relationships(self, relationships: list[Relationship]) -> list[bool]:
+        """
+        Create several relationships with one lookup for existing ones.
+
+        Directed relationships are checked against the table in a single
+        query on (from, to, type), and against rows still pending in the
+        session; symmetric types go through
+        create_relationship, once per unordered (least, greatest, type)
+        edge. Per relationship, behaves as create_relationship (duplicates
+        within the batch, in either direction for symmetric types, count
+        as existing).
+
+        Args:
+            relationships: Relationships to create
+
+        Returns:
+            For each relationship, True if created or its metadata updated,
+            False if it already existed unchanged
+        """
+        results: list[bool] = [False] * len(relationships)
+        directed = []
+        symmetric_edges = set()
+        for i, rel in enumerate(relationships):
+            if rel.rel_type in SYMMETRIC_RELATIONSHIP_TYPES:
+                edge = (min(rel.from_id, rel.to_id), max(rel.from_id, rel.to_id), rel.rel_type)
+                if edge in symmetric_edges and not rel.metadata:
+                    # Already created or found earlier in this batch
+                    continue
+                symmetric_edges.add(edge)
+                results[i] = await self.create_relationship(
+                    rel.from_id, rel.to_id, rel.rel_type, rel.metadata or None
+                )
+            else:
+                directed.append(i)
+
+        if not directed:
+            return results
+
+        keys = list({
+            (relationships[i].from_id, relationships[i].to_id, relationships[i].rel_type)
+            for i in directed
+        })
+        existing = await self.session.execute(
+            select(EntityRelationship).where(
+                tuple_(
+                    EntityRelationship.from_entity_id,
+                    EntityRelationship.to_entity_id,
+                    EntityRelationship.relationship_type,
+                ).in_(keys)
+            )
+        )
+        by_key = {
+            (rel.from_entity_id, rel.to_entity_id, rel.relationship_type): rel
+            for rel in existing.scalars().all()
+        }
+        # Rows added to this session but not yet flushed aren't in the table
+        # (the session doesn't autoflush)
+        wanted = set(keys)
+        for obj in self.session.new:
+            if isinstance(obj, EntityRelationship):
+                key = (obj.from_entity_id, obj.to_entity_id, obj.relationship_type)
+                if key in wanted:
+                    by_key[key] = obj
+
+        for i in directed:
+            rel = relationships[i]
+            key = (rel.from_id, rel.to_id, rel.rel_type)
+            metadata = rel.metadata or None
+            row = by_key.get(key)
+            if row is not None:
+                # Update metadata if provided
+                if metadata:
+                    row.metadata_ = metadata
+                    results[i] = True
+                continue
+
+            by_key[key] = EntityRelationship(
+                from_entity_id=rel.from_id,
+                from_entity_type=self._parse_entity_type(rel.from_id),
+                to_entity_id=rel.to_id,
+                to_entity_type=self._parse_entity_type(rel.to_id),
+                relationship_type=rel.rel_type,
+                metadata_=metadata,
+            )
+            self.session.add(by_key[key])
+            results[i] = True
+
+        logger.debug(f"Created {sum(results)} of {len(relationships)} relationships")
+        return results
+
     # =========================================================================
     # Read Operations
     # =========================================================================
@@ -303,7 +562,68 @@ class DataLayerService(DataLayerInterface):
 
         # Enrich with relationships
         relationships = await self.get_relationships(entity_id)
-        entity.relationships = {
+        entity.relationships = self._relationship_summary(entity_id, relationships)
+
+        return entity
+
+    async def get_entities(self, entity_ids: list[str]) -> dict[str, IndexedEntity]:
+        """
+        Retrieve several entities with one query per entity type.
+
+        Relationships for all found entities are loaded in a single query,
+        so the result matches calling get_entity for each ID.
+
+        Args:
+            entity_ids: The entity IDs to retrieve
+
+        Returns:
+            Found entities keyed by ID (IDs not found are omitted)
+        """
+        ids_by_type: dict[str, list[str]] = {}
+        for entity_id in entity_ids:
+            ids_by_type.setdefault(self._parse_entity_type(entity_id), []).append(entity_id)
+
+        entities = {}
+        for entity_type, type_ids in ids_by_type.items():
+            adapter = self._get_adapter(entity_type)
+            models = await adapter.get_by_ids(self.session, type_ids)
+            for entity_id, model in models.items():
+                entities[entity_id] = adapter.to_indexed_entity(model)
+
+        if not entities:
+            return {}
+
+        found_ids = list(entities)
+        result = await self.session.execute(
+            select(EntityRelationship).where(
+                EntityRelationship.from_entity_id.in_(found_ids)
+                | EntityRelationship.to_entity_id.in_(found_ids)
+            )
+        )
+        relationships_by_id: dict[str, list[Relationship]] = {}
+        for m in result.scalars().all():
+            rel = Relationship(
+                from_id=m.from_entity_id,
+                to_id=m.to_entity_id,
+                rel_type=m.relationship_type,
+                metadata=m.metadata_ or {},
+            )
+            relationships_by_id.setdefault(rel.from_id, []).append(rel)
+            if rel.to_id != rel.from_id:
+                relationships_by_id.setdefault(rel.to_id, []).append(rel)
+
+        for entity_id, entity in entities.items():
+            entity.relationships = self._relationship_summary(
+                entity_id, relationships_by_id.get(entity_id, [])
+            )
+
+        return entities
+
+    def _relationship_summary(
+        self, entity_id: str, relationships: list[Relationship]
+    ) -> dict[str, list[dict]]:
+        """Split an entity's relationships into outgoing and incoming lists."""
+        return {
             "outgoing": [
                 {"to": r.to_id, "type": r.rel_type, "metadata": r.metadata}
                 for r in relationships
@@ -316,8 +636,6 @@ class DataLayerService(DataLayerInterface):
             ],
         }
 
-        return entity
-
     async def vector_search(
         self,
         query: str,
@@ -361,6 +679,54 @@ class DataLayerService(DataLayerInterface):
 
         return search_results
 
+    async def vector_search_batch(
+        self,
+        queries: list[str],
+        entity_types: list[str] | None = None,
+        limit: int = 10,
+    ) -> list[list[SearchResult]]:
+        """
+        Run several semantic searches as one embedding batch and one Qdrant request.
+
+        Every distinct hit, across all queries, is loaded in one
+        get_entities call.
+
+        Args:
+            queries: Search query texts
+            entity_types: Optional list of entity types to filter
+            limit: Maximum number of results per query
+
+        Returns:
+            One list of SearchResult per query, in order
+        """
+        batches = self.vector_service.search_batch(
+            queries=queries,
+            entity_types=entity_types,
+            limit=limit,
+        )
+
+        entity_ids = list(dict.fromkeys(
+            hit["entity_id"] for hits in batches for hit in hits if hit.get("entity_id")
+        ))
+        entities = await self.get_entities(entity_ids) if entity_ids else {}
+
+        search_results = []
+        for hits in batches:
+            results = []
+            for hit in hits:
+                entity = entities.get(hit.get("entity_id"))
+                if entity:
+                    results.append(
+                        SearchResult(
+                            entity=entity,
+                            score=hit.get("score", 0.0),
+                            match_type="semantic",
+                        )
+                    )
+            search_results.append(results)
+
+        return search_results
+
     async def structured_query(
         self,
         filters: dict,
@@ -384,6 +750,31 @@ class DataLayerService(DataLayerInterface):
 
         return [adapter.to_indexed_entity(model) for model in models]
 
+    async def structured_query_iter(
+        self,
+        filters: dict,
+        entity_type: str,
+        limit: int = 100,
+    ) -> AsyncIterator[IndexedEntity]:
+        """
+        Query entities by structured fields, streaming the results.
+
+        Rows come through a server-side cursor and are converted one at a
+        time, so large result sets are never held in memory all at once.
+
+        Args:
+            filters: Filter conditions (adapter-specific)
+            entity_type: Type of entity to query
+            limit: Maximum number of results
+
+        Yields:
+            Matching IndexedEntity objects
+        """
+        adapter = self._get_adapter(entity_type)
+
+        async for model in adapter.stream(self.session, filters, limit):
+            yield adapter.to_indexed_entity(model)
+
     async def get_relationships(
         self,
         entity_id: str,
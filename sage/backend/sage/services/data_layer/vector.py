@@ -1,12 +1,16 @@
 """Multi-entity vector search service using Qdrant."""
 
 import logging
+import threading
+import time
+from collections import OrderedDict
 from typing import Any
 import uuid
 
+import numpy as np
 from qdrant_client import QdrantClient
 from qdrant_client.http import models
-from qdrant_client.http.models import Distance, VectorParams, PointStruct, Filter, FieldCondition, MatchValue
+from qdrant_client.http.models import Datatype, Distance, VectorParams, PointStruct, Filter, FieldCondition, MatchValue
 from sentence_transformers import SentenceTransformer
 
 from sage.config import get_settings
@@ -18,9 +22,101 @@ logger = logging.getLogger(__name__)
 EMBEDDING_MODEL = "all-MiniLM-L6-v2"
 EMBEDDING_DIM = 384
 
+# Stored vector precision. float16 halves the collection's vector memory
+# versus float32 with negligible effect on cosine ranking for this model.
+EMBEDDING_DATATYPE = Datatype.FLOAT16
+
 # Collection name for all entities
 ENTITIES_COLLECTION = "sage_entities"
 
+# Payload keys that _hit_to_dict maps explicitly; every other payload key is
+# copied through as-is
+_HIT_FIELDS = frozenset({"entity_id", "entity_type", "text_preview"})
+
+# Near-duplicate query cache: queries are bucketed by the sign pattern of
+# their embedding against random hyperplanes, and a lookup only compares
+# against the handful of cached queries in its bucket
+QUERY_CACHE_PLANES = 16
+QUERY_CACHE_SIMILARITY = 0.95  # Minimum cosine similarity to reuse results
+QUERY_CACHE_BUCKETS = 256
+QUERY_CACHE_BUCKET_SIZE = 8
+QUERY_CACHE_TTL_SECONDS = 30.0  # Bounds staleness from writes in other processes
+
+
+class QueryCache:
+    """
+    Locality-sensitive cache of search results keyed by query embedding.
+
+    A query whose embedding is within QUERY_CACHE_SIMILARITY of a cached
+    query, with the same search options, reuses that query's hits without
+    touching Qdrant. Buckets are evicted least recently used.
+
+    Searches use the cache on the event loop while writes running under
+    asyncio.to_thread clear it, so every method holds the cache's lock.
+    """
+
+    def __init__(self, dim: int = EMBEDDING_DIM):
+        rng = np.random.default_rng(0)
+        self._planes = rng.standard_normal((QUERY_CACHE_PLANES, dim)).astype(np.float32)
+        self._buckets: OrderedDict[tuple, list[tuple[np.ndarray, list, float]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _unit(self, embedding: list[float]) -> np.ndarray | None:
+        """Normalize an embedding; None for the zero vector of an empty query."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if not norm:
+            return None
+        return vector / norm
+
+    def _bucket_key(self, vector: np.ndarray, options: tuple) -> tuple:
+        signature = np.packbits(self._planes @ vector > 0).tobytes()
+        return (signature, options)
+
+    def get(self, embedding: list[float], options: tuple) -> list[dict[str, Any]] | None:
+        """Return cached hits for a near-identical query, or None."""
+        vector = self._unit(embedding)
+        if vector is None:
+            return None
+        key = self._bucket_key(vector, options)
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if not bucket:
+                return None
+
+            bucket[:] = [entry for entry in bucket if entry[2] > now]
+            if not bucket:
+                del self._buckets[key]
+                return None
+
+            similarities = np.stack([entry[0] for entry in bucket]) @ vector
+            best = int(np.argmax(similarities))
+            if similarities[best] < QUERY_CACHE_SIMILARITY:
+                return None
+            self._buckets.move_to_end(key)
+            return list(bucket[best][1])
+
+    def put(self, embedding: list[float], options: tuple, hits: list[dict[str, Any]]) -> None:
+        """Cache a query's hits."""
+        vector = self._unit(embedding)
+        if vector is None:
+            return
+        key = self._bucket_key(vector, options)
+        entry = (vector, list(hits), time.monotonic() + QUERY_CACHE_TTL_SECONDS)
+        with self._lock:
+            bucket = self._buckets.setdefault(key, [])
+            bucket.append(entry)
+            del bucket[:-QUERY_CACHE_BUCKET_SIZE]
+            self._buckets.move_to_end(key)
+            if len(self._buckets) > QUERY_CACHE_BUCKETS:
+                self._buckets.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached query (called whenever the collection changes)."""
+        with self._lock:
+            self._buckets.clear()
+
 
 class MultiEntityVectorService:
     """
@@ -31,9 +127,18 @@ class MultiEntityVectorService:
     """
 
     def __init__(self):
-        self.client = QdrantClient(url=settings.qdrant_url)
+        self._client: QdrantClient | None = None
         self._model: SentenceTransformer | None = None
-        self._ensure_collection()
+        self._query_cache = QueryCache()
+
+    @property
+    def client(self) -> QdrantClient:
+        """Lazy connect to Qdrant, making sure the collection exists."""
+        if self._client is None:
+            client = QdrantClient(url=settings.qdrant_url)
+            self._ensure_collection(client)
+            self._client = client
+        return self._client
 
     @property
     def model(self) -> SentenceTransformer:
@@ -43,22 +148,23 @@ class MultiEntityVectorService:
             self._model = SentenceTransformer(EMBEDDING_MODEL)
         return self._model
 
-    def _ensure_collection(self) -> None:
+    def _ensure_collection(self, client: QdrantClient) -> None:
         """Ensure the entities collection exists."""
-        collections = self.client.get_collections().collections
+        collections = client.get_collections().collections
         collection_names = [c.name for c in collections]
 
         if ENTITIES_COLLECTION not in collection_names:
             logger.info(f"Creating Qdrant collection: {ENTITIES_COLLECTION}")
-            self.client.create_collection(
+            client.create_collection(
                 collection_name=ENTITIES_COLLECTION,
                 vectors_config=VectorParams(
                     size=EMBEDDING_DIM,
                     distance=Distance.COSINE,
+                    datatype=EMBEDDING_DATATYPE,
                 ),
             )
             # Create payload index for entity_type filtering
-            self.client.create_payload_index(
+            client.create_payload_index(
                 collection_name=ENTITIES_COLLECTION,
                 field_name="entity_type",
                 field_schema=models.PayloadSchemaType.KEYWORD,
@@ -74,6 +180,20 @@ class MultiEntityVectorService:
         embedding = self.model.encode(text, convert_to_numpy=True)
         return embedding.tolist()
 
+    def generate_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for several texts with one model call."""
+        # Empty texts get a zero vector, as in generate_embedding
+        texts = [(text or "")[:8000] for text in texts]
+        to_encode = [i for i, text in enumerate(texts) if text.strip()]
+        embeddings = [[0.0] * EMBEDDING_DIM for _ in texts]
+        if to_encode:
+            encoded = self.model.encode(
+                [texts[i] for i in to_encode], convert_to_numpy=True
+            )
+            for i, vector in zip(to_encode, encoded):
+                embeddings[i] = vector.tolist()
+        return embeddings
+
     def _make_point_id(self, entity_id: str) -> str:
         """Generate a consistent Qdrant point ID from entity ID."""
         return str(uuid.uuid5(uuid.NAMESPACE_DNS, entity_id))
@@ -121,9 +241,51 @@ class MultiEntityVectorService:
             ],
         )
 
+        self._query_cache.clear()
+
         logger.debug(f"Indexed entity {entity_id} ({entity_type}) with point ID {point_id}")
         return point_id
 
+    def index_entities(self, items: list[dict[str, Any]]) -> list[str]:
+        """
+        Index several entities with one embedding batch and one upsert.
+
+        Encoding a list of texts in a single model call is far cheaper than
+        encoding them one by one, and the points go to Qdrant in a single
+        request.
+
+        Args:
+            items: Dicts with entity_id, entity_type, text and optional payload
+                (the arguments of index_entity)
+
+        Returns:
+            The Qdrant point IDs, in the order of items
+        """
+        if not items:
+            return []
+
+        embeddings = self.generate_embeddings([item["text"] for item in items])
+
+        points = []
+        point_ids = []
+        for item, embedding in zip(items, embeddings):
+            point_id = self._make_point_id(item["entity_id"])
+            point_payload = {
+                "entity_id": item["entity_id"],
+                "entity_type": item["entity_type"],
+                "text_preview": item["text"][:500] if item["text"] else "",
+            }
+            if item.get("payload"):
+                point_payload.update(item["payload"])
+            points.append(PointStruct(id=point_id, vector=embedding, payload=point_payload))
+            point_ids.append(point_id)
+
+        self.client.upsert(collection_name=ENTITIES_COLLECTION, points=points)
+        self._query_cache.clear()
+
+        logger.debug(f"Indexed {len(points)} entities in one batch")
+        return point_ids
+
     def search(
         self,
         query: str,
@@ -144,49 +306,115 @@ class MultiEntityVectorService:
             List of search results with entity_id, entity_type, score, and payload
         """
         query_embedding = self.generate_embedding(query)
-
-        # Build filter for entity types
-        query_filter = None
-        if entity_types:
-            if len(entity_types) == 1:
-                query_filter = Filter(
-                    must=[
-                        FieldCondition(
-                            key="entity_type",
-                            match=MatchValue(value=entity_types[0]),
-                        )
-                    ]
-                )
-            else:
-                # Multiple entity types - use should (OR)
-                query_filter = Filter(
-                    should=[
-                        FieldCondition(
-                            key="entity_type",
-                            match=MatchValue(value=et),
-                        )
-                        for et in entity_types
-                    ]
-                )
+        options = self._cache_options(entity_types, limit, score_threshold)
+        cached = self._query_cache.get(query_embedding, options)
+        if cached is not None:
+            return cached
 
         results = self.client.query_points(
             collection_name=ENTITIES_COLLECTION,
             query=query_embedding,
-            query_filter=query_filter,
+            query_filter=self._entity_type_filter(entity_types),
             limit=limit,
             score_threshold=score_threshold,
         )
 
-        return [
-            {
-                "entity_id": hit.payload.get("entity_id"),
-                "entity_type": hit.payload.get("entity_type"),
-                "score": hit.score,
-                "text_preview": hit.payload.get("text_preview"),
-                **{k: v for k, v in hit.payload.items() if k not in ["entity_id", "entity_type", "text_preview"]},
-            }
-            for hit in results.points
-        ]
+        hits = [self._hit_to_dict(hit) for hit in results.points]
+        self._query_cache.put(query_embedding, options, hits)
+        return hits
+
+    def search_batch(
+        self,
+        queries: list[str],
+        entity_types: list[str] | None = None,
+        limit: int = 10,
+        score_threshold: float = 0.3,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Run several searches with one embedding call and one Qdrant request.
+
+        Queries answered from the query cache are left out of the request.
+
+        Args:
+            queries: Search query texts
+            entity_types: Optional list of entity types to filter
+            limit: Maximum number of results per query
+            score_threshold: Minimum similarity score
+
+        Returns:
+            One list of search results (as in search) per query, in order
+        """
+        if not queries:
+            return []
+
+        embeddings = self.generate_embeddings(queries)
+        options = self._cache_options(entity_types, limit, score_threshold)
+        results = [self._query_cache.get(embedding, options) for embedding in embeddings]
+        misses = [i for i, hits in enumerate(results) if hits is None]
+        if not misses:
+            return results
+
+        query_filter = self._entity_type_filter(entity_types)
+        responses = self.client.query_batch_points(
+            collection_name=ENTITIES_COLLECTION,
+            requests=[
+                models.QueryRequest(
+                    query=embeddings[i],
+                    filter=query_filter,
+                    limit=limit,
+                    score_threshold=score_threshold,
+                    with_payload=True,
+                )
+                for i in misses
+            ],
+        )
+
+        for i, response in zip(misses, responses):
+            hits = [self._hit_to_dict(hit) for hit in response.points]
+            self._query_cache.put(embeddings[i], options, hits)
+            results[i] = hits
+        return results
+
+    def _cache_options(
+        self, entity_types: list[str] | None, limit: int, score_threshold: float
+    ) -> tuple:
+        """Search options that must match for cached hits to be reused."""
+        return (tuple(sorted(entity_types or ())), limit, score_threshold)
+
+    def _entity_type_filter(self, entity_types: list[str] | None) -> Filter | None:
+        """Build a Qdrant filter matching any of the given entity types."""
+        if not entity_types:
+            return None
+        if len(entity_types) == 1:
+            return Filter(
+                must=[
+                    FieldCondition(
+                        key="entity_type",
+                        match=MatchValue(value=entity_types[0]),
+                    )
+                ]
+            )
+        # Multiple entity types - use should (OR)
+        return Filter(
+            should=[
+                FieldCondition(
+                    key="entity_type",
+                    match=MatchValue(value=et),
+                )
+                for et in entity_types
+            ]
+        )
+
+    def _hit_to_dict(self, hit) -> dict[str, Any]:
+        """Flatten a scored Qdrant point into a search result dict."""
+        payload = hit.payload
+        return {
+            "entity_id": payload.get("entity_id"),
+            "entity_type": payload.get("entity_type"),
+            "score": hit.score,
+            "text_preview": payload.get("text_preview"),
+            **{k: v for k, v in payload.items() if k not in _HIT_FIELDS},
+        }
 
     def delete_entity(self, entity_id: str) -> None:
         """Delete an entity from the vector database."""
@@ -195,6 +423,7 @@ class MultiEntityVectorService:
             collection_name=ENTITIES_COLLECTION,
             points_selector=models.PointIdsList(points=[point_id]),
         )
+        self._query_cache.clear()
         logger.debug(f"Deleted entity {entity_id} (point ID {point_id})")
 
     def get_entity_point(self, entity_id: str) -> dict[str, Any] | None:
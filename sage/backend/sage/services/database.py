@@ -1,29 +1,83 @@
 """Database connection and session management."""
 
 from collections.abc import AsyncGenerator
+from datetime import datetime, timezone
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import BigInteger, DateTime, Integer, TypeDecorator
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
 
 from sage.config import get_settings
 
 settings = get_settings()
 
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.debug,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
-)
+def _create_engine(pool_size: int, max_overflow: int) -> AsyncEngine:
+    """Create an engine with its own connection pool."""
+    return create_async_engine(
+        settings.database_url,
+        echo=settings.debug,
+        pool_pre_ping=True,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        # Reuse the most recently returned connection so idle ones can time out
+        # server-side and busy ones stay warm
+        pool_use_lifo=True,
+    )
+
+
+def _create_session_maker(bind: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """Create a session factory bound to an engine."""
+    return async_sessionmaker(
+        bind,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+
+
+# Interactive traffic: API requests and the SearchAgent reads they drive
+engine = _create_engine(settings.db_pool_size, settings.db_max_overflow)
+async_session_maker = _create_session_maker(engine)
+
+# Ingestion: email sync and IndexerAgent writes. A separate pool means a
+# large sync queues on its own connections instead of starving searches.
+ingest_engine = _create_engine(settings.db_ingest_pool_size, settings.db_ingest_max_overflow)
+ingest_session_maker = _create_session_maker(ingest_engine)
+
+
+# Type for synthetic primary keys and the foreign keys that reference them.
+# SQLite only autoincrements an INTEGER PRIMARY KEY, hence the variant.
+BigIntId = BigInteger().with_variant(Integer, "sqlite")
 
-async_session_maker = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False,
-)
+
+class UTCDateTime(TypeDecorator):
+    """
+    TIMESTAMPTZ column that exchanges naive UTC datetimes with Python.
+
+    The app works in naive UTC (datetime.utcnow()) throughout; this keeps
+    that contract while the database stores an unambiguous instant.
+    """
+
+    impl = DateTime(timezone=True)
+    cache_ok = True
+
+    def process_bind_param(self, value: datetime | None, dialect) -> datetime | None:
+        if value is not None and value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value
+
+    def process_result_value(self, value: datetime | None, dialect) -> datetime | None:
+        if value is not None and value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
 
 
 class Base(DeclarativeBase):
@@ -38,9 +92,29 @@ async def init_db() -> None:
     pass
 
 
+def _engine_pool_stats(bind: AsyncEngine) -> dict:
+    """Snapshot of one engine's connection pool."""
+    pool = bind.sync_engine.pool
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
+
+
+def pool_stats() -> dict:
+    """Snapshot of connection pool usage for health checks."""
+    return {
+        **_engine_pool_stats(engine),
+        "ingest": _engine_pool_stats(ingest_engine),
+    }
+
+
 async def close_db() -> None:
-    """Close database connection."""
+    """Close database connections."""
     await engine.dispose()
+    await ingest_engine.dispose()
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -0,0 +1,141 @@
+"""Helpers for Alembic data migrations over large tables."""
+
+import logging
+from collections.abc import Callable, Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.engine import Connection
+
+logger = logging.getLogger(__name__)
+
+# Tables estimated above this many rows get their indexes built CONCURRENTLY
+CONCURRENT_INDEX_MIN_ROWS = 10_000
+
+
+def paginated_update(
+    table: sa.TableClause,
+    where_clause: sa.ColumnElement[bool] | None,
+    updater: Callable[[Connection, Sequence[int]], None],
+    page_size: int = 100,
+) -> int:
+    """
+    Apply a data change to a table one small, committed page at a time.
+
+    Selects matching ids with keyset pagination (WHERE id > :last_id
+    ORDER BY id LIMIT n, so late pages cost the same as early ones) and
+    hands each page to updater. Runs inside an autocommit block, so every
+    page is committed as it goes: a failure part-way keeps the finished
+    pages, memory stays bounded, and no lock is held across the run.
+    updater should therefore be idempotent (e.g. filter on the old value)
+    so an interrupted migration can simply be re-run.
+
+    Usage (inside a migration's upgrade()):
+
+        email_cache = sa.table('email_cache', sa.column('id'), sa.column('category'))
+
+        def recategorize(bind, ids):
+            bind.execute(
+                email_cache.update()
+                .where(email_cache.c.id.in_(ids))
+                .values(category='fyi')
+            )
+
+        paginated_update(email_cache, email_cache.c.category == 'newsletter', recategorize)
+
+    If updater needs related rows, load them for the whole page in one
+    query (an ORM stub declared in the migration with lazy='selectin', or
+    an explicit IN query) rather than per id.
+
+    Args:
+        table: Table with an integer ``id`` column
+        where_clause: Rows to visit (None for every row)
+        updater: Called with the migration connection and each page of ids
+        page_size: Ids per page/commit
+
+    Returns:
+        Number of ids visited
+    """
+    migration_context = op.get_context()
+    if migration_context.as_sql:
+        raise RuntimeError(
+            f"paginated_update on {table.name} needs a database connection; "
+            "run this migration online"
+        )
+
+    bind = op.get_bind()
+    query = sa.select(table.c.id).order_by(table.c.id).limit(page_size)
+    if where_clause is not None:
+        query = query.where(where_clause)
+
+    visited = 0
+    last_id = None
+    with migration_context.autocommit_block():
+        while True:
+            page_query = query if last_id is None else query.where(table.c.id > last_id)
+            ids = bind.execute(page_query).scalars().all()
+            if not ids:
+                break
+
+            updater(bind, ids)
+            visited += len(ids)
+            last_id = ids[-1]
+
+    logger.info(f"paginated_update visited {visited} rows in {table.name}")
+    return visited
+
+
+def _estimated_rows(table_name: str) -> float:
+    """Planner row estimate for a table (pg_class.reltuples, -1 if unknown)."""
+    estimate = op.get_bind().execute(
+        sa.text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:table)"),
+        {"table": table_name},
+    ).scalar()
+    return -1 if estimate is None else estimate
+
+
+def create_index(
+    index_name: str,
+    table_name: str,
+    columns: Sequence[str],
+    min_rows: int = CONCURRENT_INDEX_MIN_ROWS,
+    **kw,
+) -> None:
+    """
+    Create an index without blocking writes on populated tables.
+
+    On PostgreSQL, if the table is estimated to hold more than min_rows
+    rows, the index is built with CREATE INDEX CONCURRENTLY (IF NOT
+    EXISTS) in an autocommit block, so inserts and updates keep flowing
+    while it builds. Small or freshly created tables get a plain CREATE
+    INDEX inside the migration transaction, where CONCURRENTLY would only
+    add a second table scan and an extra commit.
+
+    Offline (--sql) runs can't see row counts and always emit the plain
+    form; review the script before applying it to a large table.
+
+    Args:
+        index_name: Name of the index
+        table_name: Table to index
+        columns: Indexed columns
+        min_rows: Row estimate above which CONCURRENTLY is used
+        **kw: Passed through to op.create_index
+    """
+    migration_context = op.get_context()
+    if (
+        migration_context.as_sql
+        or migration_context.dialect.name != "postgresql"
+        or _estimated_rows(table_name) <= min_rows
+    ):
+        op.create_index(index_name, table_name, columns, **kw)
+        return
+
+    with migration_context.autocommit_block():
+        op.create_index(
+            index_name,
+            table_name,
+            columns,
+            if_not_exists=True,
+            postgresql_concurrently=True,
+            **kw,
+        )
@@ -23,9 +23,17 @@ class VectorSearchService:
     """Service for semantic search using Qdrant vector database."""
 
     def __init__(self):
-        self.client = QdrantClient(url=settings.qdrant_url)
+        self._client: QdrantClient | None = None
         self._model: SentenceTransformer | None = None
-        self._ensure_collection()
+
+    @property
+    def client(self) -> QdrantClient:
+        """Lazy connect to Qdrant, making sure the collection exists."""
+        if self._client is None:
+            client = QdrantClient(url=settings.qdrant_url)
+            self._ensure_collection(client)
+            self._client = client
+        return self._client
 
     @property
     def model(self) -> SentenceTransformer:
@@ -35,14 +43,14 @@ class VectorSearchService:
             self._model = SentenceTransformer(EMBEDDING_MODEL)
         return self._model
 
-    def _ensure_collection(self) -> None:
+    def _ensure_collection(self, client: QdrantClient) -> None:
         """Ensure the emails collection exists."""
-        collections = self.client.get_collections().collections
+        collections = client.get_collections().collections
         collection_names = [c.name for c in collections]
 
         if settings.qdrant_collection not in collection_names:
             logger.info(f"Creating Qdrant collection: {settings.qdrant_collection}")
-            self.client.create_collection(
+            client.create_collection(
                 collection_name=settings.qdrant_collection,
                 vectors_config=VectorParams(
                     size=EMBEDDING_DIM,
@@ -42,10 +42,10 @@ class TestAgentResult:
         )
         assert result.success is True
         assert result.data == {"message": "Task completed"}
-        assert result.errors == []
-        assert result.warnings == []
+        assert result.errors == ()
+        assert result.warnings == ()
         assert result.confidence == 1.0
-        assert result.entities_to_index == []
+        assert result.entities_to_index == ()
         assert result.requires_approval is False
         assert result.approval_context is None
 
@@ -103,8 +103,17 @@ class TestAgentResult:
         assert result.requires_approval is True
         assert result.approval_context == "Send email to john@example.com"
 
+    def test_ok_and_fail_constructors(self):
+        """Test the fast-path constructors match the regular constructor."""
+        assert AgentResult.ok({"id": 1}) == AgentResult(success=True, data={"id": 1})
+        assert AgentResult.ok({}, confidence=0.5).confidence == 0.5
+        failed = AgentResult.fail("bad input")
+        assert failed.success is False
+        assert failed.data == {}
+        assert failed.errors == ["bad input"]
+
     def test_result_none_lists_become_empty(self):
-        """Test that None lists are converted to empty lists in __post_init__."""
+        """Test that None lists are converted to the shared empty default in __post_init__."""
         result = AgentResult(
             success=True,
             data={},
@@ -112,9 +121,9 @@ class TestAgentResult:
             warnings=None,
             entities_to_index=None
         )
-        assert result.errors == []
-        assert result.warnings == []
-        assert result.entities_to_index == []
+        assert result.errors == ()
+        assert result.warnings == ()
+        assert result.entities_to_index == ()
 
 
 # =============================================================================
@@ -455,6 +464,18 @@ class TestDataLayerInterface:
         assert len(results) == 1
         assert results[0].entity_type == "email"
 
+    @pytest.mark.asyncio
+    async def test_structured_query_iter_defaults_to_structured_query(self, data_layer):
+        """Test the default streaming query yields structured_query's results."""
+        for i in range(3):
+            entity = IndexedEntity(id=f"email_{i}", entity_type="email", source="gmail")
+            await data_layer.store_entity(entity)
+
+        results = [
+            e async for e in data_layer.structured_query_iter(filters={}, entity_type="email")
+        ]
+        assert [e.id for e in results] == ["email_0", "email_1", "email_2"]
+
 
 # =============================================================================
 # BaseAgent Tests
@@ -465,7 +486,7 @@ class ConcreteAgent(BaseAgent):
 
     name = "test_agent"
     description = "A test agent for unit testing"
-    capabilities = ["capability_one", "capability_two", "capability_three"]
+    capabilities = ("capability_one", "capability_two", "capability_three")
     agent_type = AgentType.TASK
 
     async def execute(
@@ -508,6 +529,7 @@ class TestBaseAgent:
         """Create a mock indexer agent."""
         mock = AsyncMock()
         mock.index_entity = AsyncMock(return_value="indexed_123")
+        mock.index_entities = AsyncMock(return_value=["indexed_123", "indexed_456"])
         return mock
 
     @pytest.fixture
@@ -588,6 +610,29 @@ class TestBaseAgent:
         agent = ConcreteAgent(search_agent=None, indexer_agent=None)
         context = await agent.get_context("test")
         assert context.is_empty()
+        # The shared empty context is reused and can't be added to
+        assert await agent.get_context("other") is context
+        with pytest.raises(AttributeError):
+            context.relevant_emails.append({})
+
+    @pytest.mark.asyncio
+    async def test_gather_contexts_batches_shared_search_agent(self, agent, mock_search_agent):
+        """Test gather_contexts makes one batch call per search agent."""
+        mock_search_agent.get_contexts_batch = AsyncMock(
+            return_value=[SearchContext(temporal_summary="a"), SearchContext(temporal_summary="b")]
+        )
+        no_search = ConcreteAgent(search_agent=None, indexer_agent=None)
+
+        contexts = await BaseAgent.gather_contexts(
+            [agent, no_search, agent],
+            [("find emails", None), ("ignored", None), ("find contacts", ["contact_456"])],
+        )
+
+        mock_search_agent.get_contexts_batch.assert_awaited_once()
+        requests = mock_search_agent.get_contexts_batch.await_args.args[0]
+        assert [r.task_description for r in requests] == ["find emails", "find contacts"]
+        assert requests[1].entity_hints == ["contact_456"]
+        assert [c.temporal_summary for c in contexts] == ["a", "", "b"]
 
     @pytest.mark.asyncio
     async def test_persist_data_calls_indexer(self, agent, mock_indexer_agent):
@@ -599,8 +644,35 @@ class TestBaseAgent:
 
         indexed_ids = await agent.persist_data(entities)
 
-        assert len(indexed_ids) == 2
-        assert mock_indexer_agent.index_entity.call_count == 2
+        assert indexed_ids == ["indexed_123", "indexed_456"]
+        mock_indexer_agent.index_entities.assert_awaited_once_with(entities)
+        mock_indexer_agent.index_entity.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_persist_data_single_entity(self, agent, mock_indexer_agent):
+        """Test persist_data indexes a lone entity directly."""
+        indexed_ids = await agent.persist_data([{"entity_type": "fact", "content": "fact 1"}])
+
+        assert indexed_ids == ["indexed_123"]
+        mock_indexer_agent.index_entities.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_persist_stream_indexes_in_batches(self, agent, mock_indexer_agent):
+        """Test persist_stream yields IDs batch by batch from an async iterable."""
+        mock_indexer_agent.index_entities = AsyncMock(
+            side_effect=lambda batch: [e["content"] for e in batch]
+        )
+
+        async def entities():
+            for i in range(5):
+                yield {"entity_type": "fact", "content": f"fact_{i}"}
+
+        ids = [entity_id async for entity_id in agent.persist_stream(entities(), batch_size=2)]
+
+        # The last, single-entity batch goes through index_entity
+        assert ids == ["fact_0", "fact_1", "fact_2", "fact_3", "indexed_123"]
+        assert mock_indexer_agent.index_entities.await_count == 2
+        mock_indexer_agent.index_entity.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_persist_data_without_indexer(self):
@@ -115,7 +115,7 @@ class TestIndexerAgentBasics:
 
     def test_agent_capabilities(self, indexer_agent):
         """Test agent has all expected capabilities."""
-        expected = [
+        expected = (
             "index_email",
             "index_meeting",
             "index_contact",
@@ -127,7 +127,8 @@ class TestIndexerAgentBasics:
             "delete_entity",
             "link_entities",
             "supersede_fact",
-        ]
+            "supersede_facts",
+        )
         assert indexer_agent.capabilities == expected
 
     def test_supports_capability(self, indexer_agent):
@@ -373,6 +374,41 @@ class TestIndexEmail:
 
         assert result.success is True
         assert result.data["gmail_id"] == "raw_email_123"
+        # internalDate is read as UTC, whatever the local timezone
+        structured = mock_data_layer.stored_entities["email_raw_email_123"].structured
+        assert structured["received_at"] == "2024-01-20T12:00:00"
+
+    def test_walk_payload_nested_multipart(self, indexer_agent):
+        """Test body and attachments are found in one walk of nested parts."""
+        import base64
+
+        encoded = base64.urlsafe_b64encode(b"Plain body").decode()
+        payload = {
+            "mimeType": "multipart/mixed",
+            "parts": [
+                {
+                    "mimeType": "multipart/alternative",
+                    "parts": [
+                        {"mimeType": "text/plain", "body": {"data": encoded}},
+                        {"mimeType": "text/html", "body": {"data": encoded}},
+                    ],
+                },
+                {"mimeType": "application/pdf", "filename": "report.pdf", "body": {}},
+            ],
+        }
+
+        assert indexer_agent._walk_payload(payload) == ("Plain body", True)
+        assert indexer_agent._walk_payload({"mimeType": "text/html"}) == (None, False)
+
+    def test_parse_address_headers(self, indexer_agent):
+        """Test From/To parsing handles quoted names containing commas."""
+        assert indexer_agent._parse_email_address('"Doe, Jane" <jane@example.com>') == (
+            "jane@example.com", "Doe, Jane"
+        )
+        assert indexer_agent._parse_email_address("jane@example.com") == ("jane@example.com", None)
+        assert indexer_agent._parse_email_list(
+            '"Doe, Jane" <jane@example.com>, bob@example.com'
+        ) == ["jane@example.com", "bob@example.com"]
 
 
 # =============================================================================
@@ -487,6 +523,26 @@ class TestIndexMemory:
         assert entity.entity_type == "memory"
         assert entity.structured["user_message"] == "The deadline is February 15th"
 
+    @pytest.mark.asyncio
+    async def test_index_memory_ids_distinguish_turns(self, indexer_agent):
+        """Test memory IDs are stable per turn and distinct across turns."""
+        params = {
+            "conversation_id": "conv_123",
+            "user_message": "The deadline is February 15th",
+            "sage_response": "I've noted the deadline.",
+            "timestamp": "2026-01-20T10:00:00",
+            "turn_number": 1,
+            "extract_facts": False,
+        }
+
+        first = await indexer_agent.execute("index_memory", params)
+        retry = await indexer_agent.execute("index_memory", params)
+        next_turn = await indexer_agent.execute("index_memory", {**params, "turn_number": 2})
+
+        assert first.data["entity_id"].startswith("memory_conv_123_")
+        assert retry.data["entity_id"] == first.data["entity_id"]
+        assert next_turn.data["entity_id"] != first.data["entity_id"]
+
     @pytest.mark.asyncio
     async def test_index_memory_missing_params(self, indexer_agent):
         """Test indexing memory with missing params."""
@@ -521,6 +577,34 @@ class TestExtractFacts:
         assert result.data.get("skipped") is True
         assert result.data.get("reason") == "too_short"
 
+    @pytest.mark.asyncio
+    async def test_extract_facts_no_signal(self, indexer_agent):
+        """Test that exchanges with no sign of facts skip Claude."""
+        with patch.object(indexer_agent, '_get_claude', new_callable=AsyncMock) as mock_get_claude:
+            result = await indexer_agent.execute(
+                "extract_facts",
+                {
+                    "user_message": "Thanks so much, that was really helpful!",
+                    "sage_response": "You're welcome, glad that helped."
+                }
+            )
+
+        mock_get_claude.assert_not_awaited()
+        assert result.success is True
+        assert result.data.get("reason") == "no_signal"
+        assert indexer_agent.get_fact_filter_stats() == {
+            "checked": 1, "skipped": 1, "skip_rate": 1.0
+        }
+
+    @pytest.mark.parametrize("user_message", [
+        "I'm allergic to peanuts, please keep that in mind for dinners.",
+        "we switched our insurance broker to the new firm",
+    ])
+    def test_first_person_statements_look_fact_bearing(self, indexer_agent, user_message):
+        """Test that personal facts without names, digits or dates still reach Claude."""
+        assert indexer_agent._looks_fact_bearing(user_message, "Got it.")
+        assert indexer_agent.get_fact_filter_stats()["skipped"] == 0
+
     @pytest.mark.asyncio
     async def test_extract_facts_with_claude(self, indexer_agent):
         """Test fact extraction with mocked Claude response."""
@@ -544,6 +628,89 @@ class TestExtractFacts:
         assert len(result.data["facts"]) == 1
         assert result.data["facts"][0]["content"] == "Deadline is Feb 15"
 
+        # Instructions go in a cached system prompt, only the exchange varies
+        call = mock_client.messages.create.await_args.kwargs
+        assert call["system"][0]["cache_control"] == {"type": "ephemeral"}
+        assert call["messages"][0]["content"].startswith("User message: The insurance")
+
+    def test_parse_claude_json_strips_code_fence(self, indexer_agent):
+        """Test JSON wrapped in a markdown code block is parsed."""
+        def response(text):
+            return MagicMock(content=[MagicMock(text=text)])
+
+        assert indexer_agent._parse_claude_json(response('```json\n[{"content": "x"}]\n```')) == [{"content": "x"}]
+        assert indexer_agent._parse_claude_json(response('```\n[]')) == []
+        assert indexer_agent._parse_claude_json(response('{"1": []}')) == {"1": []}
+
+    @pytest.mark.asyncio
+    async def test_extract_facts_reuses_cached_result(self, indexer_agent):
+        """Test the same exchange is only sent to Claude once."""
+        mock_response = MagicMock()
+        mock_response.content = [MagicMock(text='[{"type": "fact", "content": "Deadline is Feb 15"}]')]
+        params = {
+            "user_message": "The insurance renewal deadline is February 15, not January 31",
+            "sage_response": "Got it, I've updated the deadline to February 15th."
+        }
+
+        with patch.object(indexer_agent, '_get_claude', new_callable=AsyncMock) as mock_get_claude:
+            mock_client = AsyncMock()
+            mock_client.messages.create = AsyncMock(return_value=mock_response)
+            mock_get_claude.return_value = mock_client
+
+            first = await indexer_agent.execute("extract_facts", params)
+            second = await indexer_agent.execute("extract_facts", params)
+            batched = await indexer_agent._extract_facts_batch([params])
+
+        mock_client.messages.create.assert_awaited_once()
+        assert second.data["cached"] is True
+        assert second.data["facts"] == first.data["facts"]
+        assert batched == [first.data["facts"]]
+
+    @pytest.mark.asyncio
+    async def test_index_entities_batches_memory_fact_extraction(
+        self, indexer_agent, mock_data_layer
+    ):
+        """Test memories in index_entities share one fact extraction call."""
+        mock_response = MagicMock()
+        mock_response.content = [MagicMock(text=(
+            '{"1": [{"type": "fact", "content": "Deadline is Feb 15", "confidence": 0.9,'
+            ' "entities_mentioned": ["Feb 15"]}], "2": []}'
+        ))]
+        mock_data_layer.store_entities = AsyncMock(
+            side_effect=lambda entities: [e.id for e in entities]
+        )
+
+        with patch.object(indexer_agent, '_get_claude', new_callable=AsyncMock) as mock_get_claude:
+            mock_client = AsyncMock()
+            mock_client.messages.create = AsyncMock(return_value=mock_response)
+            mock_get_claude.return_value = mock_client
+
+            entity_ids = await indexer_agent.index_entities([
+                {
+                    "entity_type": "memory",
+                    "conversation_id": "conv_1",
+                    "user_message": "The insurance renewal deadline is February 15, not January 31",
+                    "sage_response": "Got it, I've updated the deadline to February 15th.",
+                    "timestamp": "2026-01-10T09:00:00",
+                },
+                {
+                    "entity_type": "memory",
+                    "conversation_id": "conv_1",
+                    "user_message": "Can you remind me what we discussed about the vendor?",
+                    "sage_response": "You said you would compare both quotes next week.",
+                    "timestamp": "2026-01-10T09:05:00",
+                },
+                {"entity_type": "memory", "conversation_id": "conv_1"},
+            ])
+
+        mock_client.messages.create.assert_awaited_once()
+        assert entity_ids[2] == ""
+        batch = mock_data_layer.store_entities.await_args.args[0]
+        assert [e.id for e in batch] == entity_ids[:2]
+        assert batch[0].analyzed["facts_extracted"][0]["content"] == "Deadline is Feb 15"
+        assert batch[0].analyzed["importance"] == "high"
+        assert batch[1].analyzed["facts_extracted"] == []
+
 
 # =============================================================================
 # Supersede Fact Tests
@@ -599,6 +766,35 @@ class TestSupersedeFact:
         # Check relationship was created
         assert any(r["rel_type"] == "supersedes" for r in mock_data_layer.relationships)
 
+    @pytest.mark.asyncio
+    async def test_supersede_facts_batch(self, indexer_agent, mock_data_layer):
+        """Test superseding several facts in one call."""
+        for fact_id in ("memory_old1", "memory_new1", "memory_old2", "memory_new2"):
+            mock_data_layer.stored_entities[fact_id] = IndexedEntity(
+                id=fact_id, entity_type="memory", source="conversation"
+            )
+
+        result = await indexer_agent.execute(
+            "supersede_facts",
+            {
+                "pairs": [
+                    {"old_fact_id": "memory_old1", "new_fact_id": "memory_new1"},
+                    {"old_fact_id": "memory_missing", "new_fact_id": "memory_new2"},
+                    {"old_fact_id": "memory_old2", "new_fact_id": "memory_new2",
+                     "reason": "Corrected"},
+                ]
+            }
+        )
+
+        assert result.success is True
+        assert [p["old_fact_id"] for p in result.data["superseded"]] == [
+            "memory_old1", "memory_old2"
+        ]
+        assert result.data["not_found"] == ["memory_missing"]
+        assert mock_data_layer.stored_entities["memory_old2"].metadata["superseded_by"] == "memory_new2"
+        assert mock_data_layer.stored_entities["memory_new2"].metadata["supersedes"] == "memory_old2"
+        assert sum(r["rel_type"] == "supersedes" for r in mock_data_layer.relationships) == 2
+
     @pytest.mark.asyncio
     async def test_supersede_nonexistent_fact(self, indexer_agent):
         """Test superseding a non-existent fact."""
@@ -685,6 +881,7 @@ class TestIndexEvent:
         entity = mock_data_layer.stored_entities[entity_id]
         assert entity.entity_type == "event"
         assert entity.structured["location"] == "Conference Room A"
+        assert entity.structured["attendee_contact_ids"] == ["contact_alice_at_example_com"]
 
     @pytest.mark.asyncio
     async def test_index_event_missing_required_fields(self, indexer_agent):
@@ -778,6 +975,124 @@ class TestIndexEntityMethod:
         entity = mock_data_layer.stored_entities["custom_123"]
         assert entity.entity_type == "custom_type"
 
+    @pytest.mark.asyncio
+    async def test_index_entity_generic_content_hash_id(self, indexer_agent, mock_data_layer):
+        """Test generic entities without an id get a stable content-hash ID and are stored once."""
+        mock_data_layer.store_entity = AsyncMock(side_effect=lambda entity: entity.id)
+        payload = {"entity_type": "fact", "source": "test", "structured": {"b": 2, "a": 1}}
+
+        first = await indexer_agent.index_entity(dict(payload))
+        second = await indexer_agent.index_entity(
+            {**payload, "structured": {"a": 1, "b": 2}}
+        )
+        other = await indexer_agent.index_entity({**payload, "structured": {"a": 2}})
+
+        assert first == second
+        assert first.startswith("fact_") and len(first) == len("fact_") + 32
+        assert other != first
+        assert mock_data_layer.store_entity.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_index_entity_generic_rewrites_changed_payload(
+        self, indexer_agent, mock_data_layer
+    ):
+        """Test a content-hashed entity with new analyzed data is stored again."""
+        mock_data_layer.store_entity = AsyncMock(side_effect=lambda entity: entity.id)
+        payload = {"entity_type": "fact", "source": "test", "structured": {"a": 1}}
+
+        first = await indexer_agent.index_entity({**payload, "analyzed": {"summary": "old"}})
+        second = await indexer_agent.index_entity({**payload, "analyzed": {"summary": "new"}})
+
+        assert first == second
+        assert mock_data_layer.store_entity.await_count == 2
+        assert mock_data_layer.store_entity.await_args.args[0].analyzed == {"summary": "new"}
+
+    @pytest.mark.asyncio
+    async def test_stored_content_cache_scoped_to_data_layer(
+        self, indexer_agent, mock_data_layer
+    ):
+        """Test rebinding the agent to a new data layer forgets what was stored."""
+        mock_data_layer.store_entity = AsyncMock(side_effect=lambda entity: entity.id)
+        payload = {"entity_type": "fact", "source": "test", "structured": {"a": 1}}
+        await indexer_agent.index_entity(dict(payload))
+
+        next_data_layer = MockDataLayer()
+        next_data_layer.store_entity = AsyncMock(side_effect=lambda entity: entity.id)
+        indexer_agent.data_layer = next_data_layer
+        await indexer_agent.index_entity(dict(payload))
+
+        next_data_layer.store_entity.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_index_entities_batches_generic_and_email(
+        self, indexer_agent, mock_data_layer
+    ):
+        """Test index_entities stores generic entities and emails in one batch."""
+        mock_data_layer.store_entities = AsyncMock(
+            side_effect=lambda entities: [e.id for e in entities]
+        )
+        mock_data_layer.create_relationships = AsyncMock(return_value=[True])
+
+        entity_ids = await indexer_agent.index_entities([
+            {"entity_type": "fact", "id": "fact_1"},
+            {
+                "entity_type": "email",
+                "gmail_id": "test_123",
+                "subject": "Test",
+                "sender_email": "john@example.com",
+            },
+            {"entity_type": "email", "subject": "No gmail_id"},
+            {"entity_type": "contact", "email": "jane@example.com"},
+            {"entity_type": "fact", "id": "fact_2"},
+        ])
+
+        assert entity_ids == [
+            "fact_1", "email_test_123", "", entity_ids[3], "fact_2"
+        ]
+        assert entity_ids[3].startswith("contact_")
+        mock_data_layer.store_entities.assert_awaited_once()
+        batch = mock_data_layer.store_entities.await_args.args[0]
+        assert [e.id for e in batch] == ["fact_1", "email_test_123", "fact_2"]
+
+        relationships = mock_data_layer.create_relationships.await_args.args[0]
+        assert [(r.from_id, r.to_id, r.rel_type) for r in relationships] == [
+            ("email_test_123", "contact_john_at_example_com", "received_from")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_index_entities_batches_meetings(
+        self, indexer_agent, mock_data_layer
+    ):
+        """Test index_entities stores meetings and participant links in one batch."""
+        mock_data_layer.store_entities = AsyncMock(
+            side_effect=lambda entities: [e.id for e in entities]
+        )
+        mock_data_layer.create_relationships = AsyncMock(return_value=[True, True])
+
+        entity_ids = await indexer_agent.index_entities([
+            {
+                "entity_type": "meeting",
+                "meeting_id": "ff_1",
+                "title": "Budget review",
+                "participants": ["john@example.com"],
+            },
+            {"entity_type": "meeting", "meeting_id": "ff_2"},
+            {
+                "entity_type": "meeting",
+                "meeting_id": "ff_3",
+                "title": "Standup",
+                "participants": ["jane@example.com"],
+            },
+        ])
+
+        assert entity_ids == ["meeting_ff_1", "", "meeting_ff_3"]
+        mock_data_layer.store_entities.assert_awaited_once()
+        relationships = mock_data_layer.create_relationships.await_args.args[0]
+        assert [(r.from_id, r.to_id) for r in relationships] == [
+            ("meeting_ff_1", "contact_john_at_example_com"),
+            ("meeting_ff_3", "contact_jane_at_example_com"),
+        ]
+
 
 # =============================================================================
 # Error Handling Tests
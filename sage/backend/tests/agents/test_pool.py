@@ -0,0 +1,74 @@
+"""
+Unit tests for the AgentPool.
+"""
+
+import asyncio
+
+import pytest
+
+from sage.agents.base import AgentResult, AgentType, BaseAgent
+from sage.agents.pool import AgentPool
+
+
+class PooledAgent(BaseAgent):
+    """Minimal agent that takes a data layer, like the foundational agents."""
+
+    name = "pooled"
+    description = "Agent for pool tests"
+    capabilities = ("noop",)
+    agent_type = AgentType.TASK
+
+    def __init__(self, data_layer=None, flavor: str = "plain"):
+        super().__init__()
+        self.data_layer = data_layer
+        self.flavor = flavor
+
+    async def execute(self, capability, params, context=None) -> AgentResult:
+        return AgentResult(success=True, data={})
+
+
+class TestAgentPool:
+    """Test acquiring, releasing and evicting pooled agents."""
+
+    @pytest.mark.asyncio
+    async def test_release_then_acquire_reuses_instance(self):
+        pool = AgentPool()
+        first_layer, second_layer = object(), object()
+
+        agent = await pool.acquire(PooledAgent, data_layer=first_layer)
+        assert agent.data_layer is first_layer
+        await pool.release(agent)
+        assert agent.data_layer is None
+
+        again = await pool.acquire(PooledAgent, data_layer=second_layer)
+        assert again is agent
+        assert again.data_layer is second_layer
+
+        stats = pool.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["leased"] == 1
+
+    @pytest.mark.asyncio
+    async def test_config_is_part_of_the_key(self):
+        pool = AgentPool()
+
+        async with pool.lease(PooledAgent, flavor="plain") as plain:
+            pass
+        async with pool.lease(PooledAgent, flavor="spicy") as spicy:
+            assert spicy is not plain
+            assert spicy.flavor == "spicy"
+
+    @pytest.mark.asyncio
+    async def test_idle_agents_are_evicted_on_release(self):
+        pool = AgentPool(max_idle_seconds=0.01)
+
+        stale = await pool.acquire(PooledAgent)
+        recent = await pool.acquire(PooledAgent)
+        await pool.release(stale)
+        await asyncio.sleep(0.02)
+        await pool.release(recent)
+
+        assert await pool.acquire(PooledAgent) is recent
+        assert await pool.acquire(PooledAgent) is not stale
+        assert pool.get_stats()["evicted"] == 1
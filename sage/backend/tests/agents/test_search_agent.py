@@ -7,7 +7,7 @@ using mock DataLayerInterface implementations.
 
 import pytest
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 from sage.agents.base import (
     DataLayerInterface,
@@ -15,6 +15,7 @@ from sage.agents.base import (
     SearchResult,
     Relationship,
     SearchContext,
+    ContextRequest,
     AgentType,
 )
 from sage.agents.foundational.search import SearchAgent
@@ -270,14 +271,14 @@ class TestSearchAgentProperties:
         assert search_agent.agent_type == AgentType.FOUNDATIONAL
 
     def test_capabilities(self, search_agent: SearchAgent):
-        expected = [
+        expected = (
             "search_for_task",
             "semantic_search",
             "entity_lookup",
             "relationship_traverse",
             "temporal_search",
             "get_relevant_memories",
-        ]
+        )
         assert search_agent.capabilities == expected
 
     def test_supports_capability(self, search_agent: SearchAgent):
@@ -338,6 +339,67 @@ class TestExecute:
 
         assert not result.success
         assert len(result.errors) > 0
+        assert result.errors[0].startswith("Invalid params for 'temporal_search'")
+
+    @pytest.mark.asyncio
+    async def test_execute_reports_unexpected_errors(
+        self, search_agent: SearchAgent, mock_data_layer: MockDataLayer
+    ):
+        mock_data_layer.get_entity = AsyncMock(side_effect=RuntimeError("connection lost"))
+
+        result = await search_agent.execute(
+            capability="entity_lookup",
+            params={"entity_id": "email_123"}
+        )
+
+        assert not result.success
+        assert result.errors == ["Search error: connection lost"]
+
+    @pytest.mark.asyncio
+    async def test_execute_rejects_unknown_params(self, search_agent: SearchAgent):
+        result = await search_agent.execute(
+            capability="entity_lookup",
+            params={"entity_id": "email_123", "bogus": True}
+        )
+
+        assert not result.success
+        assert result.errors[0].startswith("Invalid params for 'entity_lookup'")
+
+    @pytest.mark.asyncio
+    async def test_execute_reports_type_errors_inside_handler(
+        self, search_agent: SearchAgent, mock_data_layer: MockDataLayer
+    ):
+        mock_data_layer.get_entity = AsyncMock(side_effect=TypeError("bad operand"))
+
+        result = await search_agent.execute(
+            capability="entity_lookup",
+            params={"entity_id": "email_123"}
+        )
+
+        assert result.errors == ["Search error: bad operand"]
+
+    @pytest.mark.asyncio
+    async def test_execute_rejects_malformed_entity_id(self, search_agent: SearchAgent):
+        result = await search_agent.execute(
+            capability="relationship_traverse",
+            params={"entity_id": "nounderscore"}
+        )
+
+        assert not result.success
+        assert result.errors[0].startswith("Invalid params for 'relationship_traverse'")
+
+    @pytest.mark.asyncio
+    async def test_execute_reports_value_errors_inside_handler(
+        self, search_agent: SearchAgent, mock_data_layer: MockDataLayer
+    ):
+        mock_data_layer.get_entity = AsyncMock(side_effect=ValueError("bad row"))
+
+        result = await search_agent.execute(
+            capability="entity_lookup",
+            params={"entity_id": "email_123"}
+        )
+
+        assert result.errors == ["Search error: bad row"]
 
 
 # =============================================================================
@@ -392,6 +454,39 @@ class TestSearchForTask:
         assert isinstance(context.relevant_emails, list)
         assert isinstance(context.relevant_followups, list)
 
+    @pytest.mark.asyncio
+    async def test_chat_enrichment_survives_failing_query(
+        self, search_agent: SearchAgent, mock_data_layer: MockDataLayer
+    ):
+        structured_query = mock_data_layer.structured_query
+
+        async def failing_for_email(filters, entity_type, limit=100):
+            if entity_type == "email":
+                raise RuntimeError("email adapter down")
+            return await structured_query(filters, entity_type, limit)
+
+        mock_data_layer.structured_query = failing_for_email
+
+        context = await search_agent.search_for_task(
+            requesting_agent="chat",
+            task_description="What am I waiting on?",
+            max_results=10
+        )
+
+        # The followup query still ran after the email query failed
+        assert len(context.relevant_followups) > 0
+
+    @pytest.mark.asyncio
+    async def test_enrichment_skips_filled_lists(
+        self, search_agent: SearchAgent, mock_data_layer: MockDataLayer
+    ):
+        mock_data_layer.structured_query = AsyncMock(return_value=[])
+        context = SearchContext(relevant_emails=[{"id": "email_123"}])
+
+        await search_agent._enrich_for_agent(context, "email", max_results=1, seen={})
+
+        mock_data_layer.structured_query.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_uses_entity_hints(
         self, search_agent: SearchAgent, mock_data_layer: MockDataLayer
@@ -407,6 +502,77 @@ class TestSearchForTask:
         email_ids = [e["id"] for e in context.relevant_emails]
         assert "email_123" in email_ids
 
+    @pytest.mark.asyncio
+    async def test_entity_added_once_across_phases(
+        self, search_agent: SearchAgent, mock_data_layer: MockDataLayer
+    ):
+        mock_data_layer.set_vector_results([
+            {"entity_id": "email_123", "score": 0.9},
+        ])
+
+        context = await search_agent.search_for_task(
+            requesting_agent="email",
+            task_description="Find emails about budget",
+            entity_hints=["email_123"],
+            max_results=10
+        )
+
+        # Found by semantic search, the hint and unread enrichment
+        email_ids = [e["id"] for e in context.relevant_emails]
+        assert email_ids.count("email_123") == 1
+        # The first (semantic) copy is kept, with its score
+        assert context.relevant_emails[0]["relevance_score"] == 0.9
+
+    @pytest.mark.asyncio
+    async def test_keyword_hints_searched_in_one_batch(
+        self, search_agent: SearchAgent, mock_data_layer: MockDataLayer
+    ):
+        mock_data_layer.set_vector_results([
+            {"entity_id": "email_123", "score": 0.9},
+        ])
+        mock_data_layer.vector_search_batch = AsyncMock(
+            wraps=mock_data_layer.vector_search_batch
+        )
+
+        await search_agent.search_for_task(
+            requesting_agent="email",
+            task_description="Analyze email",
+            entity_hints=["Laura Hodgson", "john@example.com", "Project Alpha"],
+            max_results=10
+        )
+
+        # The task description goes through semantic_search; both keyword
+        # hints share one batch
+        mock_data_layer.vector_search_batch.assert_awaited_once()
+        assert mock_data_layer.vector_search_batch.await_args.kwargs["queries"] == [
+            "Laura Hodgson", "Project Alpha"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_entity_id_hints_loaded_in_one_call(
+        self, search_agent: SearchAgent, mock_data_layer: MockDataLayer
+    ):
+        mock_data_layer.get_entities = AsyncMock(wraps=mock_data_layer.get_entities)
+        mock_data_layer.vector_search_batch = AsyncMock(
+            wraps=mock_data_layer.vector_search_batch
+        )
+
+        context = await search_agent.search_for_task(
+            requesting_agent="email",
+            task_description="Analyze email",
+            entity_hints=["email_123", "contact_john", "email_missing"],
+            max_results=10
+        )
+
+        mock_data_layer.get_entities.assert_awaited_once_with(
+            ["email_123", "contact_john", "email_missing"]
+        )
+        assert "contact_john" in [c["id"] for c in context.relevant_contacts]
+        # The ID that is not stored falls back to a keyword search
+        assert mock_data_layer.vector_search_batch.await_args.kwargs["queries"] == [
+            "email_missing"
+        ]
+
     @pytest.mark.asyncio
     async def test_includes_temporal_summary(
         self, search_agent: SearchAgent, mock_data_layer: MockDataLayer
@@ -424,6 +590,34 @@ class TestSearchForTask:
         assert context.temporal_summary
         assert "Context includes" in context.temporal_summary
 
+    @pytest.mark.asyncio
+    async def test_get_contexts_batch_searches_once(
+        self, search_agent: SearchAgent, mock_data_layer: MockDataLayer
+    ):
+        mock_data_layer.set_vector_results([
+            {"entity_id": "email_123", "score": 0.9}
+        ])
+        mock_data_layer.vector_search_batch = AsyncMock(
+            wraps=mock_data_layer.vector_search_batch
+        )
+
+        contexts = await search_agent.get_contexts_batch([
+            ContextRequest("email", "Find emails about budget", max_results=10),
+            ContextRequest("briefing", "Generate morning briefing", max_results=5),
+            ContextRequest("followup", "Find emails about budget", max_results=10),
+        ])
+
+        mock_data_layer.vector_search_batch.assert_awaited_once()
+        assert mock_data_layer.vector_search_batch.await_args.kwargs["queries"] == [
+            "Find emails about budget",
+            "Generate morning briefing",
+        ]
+        assert [c.retrieval_metadata["requesting_agent"] for c in contexts] == [
+            "email", "briefing", "followup"
+        ]
+        assert "email_123" in [e["id"] for e in contexts[0].relevant_emails]
+        assert len(contexts[2].relevant_followups) > 0
+
 
 # =============================================================================
 # Test semantic_search
@@ -484,6 +678,49 @@ class TestSemanticSearch:
 
         assert all(r.entity.entity_type == "email" for r in results)
 
+    @pytest.mark.asyncio
+    async def test_repeated_query_uses_cache(
+        self, search_agent: SearchAgent, mock_data_layer: MockDataLayer
+    ):
+        mock_data_layer.set_vector_results([
+            {"entity_id": "email_123", "score": 0.9},
+        ])
+        mock_data_layer.vector_search = AsyncMock(wraps=mock_data_layer.vector_search)
+        mock_data_layer.vector_search_batch = AsyncMock(
+            wraps=mock_data_layer.vector_search_batch
+        )
+
+        first = await search_agent.semantic_search(query="budget", limit=10)
+        # Same embedding: the model is uncased and splits on whitespace
+        second = await search_agent.semantic_search(query="  Budget ", limit=10)
+        batches = await search_agent.semantic_search_batch(
+            queries=["budget", "review"], limit=10
+        )
+
+        assert second == first
+        assert batches[0] == first
+        # The mock's batch search delegates to vector_search for the miss
+        assert mock_data_layer.vector_search.await_count == 2
+        assert mock_data_layer.vector_search_batch.await_args.kwargs["queries"] == ["review"]
+
+    @pytest.mark.asyncio
+    async def test_entity_write_invalidates_cache(
+        self, search_agent: SearchAgent, mock_data_layer: MockDataLayer
+    ):
+        mock_data_layer.vector_search = AsyncMock(wraps=mock_data_layer.vector_search)
+
+        with patch.object(
+            MockDataLayer, "write_generation", new_callable=PropertyMock, return_value=1
+        ) as write_generation:
+            await search_agent.semantic_search(query="budget", limit=10)
+            await search_agent.semantic_search(query="budget", limit=10)
+            assert mock_data_layer.vector_search.await_count == 1
+
+            # A memory was persisted since the first search
+            write_generation.return_value = 2
+            await search_agent.semantic_search(query="budget", limit=10)
+            assert mock_data_layer.vector_search.await_count == 2
+
 
 # =============================================================================
 # Test entity_lookup
@@ -557,6 +794,30 @@ class TestRelationshipTraverse:
         for entity in related:
             assert entity["relationship"]["type"] == "sent_by"
 
+    @pytest.mark.asyncio
+    async def test_loads_related_entities_in_one_call(
+        self, search_agent: SearchAgent, mock_data_layer
+    ):
+        get_entities = AsyncMock(side_effect=mock_data_layer.get_entities)
+        mock_data_layer.get_entities = get_entities
+
+        related = await search_agent.relationship_traverse(entity_id="email_123")
+
+        assert related
+        get_entities.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_traverses_to_depth_without_revisiting(self, search_agent: SearchAgent):
+        related = await search_agent.relationship_traverse(
+            entity_id="contact_john",
+            depth=2
+        )
+
+        assert [(e["id"], e["relationship"]["depth"]) for e in related] == [
+            ("email_123", 1),
+            ("followup_1", 2),
+        ]
+
 
 # =============================================================================
 # Test temporal_search
@@ -575,6 +836,16 @@ class TestTemporalSearch:
 
         assert isinstance(results, list)
 
+    @pytest.mark.asyncio
+    async def test_accepts_utc_z_suffix(self, search_agent: SearchAgent):
+        results = await search_agent.temporal_search(
+            start_time="2026-01-01T00:00:00Z",
+            end_time="2026-01-31T23:59:59Z",
+            entity_types=["email"]
+        )
+
+        assert isinstance(results, list)
+
     @pytest.mark.asyncio
     async def test_accepts_datetime_objects(self, search_agent: SearchAgent):
         results = await search_agent.temporal_search(
@@ -685,6 +956,23 @@ class TestGetThreadContext:
 
         assert len(result["participants"]) > 0
 
+    @pytest.mark.asyncio
+    async def test_looks_up_participants_in_one_query(
+        self, search_agent: SearchAgent, mock_data_layer: MockDataLayer
+    ):
+        mock_data_layer.structured_query = AsyncMock(wraps=mock_data_layer.structured_query)
+
+        result = await search_agent.get_thread_context(
+            thread_id="thread_abc"
+        )
+
+        contact_queries = [
+            call for call in mock_data_layer.structured_query.await_args_list
+            if call.kwargs["entity_type"] == "contact"
+        ]
+        assert len(contact_queries) == 1
+        assert result["participants"][0]["name"] == "John Smith"
+
     @pytest.mark.asyncio
     async def test_includes_followups(self, search_agent: SearchAgent):
         result = await search_agent.get_thread_context(
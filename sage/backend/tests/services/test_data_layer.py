@@ -4,8 +4,10 @@ Unit tests for DataLayerService.
 Tests the data layer service, adapters, and vector search integration.
 """
 
+import threading
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock, AsyncMock, patch
+import numpy as np
 import pytest
 
 from sage.agents.base import IndexedEntity, SearchResult, Relationship
@@ -15,6 +17,7 @@ from sage.services.data_layer.adapters.contact import ContactAdapter
 from sage.services.data_layer.adapters.followup import FollowupAdapter
 from sage.services.data_layer.adapters.meeting import MeetingAdapter
 from sage.services.data_layer.adapters.generic import GenericAdapter, MemoryAdapter
+from sage.services.data_layer.vector import EMBEDDING_DIM, MultiEntityVectorService, QueryCache
 from sage.models.email import EmailCache, EmailCategory, EmailPriority
 from sage.models.contact import Contact, ContactCategory
 from sage.models.followup import Followup, FollowupStatus, FollowupPriority
@@ -264,7 +267,10 @@ class TestDataLayerService:
         """Create a mock database session."""
         session = AsyncMock()
         session.execute = AsyncMock()
-        session.add = MagicMock()
+        session.get = AsyncMock(return_value=None)
+        # Added objects stay pending (unflushed), as with autoflush=False
+        session.new = set()
+        session.add = MagicMock(side_effect=session.new.add)
         session.delete = AsyncMock()
         session.flush = AsyncMock()
         return session
@@ -274,6 +280,7 @@ class TestDataLayerService:
         """Create a mock vector service."""
         service = MagicMock()
         service.index_entity = MagicMock(return_value="qdrant_point_123")
+        service.index_entities = MagicMock(side_effect=lambda items: [f"point_{i}" for i in range(len(items))])
         service.search = MagicMock(return_value=[])
         service.delete_entity = MagicMock()
         service.get_collection_info = MagicMock(return_value={"points_count": 0})
@@ -323,14 +330,149 @@ class TestDataLayerService:
             metadata={},
         )
 
+        generation = service.write_generation
         result = await service.store_entity(entity)
 
         assert result == "memory_test123"
+        assert service.write_generation == generation + 1
         mock_vector_service.index_entity.assert_called_once()
         call_args = mock_vector_service.index_entity.call_args
         assert call_args.kwargs["entity_id"] == "memory_test123"
         assert call_args.kwargs["entity_type"] == "memory"
 
+    @pytest.mark.asyncio
+    async def test_store_entities_indexes_in_one_batch(self, service, mock_session, mock_vector_service):
+        """Test storing several entities embeds them with a single vector call."""
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = None
+        mock_session.execute.return_value = mock_result
+
+        entities = [
+            IndexedEntity(
+                id=f"memory_test{i}",
+                entity_type="memory",
+                source="test",
+                structured={"content": f"Test content {i}"},
+                analyzed={},
+                metadata={},
+            )
+            for i in range(3)
+        ]
+
+        result = await service.store_entities(entities)
+
+        assert result == ["memory_test0", "memory_test1", "memory_test2"]
+        mock_vector_service.index_entity.assert_not_called()
+        mock_vector_service.index_entities.assert_called_once()
+        items = mock_vector_service.index_entities.call_args.args[0]
+        assert [item["entity_id"] for item in items] == result
+        assert entities[2].metadata["qdrant_point_id"] == "point_2"
+
+    @pytest.mark.asyncio
+    async def test_update_entity_metadata_only_skips_reindex(self, service, mock_vector_service):
+        """Test a metadata-only update doesn't re-embed the entity."""
+        adapter = service._get_adapter("memory")
+        entity = IndexedEntity(
+            id="memory_test123",
+            entity_type="memory",
+            source="test",
+            structured={"content": "Test content"},
+            analyzed={},
+            metadata={},
+        )
+
+        with patch.object(adapter, "get_by_id", AsyncMock(return_value=MagicMock())), \
+                patch.object(adapter, "to_indexed_entity", return_value=entity), \
+                patch.object(adapter, "store", AsyncMock(return_value=entity.id)):
+            assert await service.update_entity(entity.id, {"metadata": {"is_current": False}})
+            mock_vector_service.index_entity.assert_not_called()
+
+            assert await service.update_entity(entity.id, {"structured": {"content": "New"}})
+            mock_vector_service.index_entity.assert_called_once()
+
+        assert entity.metadata["is_current"] is False
+
+    @pytest.mark.asyncio
+    async def test_update_entities_loads_each_type_once(self, service, mock_vector_service):
+        """Test a batch update prefetches entities and re-embeds changed ones together."""
+        adapter = service._get_adapter("memory")
+        models = {f"memory_{i}": MagicMock(id=f"memory_{i}") for i in range(2)}
+        get_by_ids = AsyncMock(return_value=models)
+
+        def to_indexed_entity(model):
+            return IndexedEntity(id=model.id, entity_type="memory", source="test")
+
+        with patch.object(adapter, "get_by_ids", get_by_ids), \
+                patch.object(adapter, "get_by_id", AsyncMock()) as get_by_id, \
+                patch.object(adapter, "to_indexed_entity", side_effect=to_indexed_entity), \
+                patch.object(adapter, "store", AsyncMock()):
+            result = await service.update_entities([
+                ("memory_0", {"metadata": {"is_current": False}}),
+                ("memory_missing", {"metadata": {"is_current": False}}),
+                ("memory_1", {"structured": {"content": "New"}}),
+            ])
+
+        assert result == [True, False, True]
+        get_by_ids.assert_awaited_once()
+        assert get_by_ids.await_args.args[1] == ["memory_0", "memory_missing", "memory_1"]
+        get_by_id.assert_not_awaited()
+        mock_vector_service.index_entity.assert_not_called()
+        items = mock_vector_service.index_entities.call_args.args[0]
+        assert [item["entity_id"] for item in items] == ["memory_1"]
+
+    @pytest.mark.asyncio
+    async def test_get_entities_loads_each_type_once(self, service, mock_session):
+        """Test bulk retrieval loads per type and attaches relationships from one query."""
+        adapter = service._get_adapter("memory")
+        models = {f"memory_{i}": MagicMock(id=f"memory_{i}") for i in range(2)}
+        get_by_ids = AsyncMock(return_value=models)
+
+        mock_rel = MagicMock()
+        mock_rel.from_entity_id = "memory_0"
+        mock_rel.to_entity_id = "memory_1"
+        mock_rel.relationship_type = "related_to"
+        mock_rel.metadata_ = {}
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [mock_rel]
+        mock_session.execute.return_value = mock_result
+
+        def to_indexed_entity(model):
+            return IndexedEntity(id=model.id, entity_type="memory", source="test")
+
+        with patch.object(adapter, "get_by_ids", get_by_ids), \
+                patch.object(adapter, "to_indexed_entity", side_effect=to_indexed_entity):
+            entities = await service.get_entities(["memory_0", "memory_missing", "memory_1"])
+
+        get_by_ids.assert_awaited_once()
+        mock_session.execute.assert_awaited_once()
+        assert list(entities) == ["memory_0", "memory_1"]
+        assert entities["memory_0"].relationships["outgoing"][0]["to"] == "memory_1"
+        assert entities["memory_1"].relationships["incoming"][0]["from"] == "memory_0"
+
+    @pytest.mark.asyncio
+    async def test_vector_search_batch_loads_shared_hits_once(self, service, mock_vector_service):
+        """Test batched search hydrates all distinct hits with one get_entities call."""
+        mock_vector_service.search_batch = MagicMock(return_value=[
+            [{"entity_id": "memory_a", "score": 0.9}],
+            [{"entity_id": "memory_a", "score": 0.7}, {"entity_id": "memory_b", "score": 0.5}],
+        ])
+        get_entities = AsyncMock(side_effect=lambda entity_ids: {
+            entity_id: IndexedEntity(id=entity_id, entity_type="memory", source="test")
+            for entity_id in entity_ids
+        })
+        service.get_entities = get_entities
+
+        results = await service.vector_search_batch(["first", "second"], limit=5)
+
+        mock_vector_service.search_batch.assert_called_once_with(
+            queries=["first", "second"], entity_types=None, limit=5
+        )
+        assert [[r.entity.id for r in batch] for batch in results] == [
+            ["memory_a"], ["memory_a", "memory_b"]
+        ]
+        assert results[1][0].score == 0.7
+        get_entities.assert_awaited_once_with(["memory_a", "memory_b"])
+
     @pytest.mark.asyncio
     async def test_delete_entity(self, service, mock_session, mock_vector_service):
         """Test deleting an entity."""
@@ -342,11 +484,42 @@ class TestDataLayerService:
         mock_result.scalars.return_value.all.return_value = []
         mock_session.execute.return_value = mock_result
 
+        generation = service.write_generation
         result = await service.delete_entity("memory_test123")
 
         assert result is True
+        assert service.write_generation == generation + 1
         mock_vector_service.delete_entity.assert_called_once_with("memory_test123")
 
+    @pytest.mark.asyncio
+    async def test_create_relationship_sees_pending_reverse_edge(self, service, mock_session):
+        """Test a symmetric edge added earlier in the session blocks its reverse."""
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = None
+        mock_session.execute.return_value = mock_result
+
+        assert await service.create_relationship("contact_a", "contact_b", "knows")
+        assert not await service.create_relationship("contact_b", "contact_a", "knows")
+        assert await service.create_relationship("contact_b", "contact_a", "sent_to")
+
+        assert mock_session.add.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_create_relationships_dedupes_symmetric_edges(self, service, mock_session):
+        """Test a batch creates each symmetric edge once, whichever direction."""
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = None
+        mock_session.execute.return_value = mock_result
+
+        results = await service.create_relationships([
+            Relationship(from_id="contact_a", to_id="contact_b", rel_type="knows"),
+            Relationship(from_id="contact_b", to_id="contact_a", rel_type="knows"),
+        ])
+
+        assert results == [True, False]
+        mock_session.add.assert_called_once()
+        mock_session.execute.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_create_relationship(self, service, mock_session):
         """Test creating a relationship."""
@@ -365,6 +538,66 @@ class TestDataLayerService:
         assert result is True
         mock_session.add.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_create_relationships_single_lookup(self, service, mock_session):
+        """Test batched relationship creation checks existing rows in one query."""
+        existing = MagicMock(
+            from_entity_id="email_a", to_entity_id="contact_1", relationship_type="received_from"
+        )
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [existing]
+        mock_session.execute.return_value = mock_result
+
+        results = await service.create_relationships([
+            Relationship("email_a", "contact_1", "received_from"),
+            Relationship("email_b", "contact_1", "received_from"),
+            Relationship("email_b", "contact_1", "received_from"),
+        ])
+
+        assert results == [False, True, False]
+        mock_session.execute.assert_awaited_once()
+        mock_session.add.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_create_relationships_sees_pending_rows(self, service, mock_session):
+        """Test a second batch in the same session finds the first batch's unflushed rows."""
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = []
+        mock_session.execute.return_value = mock_result
+
+        first = await service.create_relationships([
+            Relationship("email_a", "contact_1", "received_from"),
+        ])
+        second = await service.create_relationships([
+            Relationship("email_a", "contact_1", "received_from"),
+            Relationship("email_a", "contact_1", "received_from", {"role": "cc"}),
+        ])
+
+        assert first == [True]
+        assert second == [False, True]
+        mock_session.add.assert_called_once()
+        (row,) = mock_session.new
+        assert row.metadata_ == {"role": "cc"}
+
+    @pytest.mark.asyncio
+    async def test_create_symmetric_relationship_matches_reverse(self, service, mock_session):
+        """Test that a symmetric relationship is found in either direction."""
+        # Setup mock to simulate contact_2 --knows--> contact_1 exists
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = MagicMock()
+        mock_session.execute.return_value = mock_result
+
+        result = await service.create_relationship(
+            from_id="contact_1",
+            to_id="contact_2",
+            rel_type="knows",
+        )
+
+        assert result is False
+        mock_session.add.assert_not_called()
+        query = str(mock_session.execute.call_args.args[0])
+        assert "least(" in query and "greatest(" in query
+
     @pytest.mark.asyncio
     async def test_vector_search(self, service, mock_session, mock_vector_service):
         """Test vector search."""
@@ -567,3 +800,60 @@ class TestMeetingAdapter:
         assert "Summary: Reviewed Q1 product roadmap" in text
         assert "Key Points:" in text
         assert "Action Items:" in text
+
+
+class TestQueryCache:
+    """Test the near-duplicate query cache in the vector service."""
+
+    @staticmethod
+    def _embedding(seed: int, noise: float = 0.0) -> list[float]:
+        rng = np.random.default_rng(seed)
+        vector = rng.standard_normal(EMBEDDING_DIM)
+        if noise:
+            vector = vector + noise * np.random.default_rng(seed + 1).standard_normal(EMBEDDING_DIM)
+        return vector.tolist()
+
+    def test_reuses_hits_for_near_identical_query(self):
+        """Test a slightly perturbed embedding hits, an unrelated one misses."""
+        cache = QueryCache()
+        hits = [{"entity_id": "email_1", "score": 0.9}]
+        cache.put(self._embedding(1), ("email",), hits)
+
+        assert cache.get(self._embedding(1, noise=0.01), ("email",)) == hits
+        assert cache.get(self._embedding(1), ("contact",)) is None
+        assert cache.get(self._embedding(2), ("email",)) is None
+
+    def test_concurrent_clear_does_not_break_lookups(self):
+        """Test a clear from a writer thread never fails a get or put."""
+        cache = QueryCache()
+        embedding = self._embedding(4)
+        stop = threading.Event()
+
+        def clear_loop():
+            while not stop.is_set():
+                cache.clear()
+
+        writer = threading.Thread(target=clear_loop)
+        writer.start()
+        try:
+            for _ in range(2000):
+                cache.put(embedding, (), [])
+                cache.get(embedding, ())
+        finally:
+            stop.set()
+            writer.join()
+
+    def test_search_skips_qdrant_until_collection_changes(self):
+        """Test a repeated search is served from cache until an entity is indexed."""
+        service = MultiEntityVectorService()
+        service._client = MagicMock()
+        service._client.query_points.return_value = MagicMock(points=[])
+
+        with patch.object(service, "generate_embedding", return_value=self._embedding(3)):
+            service.search("inbox summary")
+            service.search("inbox summary")
+            assert service._client.query_points.call_count == 1
+
+            service.index_entity("email_1", "email", "New email")
+            service.search("inbox summary")
+            assert service._client.query_points.call_count == 2
@@ -0,0 +1,89 @@
+"""
+Unit tests for Alembic migration helpers.
+
+Runs the helpers against in-memory SQLite or offline PostgreSQL migration contexts.
+"""
+
+import pytest
+import sqlalchemy as sa
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+
+from sage.services.migration_helpers import create_index, paginated_update
+
+
+items = sa.table("items", sa.column("id"), sa.column("label"))
+
+
+@pytest.fixture
+def connection():
+    engine = sa.create_engine("sqlite://")
+    with engine.connect() as conn:
+        conn.execute(sa.text("CREATE TABLE items (id INTEGER PRIMARY KEY, label TEXT)"))
+        conn.execute(
+            sa.text("INSERT INTO items (label) VALUES (:label)"),
+            [{"label": "old" if i % 2 == 0 else "keep"} for i in range(10)],
+        )
+        conn.commit()
+        yield conn
+    engine.dispose()
+
+
+def _run(conn, *args, **kwargs):
+    ctx = MigrationContext.configure(conn)
+    with Operations.context(ctx):
+        with ctx.begin_transaction():
+            return paginated_update(*args, **kwargs)
+
+
+class TestPaginatedUpdate:
+    """Test keyset-paginated data migrations."""
+
+    def test_updates_matching_rows_in_pages(self, connection):
+        pages = []
+
+        def relabel(bind, ids):
+            pages.append(list(ids))
+            bind.execute(items.update().where(items.c.id.in_(ids)).values(label="new"))
+
+        visited = _run(connection, items, items.c.label == "old", relabel, page_size=2)
+
+        assert visited == 5
+        assert pages == [[1, 3], [5, 7], [9]]
+        labels = connection.execute(sa.select(items.c.label).order_by(items.c.id)).scalars().all()
+        assert labels == ["new", "keep"] * 5
+
+    def test_no_where_clause_visits_every_row(self, connection):
+        seen = []
+        visited = _run(connection, items, None, lambda bind, ids: seen.extend(ids), page_size=3)
+
+        assert visited == 10
+        assert seen == list(range(1, 11))
+
+    def test_offline_mode_raises(self):
+        ctx = MigrationContext.configure(dialect_name="postgresql", opts={"as_sql": True})
+        with Operations.context(ctx):
+            with pytest.raises(RuntimeError):
+                paginated_update(items, None, lambda bind, ids: None)
+
+
+class TestCreateIndex:
+    """Test size-aware index creation."""
+
+    def test_plain_index_outside_postgresql(self, connection):
+        ctx = MigrationContext.configure(connection)
+        with Operations.context(ctx):
+            with ctx.begin_transaction():
+                create_index("ix_items_label", "items", ["label"])
+
+        indexes = sa.inspect(connection).get_indexes("items")
+        assert [i["name"] for i in indexes] == ["ix_items_label"]
+
+    def test_offline_mode_emits_plain_create_index(self, capsys):
+        ctx = MigrationContext.configure(dialect_name="postgresql", opts={"as_sql": True})
+        with Operations.context(ctx):
+            create_index("ix_items_label", "items", ["label"])
+
+        sql = capsys.readouterr().out
+        assert "CREATE INDEX ix_items_label ON items (label)" in sql
+        assert "CONCURRENTLY" not in sql